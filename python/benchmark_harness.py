@@ -0,0 +1,188 @@
+# Shared benchmark harness
+#
+# The statistics, JSON reports, baseline comparison and command line used by
+# tic_tac_toe/benchmark.py and pass_checker/benchmark.py. Each suite supplies
+# its own benchmarks and the function that times them; this module turns the
+# samples into a report, compares reports, and prints both:
+#
+#     python benchmark.py --output baseline.json
+#     python benchmark.py --compare baseline.json
+
+import argparse
+import json
+import platform
+import time
+
+# A repeat is timed over enough operations to last at least this long
+MIN_REPEAT_SECONDS = 0.01
+DEFAULT_REPEATS = 15
+DEFAULT_WARMUP = 3
+DEFAULT_THRESHOLD = 0.10
+
+
+def percentile(values, pct):
+    """
+    Returns a percentile of the values using the nearest-rank method.
+
+    Args:
+        values (list): The measurements
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float: The smallest value with at least pct percent of values at or below it
+    """
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(samples, **extra):
+    """
+    Summarizes the timed repeats of one benchmark.
+
+    Args:
+        samples (list): Nanoseconds per operation of each repeat
+        extra: Further fields for the result, such as the operations per repeat
+
+    Returns:
+        dict: median_ns, p95_ns, min_ns and mean_ns, the number of repeats
+              and the extra fields
+    """
+    return {
+        'median_ns': percentile(samples, 50),
+        'p95_ns': percentile(samples, 95),
+        'min_ns': min(samples),
+        'mean_ns': sum(samples) / len(samples),
+        **extra,
+        'repeats': len(samples),
+    }
+
+
+def make_report(results, **meta):
+    """
+    Wraps benchmark results in a JSON-serializable report.
+
+    Args:
+        results (dict): Maps benchmark names to summarize() results
+        meta: Further fields for the report's "meta" section
+
+    Returns:
+        dict: A report with "meta" and "results" keys
+    """
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            **meta,
+        },
+        'results': results,
+    }
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compares two reports by median time per operation.
+
+    Args:
+        baseline (dict): A report saved earlier
+        current (dict): A report from this run
+        threshold (float): Relative slowdown that counts as a regression
+
+    Returns:
+        list: (name, baseline_ns, current_ns, ratio, status) for every
+              benchmark in both reports, where status is 'regression',
+              'improved' or 'ok'
+    """
+    rows = []
+    for name, stats in current['results'].items():
+        if name not in baseline['results']:
+            continue
+        before = baseline['results'][name]['median_ns']
+        after = stats['median_ns']
+        ratio = after / before if before else float('inf')
+        if ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 / (1 + threshold):
+            status = 'improved'
+        else:
+            status = 'ok'
+        rows.append((name, before, after, ratio, status))
+    return rows
+
+
+def format_ns(ns):
+    """
+    Formats a duration in nanoseconds with a readable unit.
+    """
+    if ns >= 1e6:
+        return f"{ns / 1e6:.2f} ms"
+    if ns >= 1e3:
+        return f"{ns / 1e3:.2f} us"
+    return f"{ns:.0f} ns"
+
+
+def print_report(report, title='benchmark'):
+    """
+    Prints the median and 95th percentile of every benchmark.
+    """
+    width = max((len(name) for name in report['results']), default=10)
+    width = max(width, len(title))
+    print(f"{title:<{width}} {'median':>12} {'p95':>12}")
+    for name, stats in report['results'].items():
+        print(f"{name:<{width}} {format_ns(stats['median_ns']):>12} {format_ns(stats['p95_ns']):>12}")
+
+
+def print_comparison(rows):
+    """
+    Prints the output of compare().
+    """
+    width = max((len(row[0]) for row in rows), default=10)
+    print(f"\n{'benchmark':<{width}} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, before, after, ratio, status in rows:
+        flag = '' if status == 'ok' else f"  {status.upper()}"
+        print(f"{name:<{width}} {format_ns(before):>12} {format_ns(after):>12} "
+              f"{(ratio - 1):>+8.1%}{flag}")
+
+
+def main(description, run_benchmarks, argv=None, title='benchmark'):
+    """
+    Runs a benchmark suite from the command line.
+
+    Args:
+        description (str): The suite's description for --help
+        run_benchmarks (callable): Called as run_benchmarks(name_filter,
+                                   repeats, warmup), returns a report
+        argv (list): Arguments; defaults to sys.argv
+        title (str): Heading of the benchmark name column
+
+    Returns:
+        int: 1 if a comparison found a regression, 0 otherwise
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--output', help="write the results to this JSON file")
+    parser.add_argument('--compare', metavar='BASELINE', help="compare against a saved JSON report")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="relative slowdown reported as a regression (default: 0.10)")
+    parser.add_argument('--filter', help="only run benchmarks whose name contains this")
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS, help="timed repeats")
+    parser.add_argument('--warmup', type=int, default=DEFAULT_WARMUP, help="untimed warmup repeats")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.filter, args.repeats, args.warmup)
+    print_report(report, title)
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        rows = compare(baseline, report, args.threshold)
+        print_comparison(rows)
+        if any(row[4] == 'regression' for row in rows):
+            return 1
+    return 0
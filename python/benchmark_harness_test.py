@@ -0,0 +1,66 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from benchmark_harness import compare, main, make_report, percentile, summarize
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    """
+    Test cases for the harness shared by the benchmark suites.
+    """
+
+    def _run_main(self, report, *argv):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            status = main("test suite", lambda name_filter, repeats, warmup: report,
+                          list(argv), title='benchmark (per call)')
+        return status, output.getvalue()
+
+    def test_percentile(self):
+        values = [5, 1, 4, 2, 3]
+        self.assertEqual(percentile(values, 50), 3)
+        self.assertEqual(percentile(values, 95), 5)
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile(list(range(1, 101)), 95), 95)
+
+    def test_compare(self):
+        baseline = {'results': {'a': {'median_ns': 100}, 'b': {'median_ns': 100},
+                                'c': {'median_ns': 100}, 'gone': {'median_ns': 1}}}
+        current = {'results': {'a': {'median_ns': 105}, 'b': {'median_ns': 150},
+                               'c': {'median_ns': 50}, 'new': {'median_ns': 1}}}
+        rows = {row[0]: row[4] for row in compare(baseline, current, threshold=0.1)}
+        self.assertEqual(rows, {'a': 'ok', 'b': 'regression', 'c': 'improved'})
+
+    def test_summarize(self):
+        stats = summarize([3, 1, 2], passes=10)
+        self.assertEqual(stats, {'median_ns': 2, 'p95_ns': 3, 'min_ns': 1, 'mean_ns': 2,
+                                 'passes': 10, 'repeats': 3})
+
+    def test_make_report(self):
+        report = make_report({'a': summarize([1])}, corpus_size=5)
+        self.assertEqual(report['meta']['corpus_size'], 5)
+        self.assertIn('python', report['meta'])
+        self.assertEqual(json.loads(json.dumps(report)), report)
+
+    def test_main_writes_and_compares(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            report = make_report({'a': summarize([100])})
+            status, output = self._run_main(report, '--output', path)
+            self.assertEqual(status, 0)
+            self.assertTrue(output.startswith('benchmark (per call)'))
+
+            slower = make_report({'a': summarize([150])})
+            status, output = self._run_main(slower, '--compare', path)
+            self.assertEqual(status, 1)
+            self.assertIn('REGRESSION', output)
+            status, _ = self._run_main(slower, '--compare', path, '--threshold', '1')
+            self.assertEqual(status, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,25 +4,42 @@ class Employee:
         self.name = name
         self.age = age
         self.salary = salary
-        
+
     def __str__(self):
         return f"Employee(name={self.name}, age={self.age}, salary={self.salary})"
-    
+
     def __repr__(self):
         return self.__str__()
 
-# Create a list to store employees
-employeeList = []
+# The list of employees, created on first access so importing does no work
+_employeeList = None
+
+def get_employees():
+    global _employeeList
+    # A list assigned to data.employeeList replaces the built-in one
+    assigned = globals().get('employeeList')
+    if assigned is not None:
+        return assigned
+    if _employeeList is None:
+        # Add employees to the list
+        _employeeList = [
+            Employee("John", 25, 1000),
+            Employee("Jane", 30, 2000),
+            Employee("Bob", 35, 3000),
+            Employee("Alice", 40, 4000),
+        ]
+    return _employeeList
 
-# Add employees to the list
-employeeList.append(Employee("John", 25, 1000))
-employeeList.append(Employee("Jane", 30, 2000))
-employeeList.append(Employee("Bob", 35, 3000))
-employeeList.append(Employee("Alice", 40, 4000))
+# employeeList is still available as a module attribute, created lazily
+def __getattr__(name):
+    if name == 'employeeList':
+        return get_employees()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Function to get all employee names
 def get_all_employees_names():
-    return [employee.name for employee in employeeList]
+    return [employee.name for employee in get_employees()]
 
 # Print the result
-print(get_all_employees_names())
\ No newline at end of file
+if __name__ == "__main__":
+    print(get_all_employees_names())
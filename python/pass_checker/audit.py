@@ -0,0 +1,331 @@
+# Bulk password auditing
+#
+# Streams passwords from a file, stdin or any iterable, one at a time, so
+# memory use does not grow with the input. Each password gets a verdict and
+# the list of rules it fails, written as CSV or JSONL, and the per-rule
+# failure counts are summed as it goes.
+#
+# With --workers, a large file is instead memory-mapped and split into
+# byte ranges that end on a newline. The ranges are audited in a process
+# pool and only the aggregate counts are reported.
+#
+#     python audit.py passwords.txt --format jsonl > verdicts.jsonl
+#     cat passwords.txt | python audit.py --summary-only
+#     python audit.py leaked.txt --workers 16
+
+import argparse
+import csv
+import io
+import json
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from password_checker import ALL_RULES, RULE_NAMES, check_password, failed_rules
+from policy import PasswordPolicy
+
+
+class AuditStats:
+    """
+    Aggregate counts for an audit.
+
+    Attributes:
+        total (int): Passwords checked.
+        valid (int): Passwords that passed every rule.
+        failures (dict): Maps each rule name to the number of passwords failing it.
+    """
+    def __init__(self):
+        self.total = 0
+        self.valid = 0
+        self.failures = {name: 0 for _, name in RULE_NAMES}
+
+    def add(self, passed):
+        """
+        Counts one check_password bitmask.
+        """
+        self.total += 1
+        if passed == ALL_RULES:
+            self.valid += 1
+            return
+        for rule, name in RULE_NAMES:
+            if not passed & rule:
+                self.failures[name] += 1
+
+    def merge(self, other):
+        """
+        Adds the counts of another AuditStats to this one.
+        """
+        self.total += other.total
+        self.valid += other.valid
+        for name, count in other.failures.items():
+            self.failures[name] += count
+
+    @property
+    def invalid(self):
+        """
+        Passwords that failed at least one rule.
+        """
+        return self.total - self.valid
+
+    def as_dict(self):
+        """
+        Returns the counts as a JSON-serializable dict.
+        """
+        return {'total': self.total, 'valid': self.valid, 'invalid': self.invalid,
+                'failures': dict(self.failures)}
+
+    def print_summary(self, file=None):
+        """
+        Prints the totals and the failure count of every rule (to stderr by
+        default, so they never mix with verdicts written to stdout).
+        """
+        if file is None:
+            file = sys.stderr
+        print(f"checked: {self.total}", file=file)
+        print(f"valid:   {self.valid}", file=file)
+        print(f"invalid: {self.invalid}", file=file)
+        for name, count in self.failures.items():
+            share = count / self.total if self.total else 0.0
+            print(f"  {name:<10} {count:>12} ({share:.1%})", file=file)
+
+
+def read_passwords(stream):
+    """
+    Yields one password per line of a text stream, without the line ending.
+    Lines end with "\n" or "\r\n"; a "\r" anywhere else, including at the
+    end of a last line with no newline, is part of the password. Both the
+    sequential and the parallel audit read lines with this function.
+    """
+    for line in stream:
+        if line.endswith('\n'):
+            line = line[:-1]
+            if line.endswith('\r'):
+                line = line[:-1]
+        yield line
+
+
+def validate_many(passwords, stats=None, policy=None):
+    """
+    Validates passwords lazily.
+
+    Args:
+        passwords: Any iterable of password strings
+        stats (AuditStats): If given, every result is also counted here
+        policy (PasswordPolicy): Rules to check; defaults to password_checker's
+
+    Yields:
+        tuple: (password, passed) where passed is the check_password bitmask
+    """
+    check = check_password if policy is None else policy.check
+    for password in passwords:
+        passed = check(password)
+        if stats is not None:
+            stats.add(passed)
+        yield password, passed
+
+
+def write_csv(results, output, include_password=False):
+    """
+    Writes one CSV row per result: line number, verdict and the failed
+    rules separated by ';' (and the password if include_password is set).
+    """
+    writer = csv.writer(output)
+    header = ['line', 'valid', 'failed']
+    if include_password:
+        header.append('password')
+    writer.writerow(header)
+    for line_number, (password, passed) in enumerate(results, start=1):
+        row = [line_number, 'true' if passed == ALL_RULES else 'false', ';'.join(failed_rules(passed))]
+        if include_password:
+            row.append(password)
+        writer.writerow(row)
+
+
+def write_jsonl(results, output, include_password=False):
+    """
+    Writes one JSON object per result with the line number, verdict and the
+    list of failed rules (and the password if include_password is set).
+    """
+    for line_number, (password, passed) in enumerate(results, start=1):
+        record = {'line': line_number, 'valid': passed == ALL_RULES, 'failed': failed_rules(passed)}
+        if include_password:
+            record['password'] = password
+        output.write(json.dumps(record, ensure_ascii=False))
+        output.write('\n')
+
+
+WRITERS = {
+    'csv': write_csv,
+    'jsonl': write_jsonl,
+}
+
+
+def audit(passwords, output=None, output_format='csv', include_password=False, policy=None):
+    """
+    Validates a stream of passwords, writing per-line verdicts if an output
+    is given.
+
+    Args:
+        passwords: Any iterable of password strings
+        output: A text stream for the verdicts, or None to only count
+        output_format (str): 'csv' or 'jsonl'
+        include_password (bool): Also write each password next to its verdict
+        policy (PasswordPolicy): Rules to check; defaults to password_checker's
+
+    Returns:
+        AuditStats: The aggregate counts
+    """
+    stats = AuditStats()
+    results = validate_many(passwords, stats, policy)
+    if output is None:
+        for _ in results:
+            pass
+    else:
+        WRITERS[output_format](results, output, include_password)
+    return stats
+
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def find_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Splits a file into byte ranges of about chunk_size bytes, each ending
+    just after a newline (or at the end of the file), so no line is split.
+
+    Returns:
+        list: (start, end) byte offsets covering the whole file
+
+    Raises:
+        ValueError: If chunk_size is less than 1
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, not {chunk_size}")
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    chunks = []
+    with open(path, 'rb') as source, mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        start = 0
+        while start < size:
+            newline = data.find(b'\n', min(start + chunk_size, size) - 1)
+            end = size if newline == -1 else newline + 1
+            chunks.append((start, end))
+            start = end
+    return chunks
+
+
+def audit_chunk(job):
+    """
+    Audits one byte range of a password file. Runs in a worker process.
+
+    Args:
+        job (tuple): (path, start, end, policy) where policy may be None
+
+    Returns:
+        AuditStats: The counts for the passwords in the range
+    """
+    path, start, end, policy = job
+    check = check_password if policy is None else policy.check
+    with open(path, 'rb') as source:
+        source.seek(start)
+        # Ranges end on a newline, so no UTF-8 sequence is cut in half
+        text = source.read(end - start).decode('utf-8', errors='replace')
+
+    stats = AuditStats()
+    add = stats.add
+    for line in read_passwords(io.StringIO(text, newline='\n')):
+        add(check(line))
+    return stats
+
+
+def parallel_audit(path, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, policy=None):
+    """
+    Audits a password file across a pool of worker processes.
+
+    Args:
+        path (str): Newline-delimited password file
+        workers (int): Number of worker processes; defaults to the CPU count
+        chunk_size (int): Approximate bytes per chunk
+        policy (PasswordPolicy): Rules to check; defaults to password_checker's
+
+    Returns:
+        AuditStats: The merged counts, the same as audit() would give
+    """
+    stats = AuditStats()
+    jobs = [(path, start, end, policy) for start, end in find_chunks(path, chunk_size)]
+    if not jobs:
+        return stats
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_stats in executor.map(audit_chunk, jobs):
+            stats.merge(chunk_stats)
+    return stats
+
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {number}")
+    return number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate passwords in bulk, one per line")
+    parser.add_argument('input', nargs='?', default='-', help="password file (default: stdin)")
+    parser.add_argument('--format', choices=sorted(WRITERS), help="verdict format (default: csv)")
+    parser.add_argument('--output', help="write verdicts to this file instead of stdout")
+    parser.add_argument('--include-password', action='store_true',
+                        help="write each password next to its verdict")
+    parser.add_argument('--summary-only', action='store_true',
+                        help="only print the aggregate statistics")
+    parser.add_argument('--workers', type=_positive_int,
+                        help="audit the file in parallel with this many processes (summary only)")
+    parser.add_argument('--chunk-size', type=_positive_int, default=DEFAULT_CHUNK_SIZE // (1024 * 1024),
+                        help="megabytes per chunk in parallel mode (default: 8)")
+    parser.add_argument('--policy', help="JSON or TOML password policy (default: built-in rules)")
+    args = parser.parse_args(argv)
+    policy = PasswordPolicy.load(args.policy) if args.policy else None
+
+    if args.workers:
+        if args.input == '-':
+            parser.error("--workers needs a file, not stdin")
+        if args.output or args.format or args.include_password:
+            parser.error("--workers only prints the summary; it cannot be combined with "
+                         "--output, --format or --include-password")
+        start = time.perf_counter()
+        stats = parallel_audit(args.input, args.workers, args.chunk_size * 1024 * 1024, policy)
+        elapsed = time.perf_counter() - start
+        stats.print_summary()
+        megabytes = os.path.getsize(args.input) / (1024 * 1024)
+        rate = stats.total / elapsed if elapsed else 0.0
+        print(f"{megabytes:.1f} MB in {elapsed:.2f}s "
+              f"({megabytes / elapsed if elapsed else 0.0:.1f} MB/s, {rate:,.0f} passwords/s)",
+              file=sys.stderr)
+        return 0
+
+    output_format = args.format or 'csv'
+    # Leaked dumps are rarely clean UTF-8; undecodable bytes become U+FFFD
+    if args.input == '-':
+        source = open(sys.stdin.fileno(), encoding='utf-8', errors='replace', newline='\n', closefd=False)
+    else:
+        source = open(args.input, encoding='utf-8', errors='replace', newline='\n')
+
+    with source:
+        if args.summary_only:
+            stats = audit(read_passwords(source), policy=policy)
+        elif args.output:
+            with open(args.output, 'w', encoding='utf-8', newline='') as output:
+                stats = audit(read_passwords(source), output, output_format, args.include_password,
+                              policy)
+        else:
+            stats = audit(read_passwords(source), sys.stdout, output_format, args.include_password,
+                          policy)
+
+    stats.print_summary()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
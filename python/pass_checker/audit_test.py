@@ -0,0 +1,175 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+import random
+from audit import (AuditStats, audit, audit_chunk, find_chunks, main, parallel_audit, read_passwords,
+                   validate_many)
+from password_checker import ALL_RULES, RULE_DIGIT, check_password
+from policy import PasswordPolicy
+
+PASSWORDS = ["P@ssw0rd", "short", "NoDigitsHere!", "ThisPasswordIsWayTooLong123!", "Abcd1234!"]
+
+class TestValidateMany(unittest.TestCase):
+
+    def test_results(self):
+        results = list(validate_many(PASSWORDS))
+        self.assertEqual([password for password, _ in results], PASSWORDS)
+        self.assertEqual([passed for _, passed in results], [check_password(p) for p in PASSWORDS])
+
+    def test_is_lazy(self):
+        def passwords():
+            yield "P@ssw0rd"
+            raise AssertionError("read too far")
+        results = validate_many(passwords())
+        self.assertEqual(next(results), ("P@ssw0rd", ALL_RULES))
+
+    def test_stats(self):
+        stats = AuditStats()
+        list(validate_many(PASSWORDS, stats))
+        self.assertEqual(stats.total, 5)
+        self.assertEqual(stats.valid, 2)
+        self.assertEqual(stats.invalid, 3)
+        self.assertEqual(stats.failures, {'min_length': 1, 'max_length': 1, 'digit': 2,
+                                          'upper': 1, 'lower': 0, 'special': 1})
+
+    def test_merge(self):
+        first, second = AuditStats(), AuditStats()
+        first.add(ALL_RULES)
+        second.add(ALL_RULES & ~RULE_DIGIT)
+        first.merge(second)
+        self.assertEqual(first.as_dict(), {'total': 2, 'valid': 1, 'invalid': 1, 'failures': {
+            'min_length': 0, 'max_length': 0, 'digit': 1, 'upper': 0, 'lower': 0, 'special': 0}})
+
+
+class TestAudit(unittest.TestCase):
+
+    def test_read_passwords(self):
+        stream = io.StringIO("P@ssw0rd\r\n with spaces \n\nlast")
+        self.assertEqual(list(read_passwords(stream)), ["P@ssw0rd", " with spaces ", "", "last"])
+
+    def test_csv(self):
+        output = io.StringIO()
+        audit(PASSWORDS[:3], output, 'csv')
+        self.assertEqual(output.getvalue().splitlines(), [
+            "line,valid,failed",
+            "1,true,",
+            "2,false,min_length;digit;upper;special",
+            "3,false,digit",
+        ])
+
+    def test_jsonl_with_passwords(self):
+        output = io.StringIO()
+        stats = audit(PASSWORDS[1:3], output, 'jsonl', include_password=True)
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(records[1], {'line': 2, 'valid': False, 'failed': ['digit'],
+                                      'password': "NoDigitsHere!"})
+        self.assertEqual(stats.total, 2)
+
+    def test_cli(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, 'passwords.txt')
+            target = os.path.join(tmp_dir, 'verdicts.jsonl')
+            with open(source, 'wb') as source_file:
+                source_file.write(b"P@ssw0rd\n\xffNoDigits!\n")
+            summary = io.StringIO()
+            with redirect_stderr(summary):
+                self.assertEqual(main([source, '--format', 'jsonl', '--output', target]), 0)
+            with open(target, encoding='utf-8') as target_file:
+                records = [json.loads(line) for line in target_file]
+        self.assertEqual([record['valid'] for record in records], [True, False])
+        self.assertIn("checked: 2", summary.getvalue())
+
+    def test_policy(self):
+        policy = PasswordPolicy(min_length=4, max_length=None, require_special=False)
+        stats = audit(PASSWORDS, policy=policy)
+        self.assertEqual(stats.valid, 3)
+        self.assertEqual(stats.failures['max_length'], 0)
+
+
+class TestParallelAudit(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'passwords.txt')
+        rng = random.Random(0)
+        chars = "abcXYZ019!@ é€"
+        lines = [''.join(rng.choice(chars) for _ in range(rng.randint(0, 20))) for _ in range(3000)]
+        with open(self.path, 'w', encoding='utf-8', newline='') as password_file:
+            password_file.write("\r\n".join(lines[:10]) + "\n" + "\n".join(lines[10:]))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def sequential_stats(self):
+        with open(self.path, encoding='utf-8', errors='replace', newline='\n') as source:
+            return audit(read_passwords(source))
+
+    def test_chunks_end_on_newlines(self):
+        chunks = find_chunks(self.path, chunk_size=1000)
+        self.assertGreater(len(chunks), 10)
+        with open(self.path, 'rb') as password_file:
+            data = password_file.read()
+        self.assertEqual(chunks[0][0], 0)
+        self.assertEqual(chunks[-1][1], len(data))
+        for (_, end), (start, _) in zip(chunks, chunks[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(data[end - 1:end], b"\n")
+
+    def test_chunks_match_sequential_audit(self):
+        merged = AuditStats()
+        for start, end in find_chunks(self.path, chunk_size=777):
+            merged.merge(audit_chunk((self.path, start, end, None)))
+        self.assertEqual(merged.as_dict(), self.sequential_stats().as_dict())
+
+    def test_parallel_audit(self):
+        stats = parallel_audit(self.path, workers=2, chunk_size=4096)
+        self.assertEqual(stats.total, 3000)
+        self.assertEqual(stats.as_dict(), self.sequential_stats().as_dict())
+
+    def test_parallel_audit_with_policy(self):
+        policy = PasswordPolicy(min_length=1, max_length=None, require_upper=False,
+                                require_special=False)
+        with open(self.path, encoding='utf-8', errors='replace', newline='\n') as source:
+            expected = audit(read_passwords(source), policy=policy)
+        stats = parallel_audit(self.path, workers=2, chunk_size=4096, policy=policy)
+        self.assertEqual(stats.as_dict(), expected.as_dict())
+
+    def test_line_endings_match_sequential_audit(self):
+        with open(self.path, 'w', encoding='utf-8', newline='') as password_file:
+            password_file.write("P@ssw0rd\r\nAbcd1234!\r\r\nx\ry\nAbcd1234!\r")
+        for chunk_size in (1, 5, 4096):
+            with self.subTest(chunk_size=chunk_size):
+                merged = AuditStats()
+                for start, end in find_chunks(self.path, chunk_size):
+                    merged.merge(audit_chunk((self.path, start, end, None)))
+                self.assertEqual(merged.as_dict(), self.sequential_stats().as_dict())
+        with open(self.path, encoding='utf-8', newline='\n') as source:
+            self.assertEqual(list(read_passwords(source)),
+                             ["P@ssw0rd", "Abcd1234!\r", "x\ry", "Abcd1234!\r"])
+
+    def test_chunk_size_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            find_chunks(self.path, chunk_size=0)
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main([self.path, '--workers', '2', '--chunk-size', '0'])
+
+    def test_workers_arguments(self):
+        for argv in (['--workers', '0'], ['--workers', '-3'], ['--workers', '2', '--format', 'jsonl'],
+                     ['--workers', '2', '--output', self.path + '.out'],
+                     ['--workers', '2', '--include-password']):
+            with self.subTest(argv=argv):
+                with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+                    main([self.path] + argv)
+        self.assertFalse(os.path.exists(self.path + '.out'))
+
+    def test_empty_file(self):
+        open(self.path, 'w').close()
+        self.assertEqual(find_chunks(self.path), [])
+        self.assertEqual(parallel_audit(self.path).total, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
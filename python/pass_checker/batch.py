@@ -0,0 +1,187 @@
+# Vectorized password scoring for large batches
+#
+# Packs a batch of passwords into a fixed-width (N, width) uint32 array of
+# code points, one row per password padded with zeros, maps every code
+# point to a uint8 of rule bits and ORs each row together. The result is
+# the bitmask check_password returns, for the whole batch at once. The
+# width is the longest password in the batch; the rare password longer than
+# MAX_PACKED_WIDTH is checked on its own, so one outlier cannot blow up the
+# array.
+#
+# On a million random passwords check_batch is about 3x faster than the
+# single-pass check_password, and about 4x faster than the original
+# any()-per-rule validator; main() prints the figure for this machine. It is
+# not an order of magnitude: turning the Python strings into an array and
+# taking their lengths costs about as much as all the array work together,
+# and that cost stays as long as the input is a list of str.
+#
+#     python batch.py [count]
+
+import functools
+import itertools
+import random
+import sys
+import time
+
+import numpy as np
+
+from password_checker import DEFAULT_POLICY, SPECIAL_CHARS, check_password
+from policy import ALL_RULES, CHAR_RULES, RULE_MAX_LENGTH, RULE_MIN_LENGTH, RULE_NAMES
+
+# Columns of the failure matrix, in the order rules are reported
+COLUMNS = tuple(name for _, name in RULE_NAMES)
+_RULE_BITS = np.array([rule for rule, _ in RULE_NAMES], dtype=np.uint8)
+
+MAX_PACKED_WIDTH = 64
+
+
+@functools.lru_cache(maxsize=64)
+def _latin1_table(policy):
+    # bytes.translate is the fastest 256-entry lookup available
+    return bytes(policy.classify(chr(code)) for code in range(256))
+
+
+def pack(passwords, width):
+    """
+    Packs passwords into a zero-padded array of code points.
+
+    Args:
+        passwords (list): Password strings, none longer than width
+        width (int): Number of columns
+
+    Returns:
+        numpy.ndarray: An (N, width) uint32 array
+    """
+    # NumPy's fixed-width unicode dtype is UTF-32, one code point per column
+    return np.array(passwords, dtype=f'<U{width}').view(np.uint32).reshape(len(passwords), width)
+
+
+def _char_bits(codes, lengths, policy):
+    # Rule bits of every packed character, ORed per row
+    table = _latin1_table(policy)
+    bits = np.frombuffer(codes.astype(np.uint8).tobytes().translate(table),
+                         dtype=np.uint8).reshape(codes.shape)
+    high = codes > 255
+    if high.any():
+        bits = bits.copy()
+        unique, inverse = np.unique(codes[high], return_inverse=True)
+        bits[high] = np.array([policy.classify(chr(code)) for code in unique.tolist()],
+                              dtype=np.uint8)[inverse]
+    if table[0]:
+        # Padding reads as NUL, which this policy counts as a character class
+        bits = np.where(np.arange(codes.shape[1]) < lengths[:, None], bits, 0)
+    return np.bitwise_or.reduce(bits, axis=1)
+
+
+def check_batch(passwords, policy=None):
+    """
+    The vectorized counterpart of check_password.
+
+    Args:
+        passwords: A sequence of password strings
+        policy (PasswordPolicy): Rules to check; defaults to password_checker's
+
+    Returns:
+        numpy.ndarray: A uint8 array with the check_password bitmask of each password
+    """
+    if policy is None:
+        policy = DEFAULT_POLICY
+    passwords = list(passwords)
+    lengths = np.fromiter(map(len, passwords), dtype=np.int64, count=len(passwords))
+
+    passed = np.full(len(passwords), CHAR_RULES & ~policy.char_rules, dtype=np.uint8)
+    passed[lengths >= policy.min_length] |= RULE_MIN_LENGTH
+    if policy.max_length is None:
+        passed |= RULE_MAX_LENGTH
+    else:
+        passed[lengths <= policy.max_length] |= RULE_MAX_LENGTH
+    if not policy.char_rules or not passwords:
+        return passed
+
+    width = max(1, min(int(lengths.max()), MAX_PACKED_WIDTH))
+    fits = lengths <= width
+    if fits.all():
+        passed |= _char_bits(pack(passwords, width), lengths, policy)
+        return passed
+
+    passed[fits] |= _char_bits(pack(list(itertools.compress(passwords, fits)), width),
+                               lengths[fits], policy)
+    for index in np.flatnonzero(~fits).tolist():
+        passed[index] = policy.check(passwords[index])
+    return passed
+
+
+def score_batch(passwords, policy=None):
+    """
+    Scores a batch of passwords.
+
+    Args:
+        passwords: A sequence of password strings
+        policy (PasswordPolicy): Rules to check; defaults to password_checker's
+
+    Returns:
+        tuple: (valid, failures) where valid is a boolean array that matches
+               validate_password, and failures is an (N, len(COLUMNS))
+               boolean matrix with True where a password fails a rule
+    """
+    passed = check_batch(passwords, policy)
+    return passed == ALL_RULES, (passed[:, None] & _RULE_BITS) == 0
+
+
+def failure_matrix_reasons(failures, policy=None):
+    """
+    Returns the message validate_password_and_raise_reason would raise for
+    each row of a failure matrix, or None for valid passwords. Unlike its
+    neighbours it takes the failures returned by score_batch, not passwords,
+    so a batch is only scored once.
+
+    Args:
+        failures (numpy.ndarray): The failure matrix from score_batch
+        policy (PasswordPolicy): The policy the batch was scored with
+
+    Returns:
+        numpy.ndarray: An object array of messages
+    """
+    if policy is None:
+        policy = DEFAULT_POLICY
+    messages = np.array([message for _, message in policy.rule_messages] + [None], dtype=object)
+    first = np.where(failures.any(axis=1), failures.argmax(axis=1), len(COLUMNS))
+    return messages[first]
+
+
+def random_passwords(count, seed=0):
+    """
+    Returns random passwords of 0 to 20 characters, mostly ASCII, so that
+    every rule fails for a good share of them.
+    """
+    rng = random.Random(seed)
+    alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789" + SPECIAL_CHARS + "éÑ€ß"
+    return [''.join(rng.choices(alphabet, k=rng.randint(0, 20))) for _ in range(count)]
+
+
+def main(count=1000000):
+    """
+    Compares check_password and check_batch on random passwords.
+    """
+    passwords = random_passwords(count)
+
+    start = time.perf_counter()
+    expected = [check_password(password) for password in passwords]
+    scalar_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    passed = check_batch(passwords)
+    batch_seconds = time.perf_counter() - start
+
+    if passed.tolist() != expected:
+        print("check_batch disagrees with check_password")
+        return 1
+    print(f"{count:,} passwords, {np.count_nonzero(passed == ALL_RULES):,} valid")
+    print(f"check_password: {scalar_seconds:.3f}s ({count / scalar_seconds:,.0f}/s)")
+    print(f"check_batch:    {batch_seconds:.3f}s ({count / batch_seconds:,.0f}/s)")
+    print(f"speedup:        {scalar_seconds / batch_seconds:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000))
@@ -0,0 +1,66 @@
+import unittest
+
+import numpy as np
+
+from batch import (COLUMNS, MAX_PACKED_WIDTH, check_batch, failure_matrix_reasons, pack,
+                   random_passwords, score_batch)
+from password_checker import (check_password, failed_rules, validate_password,
+                              validate_password_and_raise_reason)
+from policy import PasswordPolicy
+
+EDGE_CASES = ["", "P@ssw0rd", "A1b2C3d4!6789012", "A1b2C3d4!678901234", "Passw0rd€", "€" * 20,
+              "Ab1!" + "ä" * 100, "x" * (MAX_PACKED_WIDTH + 1), "Passw0rd!\0", "\0\0\0",
+              "Pass\ud800w0rd!", "ＰＡＳＳ１２３!abc", "²³¹Aa!!!!"]
+
+
+class TestCheckBatch(unittest.TestCase):
+
+    def test_matches_check_password(self):
+        passwords = random_passwords(5000) + EDGE_CASES
+        self.assertEqual(check_batch(passwords).tolist(), [check_password(p) for p in passwords])
+
+    def test_empty_batch(self):
+        self.assertEqual(check_batch([]).shape, (0,))
+        valid, failures = score_batch([])
+        self.assertEqual(failures.shape, (0, len(COLUMNS)))
+
+    def test_pack(self):
+        codes = pack(["ab", "", "€"], 3)
+        self.assertEqual(codes.dtype, np.uint32)
+        self.assertEqual(codes.tolist(), [[97, 98, 0], [0, 0, 0], [0x20ac, 0, 0]])
+
+    def test_custom_policies(self):
+        passwords = random_passwords(2000, seed=1) + EDGE_CASES
+        for policy in [PasswordPolicy(min_length=4, max_length=None, require_special=False),
+                       PasswordPolicy(special_chars="\0€"),
+                       PasswordPolicy(require_digit=False, require_upper=False,
+                                      require_lower=False, require_special=False)]:
+            with self.subTest(policy=policy):
+                self.assertEqual(check_batch(passwords, policy).tolist(),
+                                 [policy.check(p) for p in passwords])
+
+
+class TestScoreBatch(unittest.TestCase):
+
+    def test_verdicts_and_failures(self):
+        passwords = random_passwords(2000, seed=2) + EDGE_CASES
+        valid, failures = score_batch(passwords)
+        self.assertEqual(valid.tolist(), [validate_password(p) for p in passwords])
+        for password, row in zip(passwords, failures):
+            self.assertEqual([name for name, failed in zip(COLUMNS, row) if failed],
+                             failed_rules(check_password(password)))
+
+    def test_failure_matrix_reasons(self):
+        passwords = random_passwords(2000, seed=3) + EDGE_CASES
+        _, failures = score_batch(passwords)
+        for password, reason in zip(passwords, failure_matrix_reasons(failures)):
+            try:
+                validate_password_and_raise_reason(password)
+                expected = None
+            except ValueError as error:
+                expected = str(error)
+            self.assertEqual(reason, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
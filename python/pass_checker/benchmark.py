@@ -0,0 +1,299 @@
+# Benchmarks for the password validators
+#
+# Times the three validators (validate_password, the exception-based
+# validate_password_and_raise_reason and the regex-based
+# validate_password_and_raise_reason_regex) on corpora with different
+# performance profiles, and reports the median and 95th percentile time per
+# password. Two extra groups isolate specific costs:
+#
+#     return_code.*   the same failure reason as the raising validator, but
+#                     returned by check_password + failure_reason instead of
+#                     raised, to show what raising and catching costs
+#     evaluate.*      every violation as a ValidationResult from
+#                     evaluate_password, the non-raising result-object API
+#     regex_cache.*   the regex validator with precompiled patterns, with
+#                     pattern strings looked up in re's compile cache, and
+#                     with that cache purged before every password
+#     import.*        importing a module in a new interpreter, where none of
+#                     its dependencies are loaded yet, to catch work done at
+#                     import time (times are per import, from -X importtime)
+#
+# Results can be saved as JSON and compared against a saved baseline:
+#
+#     python benchmark.py --output baseline.json
+#     python benchmark.py --compare baseline.json
+
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+
+# benchmark_harness.py, shared with tic_tac_toe/benchmark.py, is in the
+# parent directory
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if os.path.dirname(_HERE) not in sys.path:
+    sys.path.append(os.path.dirname(_HERE))
+
+import benchmark_harness
+import password_checker
+from benchmark_harness import DEFAULT_REPEATS, DEFAULT_WARMUP, MIN_REPEAT_SECONDS
+from password_checker import (check_password, evaluate_password, failure_reason,
+                              validate_password, validate_password_and_raise_reason,
+                              validate_password_and_raise_reason_regex)
+
+
+CORPUS_SIZE = 1000
+
+_LOWER = "abcdefghijklmnopqrstuvwxyz"
+_UPPER = _LOWER.upper()
+_DIGITS = "0123456789"
+_SPECIAL = "!@#$%^&*"
+
+
+def _corpus(make, seed):
+    rng = random.Random(seed)
+    return [make(rng) for _ in range(CORPUS_SIZE)]
+
+
+def _valid(rng, alphabet=_LOWER):
+    chars = [rng.choice(_UPPER), rng.choice(_DIGITS), rng.choice(_SPECIAL)]
+    chars += rng.choices(alphabet, k=rng.randint(5, 13))
+    rng.shuffle(chars)
+    return ''.join(chars)
+
+
+def _fails_late(rng):
+    # Passes every rule but the last one checked: no special character
+    chars = [rng.choice(_UPPER), rng.choice(_DIGITS)] + rng.choices(_LOWER, k=rng.randint(6, 14))
+    rng.shuffle(chars)
+    return ''.join(chars)
+
+
+def get_corpora():
+    """
+    Returns the password corpora, each CORPUS_SIZE passwords long.
+
+    Returns:
+        dict: Maps corpus names to lists of passwords:
+              valid        every rule passes
+              fails_early  too short, the first rule checked
+              fails_late   no special character, the last rule checked
+              long         hundreds of characters, over the maximum length
+              unicode      valid passwords with accented, Greek and CJK letters
+    """
+    return {
+        'valid': _corpus(_valid, 1),
+        'fails_early': _corpus(lambda rng: ''.join(rng.choices(_LOWER + _DIGITS, k=rng.randint(0, 7))), 2),
+        'fails_late': _corpus(_fails_late, 3),
+        'long': _corpus(lambda rng: _valid(rng) * rng.randint(20, 60), 4),
+        'unicode': _corpus(lambda rng: _valid(rng, _LOWER + "éüñçαβγδ密码安全"), 5),
+    }
+
+
+def _catching(validator):
+    def validate(password):
+        try:
+            return validator(password)
+        except ValueError as error:
+            return str(error)
+    return validate
+
+
+def _return_code(password):
+    passed = check_password(password)
+    return failure_reason(passed)
+
+
+# The regex validator's rules, as the pattern strings it was written with
+_REGEX_RULES = (
+    (r"\d", "Password must contain at least one digit"),
+    (r"[A-Z]", "Password must contain at least one uppercase letter"),
+    (r"[a-z]", "Password must contain at least one lowercase letter"),
+    (r"[!@#$%^&*()-_=+\[{\]}\|;:'\",<.>/?`~]", "Password must contain at least one special character"),
+)
+
+
+def _regex_with_pattern_strings(password):
+    # The regex validator as originally written: pattern strings passed to
+    # re.search, which looks each one up in re's compile cache
+    if len(password) < password_checker.MIN_LENGTH:
+        raise ValueError("Password must be at least 8 characters long")
+    if len(password) > password_checker.MAX_LENGTH:
+        raise ValueError("Password must not exceed 16 characters")
+    for pattern, message in _REGEX_RULES:
+        if not re.search(pattern, password):
+            raise ValueError(message)
+    return True
+
+
+def _regex_cold(password):
+    re.purge()
+    return _regex_with_pattern_strings(password)
+
+
+VALIDATORS = {
+    'validate_password': validate_password,
+    'raise_reason': _catching(validate_password_and_raise_reason),
+    'raise_reason_regex': _catching(validate_password_and_raise_reason_regex),
+    'return_code': _return_code,
+    'evaluate': evaluate_password,
+}
+
+REGEX_CACHE_VARIANTS = {
+    'precompiled': _catching(validate_password_and_raise_reason_regex),
+    're_cache': _catching(_regex_with_pattern_strings),
+    'purged': _catching(_regex_cold),
+}
+
+# Modules timed by the import.* benchmarks, by source file
+IMPORT_MODULES = {
+    'data': os.path.join(_HERE, 'data.py'),
+    'top_level_data': os.path.join(os.path.dirname(_HERE), 'data.py'),
+    'employee_store': os.path.join(_HERE, 'employee_store.py'),
+    'employee_loader': os.path.join(_HERE, 'employee_loader.py'),
+}
+
+
+def time_import(path):
+    """
+    Imports a module in a new interpreter and returns how long the import
+    took, including the modules it imported that were not loaded yet.
+
+    Args:
+        path (str): The module's source file; its directory is the working
+                    directory of the new interpreter
+
+    Returns:
+        float: Nanoseconds, as reported by python -X importtime
+
+    Raises:
+        RuntimeError: If the module's import time was not reported
+    """
+    directory, filename = os.path.split(path)
+    module = os.path.splitext(filename)[0]
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                            cwd=directory, capture_output=True, text=True, check=True)
+    # Lines read "import time: self [us] | cumulative | imported package",
+    # with the package name indented by nesting depth
+    for line in result.stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2] == f" {module}":
+            return int(fields[1]) * 1000.0
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+def measure_import(path, repeats=DEFAULT_REPEATS, warmup=DEFAULT_WARMUP):
+    """
+    Times the import of a module, each repeat in a new interpreter.
+
+    Returns:
+        dict: median_ns, p95_ns, min_ns and mean_ns per import, plus the
+              number of repeats
+    """
+    for _ in range(warmup):
+        time_import(path)
+    samples = [time_import(path) for _ in range(repeats)]
+    return benchmark_harness.summarize(samples, passes=1)
+
+
+def measure(validator, corpus, repeats=DEFAULT_REPEATS, warmup=DEFAULT_WARMUP,
+            min_seconds=MIN_REPEAT_SECONDS):
+    """
+    Times a validator over a corpus.
+
+    Args:
+        validator (callable): Called with each password
+        corpus (list): The passwords
+        repeats (int): Number of timed repeats
+        warmup (int): Number of untimed repeats run first
+        min_seconds (float): Minimum duration of one repeat, used to pick
+                             the number of passes over the corpus per repeat
+
+    Returns:
+        dict: median_ns, p95_ns, min_ns and mean_ns per password, plus the
+              number of passes per repeat and the number of repeats
+    """
+    def run(passes):
+        start = time.perf_counter_ns()
+        for _ in range(passes):
+            for password in corpus:
+                validator(password)
+        return (time.perf_counter_ns() - start) / (passes * len(corpus))
+
+    passes = 1
+    while run(passes) * passes * len(corpus) < min_seconds * 1e9 and passes < 10 ** 6:
+        passes *= 10
+
+    for _ in range(warmup):
+        run(passes)
+    samples = [run(passes) for _ in range(repeats)]
+
+    return benchmark_harness.summarize(samples, passes=passes)
+
+
+def get_benchmarks():
+    """
+    Returns every validator benchmark, named "<validator>.<corpus>" or
+    "regex_cache.<variant>.<corpus>". The import.* benchmarks are listed in
+    IMPORT_MODULES.
+
+    Returns:
+        dict: Maps benchmark names to (validator, corpus) pairs for measure()
+    """
+    benchmarks = {}
+    corpora = get_corpora()
+    for name, validator in VALIDATORS.items():
+        for corpus_name, corpus in corpora.items():
+            benchmarks[f"{name}.{corpus_name}"] = (validator, corpus)
+    for variant, validator in REGEX_CACHE_VARIANTS.items():
+        for corpus_name in ('valid', 'fails_late'):
+            benchmarks[f"regex_cache.{variant}.{corpus_name}"] = (validator, corpora[corpus_name])
+    return benchmarks
+
+
+def run_benchmarks(name_filter=None, repeats=DEFAULT_REPEATS, warmup=DEFAULT_WARMUP,
+                   min_seconds=MIN_REPEAT_SECONDS, benchmarks=None, imports=None):
+    """
+    Runs the benchmarks and collects their statistics.
+
+    Args:
+        name_filter (str): Only run benchmarks whose name contains this
+        repeats (int): Timed repeats per benchmark
+        warmup (int): Untimed repeats per benchmark
+        min_seconds (float): Minimum duration of one repeat
+        benchmarks (dict): Benchmarks to run; defaults to get_benchmarks()
+        imports (dict): Modules to time as import.<module>; defaults to
+                        IMPORT_MODULES
+
+    Returns:
+        dict: A JSON-serializable report with "meta" and "results" keys
+    """
+    if benchmarks is None:
+        benchmarks = get_benchmarks()
+    if imports is None:
+        imports = IMPORT_MODULES
+    results = {}
+    for name, (validator, corpus) in benchmarks.items():
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = measure(validator, corpus, repeats, warmup, min_seconds)
+    for module, path in imports.items():
+        name = f"import.{module}"
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = measure_import(path, repeats, warmup)
+    return benchmark_harness.make_report(results, corpus_size=CORPUS_SIZE)
+
+
+def main(argv=None):
+    """
+    Runs the benchmark suite from the command line; see benchmark_harness.main.
+    """
+    return benchmark_harness.main("Benchmark the password validators", run_benchmarks, argv,
+                        title='benchmark (per call)')
+
+
+if __name__ == "__main__":
+    sys.exit(main())
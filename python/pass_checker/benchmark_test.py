@@ -0,0 +1,77 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from benchmark import (CORPUS_SIZE, IMPORT_MODULES, REGEX_CACHE_VARIANTS, VALIDATORS, get_corpora,
+                       measure, run_benchmarks, time_import)
+from password_checker import MAX_LENGTH, check_password, failed_rules, validate_password
+
+
+class TestBenchmark(unittest.TestCase):
+    # Timings are not checked, only that the benchmarks measure and report
+    # correctly
+
+    def test_corpora(self):
+        corpora = get_corpora()
+        self.assertTrue(all(len(corpus) == CORPUS_SIZE for corpus in corpora.values()))
+        self.assertTrue(all(validate_password(p) for p in corpora['valid']))
+        self.assertTrue(all(validate_password(p) for p in corpora['unicode']))
+        self.assertTrue(any(not p.isascii() for p in corpora['unicode']))
+        self.assertTrue(all(failed_rules(check_password(p))[0] == 'min_length'
+                            for p in corpora['fails_early']))
+        self.assertTrue(all(failed_rules(check_password(p)) == ['special']
+                            for p in corpora['fails_late']))
+        self.assertTrue(all(len(p) > MAX_LENGTH for p in corpora['long']))
+
+    def test_variants_agree(self):
+        corpora = get_corpora()
+        for corpus in corpora.values():
+            raising = [VALIDATORS['raise_reason'](p) for p in corpus]
+            self.assertEqual([reason or True for reason in map(VALIDATORS['return_code'], corpus)],
+                             raising)
+            verdicts = [[variant(p) is True for p in corpus[:50]]
+                        for variant in REGEX_CACHE_VARIANTS.values()]
+            self.assertEqual(verdicts[0], verdicts[1])
+            self.assertEqual(verdicts[1], verdicts[2])
+
+    def test_measure(self):
+        calls = []
+        stats = measure(calls.append, ["a", "b"], repeats=4, warmup=2, min_seconds=0)
+        self.assertEqual(stats['passes'], 1)
+        self.assertEqual(len(calls), 2 * (1 + 2 + 4))
+        self.assertLessEqual(stats['min_ns'], stats['median_ns'])
+        self.assertLessEqual(stats['median_ns'], stats['p95_ns'])
+
+    def test_run_benchmarks(self):
+        report = run_benchmarks('regex_cache.', repeats=1, warmup=0, min_seconds=0)
+        self.assertEqual(len(report['results']), 6)
+        self.assertEqual(json.loads(json.dumps(report)), report)
+
+    def test_import_benchmarks(self):
+        report = run_benchmarks('import.', repeats=1, warmup=0, min_seconds=0)
+        self.assertEqual(sorted(report['results']),
+                         sorted(f"import.{module}" for module in IMPORT_MODULES))
+
+    def test_time_import(self):
+        # Measured in a new interpreter, so the module's own dependencies count
+        self.assertGreater(time_import(IMPORT_MODULES['employee_store']), 0)
+
+    def test_imports_have_no_side_effects(self):
+        for module, path in IMPORT_MODULES.items():
+            directory, filename = os.path.split(path)
+            name = os.path.splitext(filename)[0]
+            code = f"import {name}"
+            if 'data' in module:
+                code += (f"; assert {name}._employeeList is None"
+                         f"; assert {name}.get_all_employees_names()"
+                         f"; assert {name}.employeeList is {name}.get_employees()")
+            with self.subTest(module=module):
+                result = subprocess.run([sys.executable, '-c', code], cwd=directory,
+                                        capture_output=True, text=True, check=True)
+                self.assertEqual(result.stdout, "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,281 @@
+# Breached-password index
+#
+# Checks passwords against a local list of known-compromised passwords,
+# stored as SHA-1 digests. The index is a single file that is memory-mapped,
+# so it never has to fit in RAM:
+#
+#     header    magic, digest count, Bloom filter size in bits, hash count
+#     bloom     Bloom filter over every digest
+#     digests   20-byte SHA-1 digests, sorted and without duplicates
+#
+# A lookup first tests the Bloom filter, which rejects almost every password
+# that is not in the list with a handful of byte reads. Only the rest are
+# confirmed with a binary search over the sorted digests.
+#
+# Dumps are either one password per line or one hex SHA-1 per line, as in
+# the "HASH:count" files published by Have I Been Pwned:
+#
+#     python breach.py build pwned-passwords-sha1.txt breached.idx
+#     python breach.py build leaked.txt breached.idx --plaintext
+#     python breach.py check breached.idx 'P@ssw0rd'
+
+import argparse
+import binascii
+import hashlib
+import heapq
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+MAGIC = b'PWBREACH'
+# magic, digest count, Bloom filter bits, Bloom filter hashes
+HEADER = struct.Struct('<8sQQI4x')
+DIGEST_SIZE = 20
+
+BLOOM_BITS_PER_DIGEST = 10
+BLOOM_HASHES = 7  # About a 1% false positive rate at 10 bits per digest
+DEFAULT_CHUNK_SIZE = 10_000_000  # Digests sorted in memory at once when building
+
+_MASK64 = (1 << 64) - 1
+
+
+def password_digest(password):
+    """
+    Returns the SHA-1 digest of a password's UTF-8 encoding.
+    """
+    return hashlib.sha1(password.encode('utf-8', 'surrogatepass')).digest()
+
+
+class BreachedIndex:
+    """
+    A memory-mapped breached-password index built by build_index.
+
+    Supports `password in index`, so it can be passed anywhere a set of
+    breached passwords is accepted.
+
+    Attributes:
+        path (str): The index file.
+        count (int): Number of distinct digests in the index.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as index_file:
+            size = os.fstat(index_file.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError(f"{path} is not a breached-password index")
+            self._data = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self._bloom_bits, self._hashes = HEADER.unpack_from(self._data)
+        self._digests_offset = HEADER.size + self._bloom_bits // 8
+        if magic != MAGIC or size != self._digests_offset + self.count * DIGEST_SIZE:
+            self._data.close()
+            raise ValueError(f"{path} is not a breached-password index")
+
+    def close(self):
+        self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, password):
+        return self.contains_digest(password_digest(password))
+
+    def might_contain(self, digest):
+        """
+        Tests the Bloom filter only: False means the digest is certainly not
+        in the index, True means it probably is.
+        """
+        # Double hashing; a SHA-1 digest is already uniformly distributed, so
+        # its first 16 bytes serve as the two base hashes
+        data = self._data
+        bloom_bits = self._bloom_bits
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:16], 'big') | 1
+        for i in range(self._hashes):
+            bit = ((h1 + i * h2) & _MASK64) % bloom_bits
+            if not data[HEADER.size + (bit >> 3)] >> (bit & 7) & 1:
+                return False
+        return True
+
+    def contains_digest(self, digest):
+        """
+        Returns True if a 20-byte SHA-1 digest is in the index.
+        """
+        if not self.count or not self.might_contain(digest):
+            return False
+        data = self._data
+        offset = self._digests_offset
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            start = offset + middle * DIGEST_SIZE
+            current = data[start:start + DIGEST_SIZE]
+            if current < digest:
+                low = middle + 1
+            elif current > digest:
+                high = middle
+            else:
+                return True
+        return False
+
+
+def read_digests(dump_file, plaintext=False):
+    """
+    Yields the SHA-1 digest of every non-empty line of a binary dump file.
+
+    Args:
+        dump_file: A file opened in binary mode
+        plaintext (bool): Lines are passwords rather than hex SHA-1 digests
+    """
+    for line in dump_file:
+        line = line.rstrip(b'\r\n') if plaintext else line.strip()
+        if not line:
+            continue
+        if plaintext:
+            yield hashlib.sha1(line).digest()
+        else:
+            yield binascii.unhexlify(line[:2 * DIGEST_SIZE])
+
+
+def _read_chunks(digests, chunk_size):
+    # Sorted, de-duplicated numpy arrays of at most chunk_size digests
+    import numpy as np
+
+    chunk = []
+    for digest in digests:
+        chunk.append(digest)
+        if len(chunk) == chunk_size:
+            yield np.unique(np.array(chunk, dtype=f'S{DIGEST_SIZE}'))
+            chunk = []
+    if chunk:
+        yield np.unique(np.array(chunk, dtype=f'S{DIGEST_SIZE}'))
+
+
+def _add_to_bloom(bloom, digests, hashes):
+    import numpy as np
+
+    bloom_bits = np.uint64(len(bloom) * 8)
+    raw = digests.view(np.uint8).reshape(-1, DIGEST_SIZE)
+    h1 = raw[:, :8].copy().view('>u8').ravel().astype(np.uint64)
+    h2 = raw[:, 8:16].copy().view('>u8').ravel().astype(np.uint64) | np.uint64(1)
+    for i in range(hashes):
+        # uint64 arithmetic wraps like the & _MASK64 in might_contain
+        bits = (h1 + np.uint64(i) * h2) % bloom_bits
+        np.bitwise_or.at(bloom, bits >> np.uint64(3),
+                         np.left_shift(1, bits & np.uint64(7)).astype(np.uint8))
+
+
+def _merge_runs(run_paths):
+    # Merges sorted run files into one sorted, de-duplicated stream
+    def records(path):
+        with open(path, 'rb') as run:
+            while True:
+                digest = run.read(DIGEST_SIZE)
+                if not digest:
+                    return
+                yield digest
+
+    previous = None
+    for digest in heapq.merge(*(records(path) for path in run_paths)):
+        if digest != previous:
+            yield digest
+            previous = digest
+
+
+def build_index(dump_path, index_path, plaintext=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Builds a breached-password index from a dump file. Needs NumPy.
+
+    The dump is sorted in chunks of chunk_size digests that are merged on
+    disk, so memory use is bounded by the chunk size and the Bloom filter.
+
+    Args:
+        dump_path (str): One password or hex SHA-1 digest per line
+        index_path (str): The index file to write
+        plaintext (bool): The dump holds passwords rather than digests
+        chunk_size (int): Digests sorted in memory at once
+
+    Returns:
+        int: The number of distinct digests in the index
+    """
+    import numpy as np
+
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(index_path))) as tmp_dir:
+        run_paths = []
+        total = 0
+        with open(dump_path, 'rb') as dump_file:
+            for chunk in _read_chunks(read_digests(dump_file, plaintext), chunk_size):
+                run_path = os.path.join(tmp_dir, f'run{len(run_paths)}')
+                chunk.tofile(run_path)
+                run_paths.append(run_path)
+                total += len(chunk)
+
+        # Sized for the digests before removing duplicates across chunks,
+        # rounded up to whole 64-bit words
+        bloom_bits = max(64, -(-total * BLOOM_BITS_PER_DIGEST // 64) * 64)
+        bloom = np.zeros(bloom_bits // 8, dtype=np.uint8)
+
+        count = 0
+        with open(index_path, 'wb') as index_file:
+            index_file.seek(HEADER.size + len(bloom))
+            if len(run_paths) == 1:
+                digests = np.fromfile(run_paths[0], dtype=f'S{DIGEST_SIZE}')
+                _add_to_bloom(bloom, digests, BLOOM_HASHES)
+                index_file.write(digests.tobytes())
+                count = len(digests)
+            else:
+                batch = []
+                for digest in _merge_runs(run_paths):
+                    batch.append(digest)
+                    if len(batch) == chunk_size:
+                        _add_to_bloom(bloom, np.array(batch, dtype=f'S{DIGEST_SIZE}'), BLOOM_HASHES)
+                        index_file.write(b''.join(batch))
+                        count += len(batch)
+                        batch = []
+                if batch:
+                    _add_to_bloom(bloom, np.array(batch, dtype=f'S{DIGEST_SIZE}'), BLOOM_HASHES)
+                    index_file.write(b''.join(batch))
+                    count += len(batch)
+            index_file.seek(0)
+            index_file.write(HEADER.pack(MAGIC, count, bloom_bits, BLOOM_HASHES))
+            index_file.write(bloom.tobytes())
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or query a breached-password index")
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help="build an index from a dump file")
+    build.add_argument('dump', help="one hex SHA-1 (optionally HASH:count) or password per line")
+    build.add_argument('index', help="index file to write")
+    build.add_argument('--plaintext', action='store_true', help="the dump holds passwords")
+    build.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                       help="digests sorted in memory at once")
+    check = commands.add_parser('check', help="check passwords against an index")
+    check.add_argument('index', help="index file")
+    check.add_argument('passwords', nargs='+')
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        count = build_index(args.dump, args.index, args.plaintext, args.chunk_size)
+        print(f"{count:,} breached passwords indexed in {args.index}")
+        return 0
+
+    breached = False
+    with BreachedIndex(args.index) as index:
+        for password in args.passwords:
+            found = password in index
+            breached = breached or found
+            print(f"{password}: {'breached' if found else 'not found'}")
+    return 1 if breached else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
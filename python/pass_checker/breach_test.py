@@ -0,0 +1,104 @@
+import hashlib
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from breach import BreachedIndex, build_index, main, password_digest
+from password_checker import (BREACHED_MESSAGE, validate_password,
+                              validate_password_and_raise_reason)
+
+BREACHED = ["P@ssw0rd", "Summer2024!", "123456", "qwerty", "Tr0ub4dor&3", "pässwörd1A!"]
+
+
+class TestBreachedIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.index_path = os.path.join(self.tmp_dir.name, 'breached.idx')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_dump(self, lines):
+        path = os.path.join(self.tmp_dir.name, 'dump.txt')
+        with open(path, 'wb') as dump_file:
+            dump_file.write(b'\n'.join(lines) + b'\n')
+        return path
+
+    def test_plaintext_dump(self):
+        dump = self.write_dump([password.encode('utf-8') for password in BREACHED * 2])
+        self.assertEqual(build_index(dump, self.index_path, plaintext=True), len(BREACHED))
+        with BreachedIndex(self.index_path) as index:
+            self.assertEqual(len(index), len(BREACHED))
+            for password in BREACHED:
+                self.assertIn(password, index)
+            self.assertNotIn("C0rrect-Horse", index)
+            self.assertNotIn("", index)
+
+    def test_hash_dump_with_counts(self):
+        lines = [hashlib.sha1(password.encode('utf-8')).hexdigest().upper().encode() + b':42\r'
+                 for password in BREACHED]
+        build_index(self.write_dump(lines), self.index_path)
+        with BreachedIndex(self.index_path) as index:
+            for password in BREACHED:
+                self.assertIn(password, index)
+
+    def test_merges_sorted_runs(self):
+        passwords = [f"password{number}" for number in range(2000)]
+        dump = self.write_dump([password.encode() for password in passwords + passwords[:500]])
+        self.assertEqual(build_index(dump, self.index_path, plaintext=True, chunk_size=300), 2000)
+        with BreachedIndex(self.index_path) as index:
+            for password in passwords:
+                self.assertTrue(index.contains_digest(password_digest(password)))
+            self.assertNotIn("password2000", index)
+
+    def test_bloom_filter_rejects_most_unknown_passwords(self):
+        passwords = [f"leaked{number}" for number in range(5000)]
+        build_index(self.write_dump([password.encode() for password in passwords]),
+                    self.index_path, plaintext=True)
+        with BreachedIndex(self.index_path) as index:
+            self.assertTrue(all(index.might_contain(password_digest(p)) for p in passwords))
+            false_positives = sum(index.might_contain(password_digest(f"unknown{number}"))
+                                  for number in range(5000))
+        self.assertLess(false_positives, 150)
+
+    def test_empty_dump(self):
+        open(os.path.join(self.tmp_dir.name, 'empty.txt'), 'w').close()
+        build_index(os.path.join(self.tmp_dir.name, 'empty.txt'), self.index_path)
+        with BreachedIndex(self.index_path) as index:
+            self.assertEqual(len(index), 0)
+            self.assertNotIn("P@ssw0rd", index)
+
+    def test_rejects_other_files(self):
+        path = self.write_dump([b"not an index"])
+        with self.assertRaises(ValueError):
+            BreachedIndex(path)
+
+    def test_cli(self):
+        dump = self.write_dump([password.encode('utf-8') for password in BREACHED])
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(main(['build', dump, self.index_path, '--plaintext']), 0)
+            self.assertEqual(main(['check', self.index_path, 'C0rrect-Horse']), 0)
+            self.assertEqual(main(['check', self.index_path, 'P@ssw0rd']), 1)
+        self.assertIn("P@ssw0rd: breached", output.getvalue())
+
+
+class TestBreachedRule(unittest.TestCase):
+
+    def test_validators(self):
+        breached = {"P@ssw0rd"}
+        self.assertTrue(validate_password("P@ssw0rd"))
+        self.assertFalse(validate_password("P@ssw0rd", breached))
+        self.assertTrue(validate_password("C0mplex!Pass", breached))
+        with self.assertRaisesRegex(ValueError, BREACHED_MESSAGE):
+            validate_password_and_raise_reason("P@ssw0rd", breached)
+        # Composition rules are reported first
+        with self.assertRaisesRegex(ValueError, "digit"):
+            validate_password_and_raise_reason("Password!", {"Password!"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,9 @@
+import os
+
+# A CSV or JSONL file to load the roster from instead of the built-in one
+EMPLOYEE_FILE_VARIABLE = 'EMPLOYEE_FILE'
+
+
 # class Employee with name, age and salary
 class Employee:
     def __init__(self, name, age, salary):
@@ -10,35 +16,69 @@ class Employee:
     def __repr__(self):
         return self.__str__()
 
-employeeList = []
+# Built on first access by get_employees(), so importing this module does no work
+_employeeList = None
+
+def _default_employees():
+    return [
+        Employee("John", 25, 50000),
+        Employee("Jane", 30, 60000),
+        Employee("Bob", 35, 70000),
+        Employee("Alice", 40, 80000),
+        Employee("Mike", 45, 90000),
+        Employee("Sarah", 50, 100000),
+        Employee("Tom", 55, 110000),
+        Employee("Emily", 60, 120000),
+    ]
+
+def get_employees():
+    """
+    Returns the roster, building it on the first call: from the file named
+    by the EMPLOYEE_FILE environment variable if it is set, otherwise from
+    the built-in employees.
+
+    A list assigned to data.employeeList is returned instead, so replacing
+    the roster that way still changes what the functions below see.
+    """
+    global _employeeList
+    assigned = globals().get('employeeList')
+    if assigned is not None:
+        return assigned
+    if _employeeList is None:
+        path = os.environ.get(EMPLOYEE_FILE_VARIABLE)
+        if path:
+            from employee_loader import iter_employees
+            _employeeList = list(iter_employees(path))
+        else:
+            _employeeList = _default_employees()
+    return _employeeList
 
-employeeList.append(Employee("John", 25, 50000))
-employeeList.append(Employee("Jane", 30, 60000))
-employeeList.append(Employee("Bob", 35, 70000))
-employeeList.append(Employee("Alice", 40, 80000))
-employeeList.append(Employee("Mike", 45, 90000))
-employeeList.append(Employee("Sarah", 50, 100000))
-employeeList.append(Employee("Tom", 55, 110000))
-employeeList.append(Employee("Emily", 60, 120000))
+def __getattr__(name):
+    # employeeList is still available as a module attribute, built lazily
+    if name == 'employeeList':
+        return get_employees()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_all_employees_names():
     nameList = []
-    for employee in employeeList:
+    for employee in get_employees():
         nameList.append(employee.name)
     return nameList
 
 def get_maximum_salary():
-    maxSalary = 0
-    for employee in employeeList:
-        if employee.salary > maxSalary:
+    # None for an empty roster; starting from 0 would hide negative salaries
+    maxSalary = None
+    for employee in get_employees():
+        if maxSalary is None or employee.salary > maxSalary:
             maxSalary = employee.salary
     return maxSalary
 
 def get_employees_with_salary_greater_than(salary):
     employeeListWithSalaryGreaterThan = []
-    for employee in employeeList:
+    for employee in get_employees():
         if employee.salary > salary:
             employeeListWithSalaryGreaterThan.append(employee)
     return employeeListWithSalaryGreaterThan
 
-print(get_employees_with_salary_greater_than(100000))
+if __name__ == "__main__":
+    print(get_employees_with_salary_greater_than(100000))
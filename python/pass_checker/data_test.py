@@ -0,0 +1,61 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import data
+
+
+class TestData(unittest.TestCase):
+
+    def test_queries(self):
+        self.assertEqual(data.get_all_employees_names()[:2], ["John", "Jane"])
+        self.assertEqual(data.get_maximum_salary(), 120000)
+        self.assertEqual([employee.name for employee in
+                          data.get_employees_with_salary_greater_than(100000)], ["Tom", "Emily"])
+        self.assertIs(data.employeeList, data.get_employees())
+        with self.assertRaises(AttributeError):
+            data.employees
+
+    def test_maximum_salary_of_any_roster(self):
+        for salaries, expected in [([-5, -1, -3], -1), ([0, -1], 0), ([], None)]:
+            with self.subTest(salaries=salaries):
+                roster = [data.Employee("E", 30, salary) for salary in salaries]
+                with mock.patch.object(data, '_employeeList', roster):
+                    self.assertEqual(data.get_maximum_salary(), expected)
+
+    def test_assigned_employee_list(self):
+        roster = [data.Employee("Ada", 36, 150000)]
+        with mock.patch.object(data, 'employeeList', roster):
+            self.assertIs(data.employeeList, roster)
+            self.assertIs(data.get_employees(), roster)
+            self.assertEqual(data.get_all_employees_names(), ["Ada"])
+            self.assertEqual(data.get_maximum_salary(), 150000)
+        self.assertNotIn('employeeList', vars(data))
+        self.assertEqual(data.get_all_employees_names()[0], "John")
+
+    def run_python(self, code, **environ):
+        here = os.path.dirname(os.path.abspath(data.__file__))
+        return subprocess.run([sys.executable, '-c', code], cwd=here, check=True,
+                              capture_output=True, text=True,
+                              env=dict(os.environ, **environ)).stdout
+
+    def test_import_is_silent_and_lazy(self):
+        output = self.run_python("import data; assert data._employeeList is None")
+        self.assertEqual(output, "")
+
+    def test_employee_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "employees.jsonl")
+            with open(path, 'w') as jsonl_file:
+                jsonl_file.write(json.dumps({'name': "Ada", 'age': 36, 'salary': 150000}) + "\n")
+            output = self.run_python("import data; print(data.get_all_employees_names())",
+                                     EMPLOYEE_FILE=path)
+        self.assertEqual(output, "['Ada']\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
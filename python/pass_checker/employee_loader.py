@@ -0,0 +1,249 @@
+# Streaming employee loader
+#
+# Reads employee records from CSV or JSON Lines files in fixed-size chunks,
+# so memory use is bounded by the chunk size rather than the file size.
+# Each chunk is three typed columns, ready for EmployeeStore.extend_columns:
+#
+#     names      list of str
+#     ages       array of int
+#     salaries   array of float
+#
+# CSV files need a header row naming the name, age and salary columns; other
+# columns are ignored. JSONL files hold one object per line with those keys,
+# where the name is a string, the age an integer and the salary a number.
+# Ages must fit the age column and salaries must be finite.
+#
+#     python employee_loader.py payroll.csv
+#     python employee_loader.py payroll.jsonl --chunk-size 50000
+
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import time
+from array import array
+
+from employee_store import AGE_TYPECODE, SALARY_TYPECODE, EmployeeStore
+
+FIELDS = ('name', 'age', 'salary')
+DEFAULT_CHUNK_SIZE = 100_000
+
+# File extensions of each format, for read_chunks
+FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+
+class LoadStats:
+    """
+    Rows read by a loader and the time since it started reading, updated
+    after every chunk.
+    """
+    __slots__ = ('rows', 'chunks', 'seconds')
+
+    def __init__(self):
+        self.rows = 0
+        self.chunks = 0
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return (f"{self.rows} rows in {self.chunks} chunks, {self.seconds:.2f}s "
+                f"({self.rows_per_second:,.0f} rows/sec)")
+
+
+def _new_chunk():
+    return [], array(AGE_TYPECODE), array(SALARY_TYPECODE)
+
+
+def _chunked(records, chunk_size, stats):
+    # Groups (line number, name, age, salary) records into column chunks
+    start = time.perf_counter()
+    names, ages, salaries = _new_chunk()
+    for line_number, name, age, salary in records:
+        try:
+            ages.append(age)
+        except OverflowError:
+            raise ValueError(f"Line {line_number}: invalid age {age!r}: out of range")
+        try:
+            value = float(salary)
+        except OverflowError:
+            value = math.inf
+        if not math.isfinite(value):
+            raise ValueError(f"Line {line_number}: invalid salary {salary!r}: expected a finite number")
+        names.append(name)
+        salaries.append(value)
+        if len(names) == chunk_size:
+            _record_chunk(stats, len(names), start)
+            yield names, ages, salaries
+            names, ages, salaries = _new_chunk()
+    if names:
+        _record_chunk(stats, len(names), start)
+        yield names, ages, salaries
+
+
+def _record_chunk(stats, rows, start):
+    if stats is not None:
+        stats.rows += rows
+        stats.chunks += 1
+        stats.seconds = time.perf_counter() - start
+
+
+def _csv_records(text_file):
+    reader = csv.reader(text_file)
+    header = next(reader, None)
+    if header is None:
+        return
+    header = [column.strip().lower() for column in header]
+    missing = [field for field in FIELDS if field not in header]
+    if missing:
+        raise ValueError(f"CSV header is missing columns: {', '.join(missing)}")
+    name_column, age_column, salary_column = (header.index(field) for field in FIELDS)
+    for row in reader:
+        if not row:
+            continue
+        try:
+            name, age, salary = row[name_column], row[age_column], row[salary_column]
+        except IndexError:
+            raise ValueError(f"Line {reader.line_num}: expected {len(header)} columns, got {len(row)}")
+        try:
+            yield reader.line_num, name, int(age), float(salary)
+        except ValueError:
+            raise ValueError(f"Line {reader.line_num}: invalid age or salary: {age!r}, {salary!r}")
+
+
+def _jsonl_records(text_file):
+    for line_number, line in enumerate(text_file, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            name, age, salary = record['name'], record['age'], record['salary']
+        except (json.JSONDecodeError, TypeError, KeyError) as error:
+            raise ValueError(f"Line {line_number}: invalid employee record: {error}")
+        # JSON booleans are ints in Python, and int() would truncate 30.5
+        if not isinstance(name, str):
+            raise ValueError(f"Line {line_number}: invalid name {name!r}: expected a string")
+        if type(age) is not int:
+            raise ValueError(f"Line {line_number}: invalid age {age!r}: expected an integer")
+        if type(salary) not in (int, float):
+            raise ValueError(f"Line {line_number}: invalid salary {salary!r}: expected a number")
+        yield line_number, name, age, salary
+
+
+def read_csv(text_file, chunk_size=DEFAULT_CHUNK_SIZE, stats=None):
+    """
+    Yields (names, ages, salaries) column chunks from a CSV file.
+
+    Args:
+        text_file: A file opened in text mode with newline=''
+        chunk_size (int): Maximum rows per chunk
+        stats (LoadStats): Updated after every chunk, if given
+
+    Raises:
+        ValueError: If the header lacks a column or a row cannot be parsed
+    """
+    return _chunked(_csv_records(text_file), chunk_size, stats)
+
+
+def read_jsonl(text_file, chunk_size=DEFAULT_CHUNK_SIZE, stats=None):
+    """
+    Yields (names, ages, salaries) column chunks from a JSON Lines file.
+
+    Args:
+        text_file: A file opened in text mode
+        chunk_size (int): Maximum rows per chunk
+        stats (LoadStats): Updated after every chunk, if given
+
+    Raises:
+        ValueError: If a line is not an employee record
+    """
+    return _chunked(_jsonl_records(text_file), chunk_size, stats)
+
+
+def read_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, stats=None):
+    """
+    Yields (names, ages, salaries) column chunks from a CSV or JSONL file,
+    chosen by the file's extension.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"Unknown employee file format: {extension or path}")
+    # Spreadsheet programs often start CSV files with a byte order mark
+    encoding = 'utf-8-sig' if FORMATS[extension] == 'csv' else 'utf-8'
+    with open(path, newline='', encoding=encoding) as text_file:
+        if FORMATS[extension] == 'csv':
+            yield from read_csv(text_file, chunk_size, stats)
+        else:
+            yield from read_jsonl(text_file, chunk_size, stats)
+
+
+def iter_employees(path, chunk_size=DEFAULT_CHUNK_SIZE, stats=None):
+    """
+    Yields a data.Employee for every record of a CSV or JSONL file, holding
+    at most one chunk of parsed records at a time.
+    """
+    from data import Employee
+    for names, ages, salaries in read_chunks(path, chunk_size, stats):
+        yield from map(Employee, names, ages, salaries)
+
+
+def load_store(path, store=None, chunk_size=DEFAULT_CHUNK_SIZE, stats=None):
+    """
+    Appends every record of a CSV or JSONL file to a columnar store, without
+    creating an object per employee. Each chunk is added as soon as it is
+    parsed, and the salary index is rebuilt once, after the last chunk. If a
+    record cannot be parsed, the rows already added are removed again, so
+    the store is left as it was.
+
+    Args:
+        path (str): The CSV or JSONL file
+        store (EmployeeStore): The store to add to; a new one if None
+        chunk_size (int): Maximum rows parsed before they are added
+        stats (LoadStats): Updated after every chunk, if given
+
+    Returns:
+        EmployeeStore: The store
+
+    Raises:
+        ValueError: If a record cannot be parsed; nothing is added then
+    """
+    if store is None:
+        store = EmployeeStore()
+    start = len(store.names)
+    try:
+        for names, ages, salaries in read_chunks(path, chunk_size, stats):
+            store.extend_columns(names, ages, salaries, reindex=False)
+    except BaseException:
+        store.truncate(start)
+        raise
+    store.reindex()
+    return store
+
+
+def main(argv=None):
+    """
+    Loads an employee file into a store and reports the load rate.
+    """
+    parser = argparse.ArgumentParser(description="Load employees from a CSV or JSONL file")
+    parser.add_argument('path', help="CSV or JSONL employee file")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="rows parsed per chunk (default: 100000)")
+    args = parser.parse_args(argv)
+
+    stats = LoadStats()
+    try:
+        store = load_store(args.path, chunk_size=args.chunk_size, stats=stats)
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    print(f"Loaded {stats}")
+    print(f"Maximum salary: {store.max_salary()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+import data
+from employee_loader import (LoadStats, iter_employees, load_store, main, read_chunks,
+                             read_csv, read_jsonl)
+from employee_store import EmployeeStore
+
+ROWS = [("John", 25, 50000), ("Jane", 30, 60000.5), ("O'Brien, Pat", 35, -100), ("Zoë", 40, 0)]
+
+
+class TestEmployeeLoader(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.csv_path = os.path.join(directory.name, "employees.csv")
+        with open(self.csv_path, 'w', encoding='utf-8') as csv_file:
+            csv_file.write("id,Name,salary,age\n")
+            for number, (name, age, salary) in enumerate(ROWS):
+                quoted = f'"{name}"' if ',' in name else name
+                csv_file.write(f"{number},{quoted},{salary},{age}\n")
+        self.jsonl_path = os.path.join(directory.name, "employees.jsonl")
+        with open(self.jsonl_path, 'w', encoding='utf-8') as jsonl_file:
+            for name, age, salary in ROWS:
+                jsonl_file.write(json.dumps({'name': name, 'age': age, 'salary': salary}) + "\n")
+
+    def test_chunks(self):
+        for path in (self.csv_path, self.jsonl_path):
+            with self.subTest(path=path):
+                stats = LoadStats()
+                chunks = list(read_chunks(path, chunk_size=3, stats=stats))
+                self.assertEqual([len(names) for names, _, _ in chunks], [3, 1])
+                names, ages, salaries = chunks[0]
+                self.assertEqual(names, ["John", "Jane", "O'Brien, Pat"])
+                self.assertEqual(list(ages), [25, 30, 35])
+                self.assertEqual(list(salaries), [50000.0, 60000.5, -100.0])
+                self.assertEqual((stats.rows, stats.chunks), (4, 2))
+                self.assertGreater(stats.rows_per_second, 0)
+
+    def test_iter_employees(self):
+        employees = list(iter_employees(self.jsonl_path))
+        self.assertTrue(all(isinstance(employee, data.Employee) for employee in employees))
+        self.assertEqual([(e.name, e.age, e.salary) for e in employees], ROWS)
+
+    def test_load_store(self):
+        store = EmployeeStore(data.employeeList)
+        load_store(self.csv_path, store, chunk_size=2)
+        self.assertEqual(len(store), len(data.employeeList) + len(ROWS))
+        self.assertEqual(store.min_salary(), -100)
+        self.assertEqual(store[-1].name, "Zoë")
+
+    def test_failed_load_leaves_store_unchanged(self):
+        store = EmployeeStore(data.employeeList)
+        before = (list(store.names), store.salary_stats(), store.rows_by_salary())
+        with open(self.jsonl_path, 'a', encoding='utf-8') as jsonl_file:
+            jsonl_file.write('{"name": "Bad", "age": 30, "salary": "x"}\n')
+        with self.assertRaisesRegex(ValueError, f"Line {len(ROWS) + 1}"):
+            load_store(self.jsonl_path, store, chunk_size=2)
+        self.assertEqual((store.names, store.salary_stats(), store.rows_by_salary()), before)
+
+    def test_csv_byte_order_mark(self):
+        path = os.path.join(os.path.dirname(self.csv_path), "bom.csv")
+        with open(path, 'w', encoding='utf-8-sig') as csv_file:
+            csv_file.write("name,age,salary\nJohn,25,50000\n")
+        names, ages, salaries = next(read_chunks(path))
+        self.assertEqual((names, list(ages), list(salaries)), (["John"], [25], [50000.0]))
+
+    def test_errors(self):
+        cases = [
+            (read_csv, "name,age\nJohn,25\n", "missing columns: salary"),
+            (read_csv, "name,age,salary\nJohn,25\n", "Line 2: expected 3 columns"),
+            (read_csv, "name,age,salary\nJohn,old,1\n", "Line 2: invalid age"),
+            (read_jsonl, '{"name": "John", "age": 25}\n', "Line 1: invalid employee record"),
+            (read_jsonl, '\n{"name": "John", "age": 25, "salary": "x"}\n', "Line 2: invalid"),
+            (read_jsonl, '{"name": "John", "age": 30.5, "salary": 1}\n', "Line 1: invalid age 30.5"),
+            (read_jsonl, '{"name": "John", "age": true, "salary": 1}\n', "Line 1: invalid age True"),
+            (read_jsonl, '{"name": "John", "age": "30", "salary": 1}\n', "Line 1: invalid age '30'"),
+            (read_jsonl, '{"name": null, "age": 30, "salary": 1}\n', "Line 1: invalid name None"),
+            (read_jsonl, '{"name": "John", "age": 30, "salary": false}\n', "Line 1: invalid salary"),
+            (read_jsonl, '{"name": "John", "age": 30, "salary": NaN}\n', "Line 1: invalid salary nan"),
+            (read_jsonl, '{"name": "John", "age": 30, "salary": 1e400}\n', "Line 1: invalid salary inf"),
+            (read_jsonl, '{"name": "John", "age": 3000000000, "salary": 1}\n', "out of range"),
+            (read_csv, "name,age,salary\nJohn,30.5,1\n", "Line 2: invalid age"),
+            (read_csv, "name,age,salary\nJohn,30,1\nJane,99999999999,1\n", "Line 3: invalid age"),
+            (read_csv, "name,age,salary\nJohn,30,nan\n", "Line 2: invalid salary"),
+        ]
+        for reader, text, message in cases:
+            with self.subTest(text=text):
+                with self.assertRaisesRegex(ValueError, message):
+                    list(reader(io.StringIO(text)))
+        with self.assertRaisesRegex(ValueError, "Unknown employee file format"):
+            list(read_chunks("employees.xlsx"))
+
+    def test_empty_csv(self):
+        self.assertEqual(list(read_csv(io.StringIO(""))), [])
+
+    def test_main(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(main([self.jsonl_path]), 0)
+        self.assertIn("Loaded 4 rows", output.getvalue())
+        self.assertIn("Maximum salary: 60000.5", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,350 @@
+# Employee queries
+#
+# A lazy query builder over a roster of employees. Each step returns a new
+# query, and nothing runs until the results are asked for:
+#
+#     Query(store).where('salary', '>', 100000).where('age', '<', 50)
+#                 .select('name', 'salary').order_by('salary', descending=True)
+#
+#     Query(data.get_employees()).group_by('age').agg(
+#         employees=('name', 'count'), payroll=('salary', 'sum'))
+#
+# How a query runs depends on its source:
+#
+#     EmployeeStore   predicates on salary are answered from the salary index
+#                     with a bisect, then the remaining predicates, sorting
+#                     and aggregation run vectorized with NumPy over the
+#                     columns of the matching rows only
+#     other rows      any iterable of objects with name, age and salary
+#                     attributes, such as data.Employee, is filtered,
+#                     projected and aggregated in one generator pass
+#
+# Both give the same results. Without NumPy, a store is still filtered through
+# its salary index, then handled like other rows.
+
+import operator
+from itertools import islice
+
+from employee_store import EmployeeRow, EmployeeStore
+
+COLUMNS = ('name', 'age', 'salary')
+NUMERIC_COLUMNS = ('age', 'salary')
+
+OPERATORS = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+AGGREGATES = ('count', 'sum', 'mean', 'min', 'max')
+
+
+def _load_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class Query:
+    """
+    A lazy, immutable query over employees. Results are rows in roster order
+    unless order_by is used:
+
+        no select or agg   the matching rows themselves (EmployeeRow for a store)
+        select             tuples of the selected columns
+        agg                tuples of the group_by key, then each aggregate
+    """
+    def __init__(self, source):
+        """
+        Args:
+            source: An EmployeeStore, or an iterable of objects with name,
+                    age and salary attributes
+        """
+        self._source = source
+        self._predicates = ()
+        self._selected = None
+        self._group = None
+        self._aggregates = None
+        self._order = None
+        self._limit = None
+
+    def _with(self, **changes):
+        query = Query(self._source)
+        query.__dict__.update(self.__dict__)
+        for name, value in changes.items():
+            setattr(query, '_' + name, value)
+        return query
+
+    def where(self, column, op, value):
+        """
+        Keeps employees whose column compares to value, as "column op value".
+
+        Args:
+            column (str): One of COLUMNS
+            op (str): One of OPERATORS
+            value: The value to compare with
+        """
+        _check_column(column, COLUMNS)
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown operator: {op}")
+        return self._with(predicates=self._predicates + ((column, op, value),))
+
+    def select(self, *columns):
+        """
+        Returns tuples of these columns instead of rows.
+        """
+        for column in columns:
+            _check_column(column, COLUMNS)
+        return self._with(selected=columns)
+
+    def group_by(self, column):
+        """
+        Aggregates per distinct value of a column; see agg.
+        """
+        _check_column(column, COLUMNS)
+        return self._with(group=column)
+
+    def agg(self, **aggregates):
+        """
+        Aggregates the matching employees, per group if group_by is used.
+
+        Args:
+            aggregates: Output names mapped to (column, function) pairs, where
+                        function is one of AGGREGATES
+        """
+        if not aggregates:
+            raise ValueError("agg needs at least one aggregate")
+        for name, (column, function) in aggregates.items():
+            _check_column(column, COLUMNS)
+            if function not in AGGREGATES:
+                raise ValueError(f"Unknown aggregate for {name}: {function}")
+            if function in ('sum', 'mean') and column not in NUMERIC_COLUMNS:
+                raise ValueError(f"Cannot {function} the {column} column")
+        return self._with(aggregates=tuple(
+            (name, column, function) for name, (column, function) in aggregates.items()))
+
+    def order_by(self, column, descending=False):
+        """
+        Sorts the results by a column, keeping ties in roster order. After
+        agg, the column is the group_by column or an aggregate's name.
+        """
+        return self._with(order=(column, descending))
+
+    def limit(self, count):
+        """
+        Keeps at most count results.
+        """
+        return self._with(limit=count)
+
+    @property
+    def columns(self):
+        """
+        The names of the fields of each result tuple, or None if the results
+        are rows.
+        """
+        if self._aggregates is not None:
+            names = tuple(name for name, _, _ in self._aggregates)
+            return (self._group,) + names if self._group else names
+        return self._selected
+
+    def run(self):
+        """
+        Runs the query.
+
+        Returns:
+            list: The results
+        """
+        if self._order is not None:
+            allowed = self.columns if self._aggregates is not None else COLUMNS
+            _check_column(self._order[0], allowed)
+        if self._group is not None and self._aggregates is None:
+            raise ValueError("group_by needs agg")
+        if isinstance(self._source, EmployeeStore):
+            numpy = _load_numpy()
+            if numpy is not None:
+                return self._run_columnar(numpy)
+            rows, predicates = self._store_candidates(self._source)
+            rows = (EmployeeRow(self._source, index) for index in sorted(rows))
+            return self._run_rows(rows, predicates)
+        return self._run_rows(self._source, self._predicates)
+
+    def __iter__(self):
+        return iter(self.run())
+
+    def _store_candidates(self, store):
+        # Pushes salary predicates into the salary index. Returns the row
+        # numbers that satisfy them, in salary order, and the predicates left
+        start, stop = 0, len(store)
+        remaining = []
+        for column, op, value in self._predicates:
+            if column == 'salary' and op != '!=':
+                low, high = store.salary_bounds(op, value)
+                start, stop = max(start, low), min(stop, high)
+            else:
+                remaining.append((column, op, value))
+        return store.rows_by_salary(start, max(start, stop)), remaining
+
+    def _run_rows(self, rows, predicates):
+        tests = [(operator.attrgetter(column), OPERATORS[op], value)
+                 for column, op, value in predicates]
+        if tests:
+            rows = (row for row in rows
+                    if all(compare(get(row), value) for get, compare, value in tests))
+
+        if self._aggregates is not None:
+            return self._finish(self._aggregate_rows(rows))
+
+        if self._order is not None:
+            column, descending = self._order
+            rows = sorted(rows, key=operator.attrgetter(column), reverse=descending)
+        if self._limit is not None:
+            rows = islice(rows, self._limit)
+        if self._selected is None:
+            return list(rows)
+        getters = [operator.attrgetter(column) for column in self._selected]
+        return [tuple(get(row) for get in getters) for row in rows]
+
+    def _aggregate_rows(self, rows):
+        # One pass, keeping a count and one accumulator per aggregate for
+        # every group
+        getters = [operator.attrgetter(column) for _, column, _ in self._aggregates]
+        functions = [function for _, _, function in self._aggregates]
+        group = operator.attrgetter(self._group) if self._group else (lambda row: None)
+        states = {}
+        for row in rows:
+            key = group(row)
+            state = states.get(key)
+            if state is None:
+                state = states[key] = [0] + [None] * len(functions)
+            state[0] += 1
+            for position, (get, function) in enumerate(zip(getters, functions), 1):
+                if function == 'count':
+                    continue
+                value = get(row)
+                current = state[position]
+                if current is None:
+                    state[position] = value
+                elif function in ('sum', 'mean'):
+                    state[position] = current + value
+                elif function == 'min':
+                    if value < current:
+                        state[position] = value
+                elif value > current:
+                    state[position] = value
+
+        if not states and not self._group:
+            states[None] = [0] + [None] * len(functions)
+        results = []
+        for key in sorted(states) if self._group else states:
+            count, *values = states[key]
+            row = [key] if self._group else []
+            for function, value in zip(functions, values):
+                if function == 'count':
+                    value = count
+                elif function == 'sum' and value is None:
+                    value = 0
+                elif function == 'mean' and value is not None:
+                    value = value / count
+                row.append(value)
+            results.append(tuple(row))
+        return results
+
+    def _finish(self, results):
+        # Sorts and limits aggregated result tuples
+        if self._order is not None:
+            column, descending = self._order
+            position = self.columns.index(column)
+            results.sort(key=operator.itemgetter(position), reverse=descending)
+        if self._limit is not None:
+            del results[self._limit:]
+        return results
+
+    def _run_columnar(self, np):
+        store = self._source
+        rows, predicates = self._store_candidates(store)
+        rows = np.sort(np.frombuffer(rows, dtype=np.int64))
+        # Views of the numeric columns, without copying them
+        columns = {'age': np.frombuffer(store.ages, dtype=store.ages.typecode),
+                   'salary': np.frombuffer(store.salaries, dtype=store.salaries.typecode)}
+
+        def values(column, at):
+            if column == 'name':
+                return np.array([store.names[index] for index in at.tolist()], dtype=object)
+            return columns[column][at]
+
+        for column, op, value in predicates:
+            rows = rows[OPERATORS[op](values(column, rows), value)]
+
+        if self._aggregates is not None:
+            names = self._group == 'name' or any(
+                function in ('min', 'max') and column == 'name'
+                for _, column, function in self._aggregates)
+            if names:
+                return self._finish(self._aggregate_rows(
+                    EmployeeRow(store, index) for index in rows.tolist()))
+            return self._finish(self._aggregate_columnar(np, rows, columns))
+
+        if self._order is not None:
+            column, descending = self._order
+            keys = values(column, rows)
+            if column == 'name':
+                order = sorted(range(len(rows)), key=keys.__getitem__, reverse=descending)
+            else:
+                order = np.argsort(-keys if descending else keys, kind='stable')
+            rows = rows[order]
+        if self._limit is not None:
+            rows = rows[:self._limit]
+        if self._selected is None:
+            return [EmployeeRow(store, index) for index in rows.tolist()]
+        selected = [values(column, rows).tolist() for column in self._selected]
+        return list(zip(*selected))
+
+    def _aggregate_columnar(self, np, rows, columns):
+        if self._group:
+            keys, groups = np.unique(columns[self._group][rows], return_inverse=True)
+            counts = np.bincount(groups, minlength=len(keys))
+        else:
+            keys, groups = [None], np.zeros(len(rows), dtype=np.intp)
+            counts = np.array([len(rows)])
+
+        outputs = []
+        for _, column, function in self._aggregates:
+            if function == 'count':
+                outputs.append(counts.tolist())
+                continue
+            values = columns[column][rows]
+            if function in ('sum', 'mean'):
+                totals = np.bincount(groups, weights=values, minlength=len(keys))
+                if values.dtype.kind == 'i':
+                    totals = totals.astype(np.int64)
+                if function == 'sum':
+                    outputs.append(totals.tolist())
+                else:
+                    outputs.append([total / count if count else None
+                                    for total, count in zip(totals.tolist(), counts.tolist())])
+                continue
+            # Start every group from the identity of min or max for the dtype
+            if values.dtype.kind == 'f':
+                start = np.inf if function == 'min' else -np.inf
+            else:
+                limits = np.iinfo(values.dtype)
+                start = limits.max if function == 'min' else limits.min
+            extremes = np.full(len(keys), start, dtype=values.dtype)
+            (np.minimum if function == 'min' else np.maximum).at(extremes, groups, values)
+            outputs.append([value if count else None
+                            for value, count in zip(extremes.tolist(), counts.tolist())])
+
+        key_list = keys.tolist() if self._group else keys
+        if self._group:
+            return [(key,) + values for key, values in zip(key_list, zip(*outputs))]
+        return [tuple(output[0] for output in outputs)]
+
+
+def _check_column(column, allowed):
+    if column not in allowed:
+        raise ValueError(f"Unknown column: {column}; expected one of {', '.join(allowed)}")
@@ -0,0 +1,150 @@
+import random
+import unittest
+from unittest import mock
+
+import data
+import employee_query
+from employee_query import Query
+from employee_store import EmployeeStore
+
+NAMES = ["Ann", "Bob", "Cy", "Dee", "Eve", "Fay"]
+
+
+def random_store(count, seed):
+    rng = random.Random(seed)
+    return EmployeeStore.from_columns(
+        [rng.choice(NAMES) for _ in range(count)],
+        [rng.randint(20, 30) for _ in range(count)],
+        # Whole numbers, so sums are exact whatever the summation order
+        [rng.randrange(-5, 100) * 1000 for _ in range(count)])
+
+
+def run_every_way(query, store):
+    # Results over the store with NumPy, over the store without NumPy, and
+    # over its rows as a plain iterable
+    with mock.patch.object(employee_query, '_load_numpy', return_value=None):
+        without_numpy = query.run()
+    rows = Query(list(store))
+    rows.__dict__.update({key: value for key, value in query.__dict__.items() if key != '_source'})
+    return query.run(), without_numpy, rows.run()
+
+
+class TestQuery(unittest.TestCase):
+
+    def setUp(self):
+        self.store = random_store(500, 1)
+
+    def assertSameEverywhere(self, query):
+        columnar, without_numpy, rows = run_every_way(query, self.store)
+        self.assertEqual(columnar, without_numpy)
+        self.assertEqual(columnar, rows)
+        return columnar
+
+    def test_where_and_select(self):
+        query = (Query(self.store).where('salary', '>', 50000).where('salary', '<=', 80000)
+                 .where('age', '!=', 25).select('name', 'age', 'salary'))
+        results = self.assertSameEverywhere(query)
+        self.assertTrue(results)
+        self.assertTrue(all(50000 < salary <= 80000 and age != 25 for _, age, salary in results))
+        expected = [(row.name, row.age, row.salary) for row in self.store
+                    if 50000 < row.salary <= 80000 and row.age != 25]
+        self.assertEqual(results, expected)
+
+    def test_every_operator(self):
+        for op in employee_query.OPERATORS:
+            for column, value in [('salary', 42000), ('age', 25), ('name', "Cy")]:
+                with self.subTest(op=op, column=column):
+                    self.assertSameEverywhere(Query(self.store).where(column, op, value)
+                                              .select('name'))
+
+    def test_rows(self):
+        results = self.assertSameEverywhere(Query(self.store).where('salary', '==', 0))
+        self.assertTrue(all(row.salary == 0 for row in results))
+
+    def test_order_by_and_limit(self):
+        for column in ('salary', 'age', 'name'):
+            for descending in (False, True):
+                with self.subTest(column=column, descending=descending):
+                    query = (Query(self.store).where('salary', '>=', 10000)
+                             .order_by(column, descending).limit(25).select('name', 'age', 'salary'))
+                    self.assertEqual(len(self.assertSameEverywhere(query)), 25)
+
+    def test_group_by(self):
+        for group in ('age', 'name'):
+            with self.subTest(group=group):
+                query = (Query(self.store).where('salary', '>', 0).group_by(group)
+                         .agg(employees=('name', 'count'), payroll=('salary', 'sum'),
+                              mean_age=('age', 'mean'), lowest=('salary', 'min'),
+                              oldest=('age', 'max'), first=('name', 'min')))
+                results = self.assertSameEverywhere(query)
+                self.assertEqual(query.columns, (group, 'employees', 'payroll', 'mean_age',
+                                                 'lowest', 'oldest', 'first'))
+                self.assertEqual(sum(result[1] for result in results),
+                                 self.store.count_salary_greater_than(0))
+                self.assertEqual([result[0] for result in results],
+                                 sorted(result[0] for result in results))
+
+    def test_agg_without_groups(self):
+        query = Query(self.store).agg(count=('age', 'count'), top=('salary', 'max'),
+                                      bottom=('salary', 'min'))
+        self.assertEqual(self.assertSameEverywhere(query),
+                         [(len(self.store), self.store.max_salary(), self.store.min_salary())])
+        empty = Query(self.store).where('salary', '>', 10 ** 9).agg(
+            count=('age', 'count'), total=('salary', 'sum'), mean=('salary', 'mean'),
+            top=('salary', 'max'))
+        self.assertEqual(self.assertSameEverywhere(empty), [(0, 0, None, None)])
+
+    def test_order_aggregates(self):
+        query = (Query(self.store).group_by('name').agg(payroll=('salary', 'sum'))
+                 .order_by('payroll', descending=True).limit(2))
+        results = self.assertSameEverywhere(query)
+        self.assertEqual(len(results), 2)
+        self.assertGreaterEqual(results[0][1], results[1][1])
+
+    def test_after_mutations(self):
+        for index in range(0, 500, 3):
+            self.store.terminate(index)
+        for index in range(1, 500, 3):
+            self.store.give_raise(index, 7000)
+        self.store.hire("Gus", 31, 55000)
+        query = (Query(self.store).where('salary', '>', 20000).group_by('age')
+                 .agg(employees=('name', 'count'), top=('salary', 'max')))
+        results = self.assertSameEverywhere(query)
+        self.assertEqual(sum(result[1] for result in results),
+                         self.store.count_salary_greater_than(20000))
+        self.assertSameEverywhere(Query(self.store).where('age', '>', 27).select('name', 'salary'))
+
+    def test_employee_objects(self):
+        names = Query(data.get_employees()).where('salary', '>', 100000).select('name').run()
+        self.assertEqual(names, [("Tom",), ("Emily",)])
+        self.assertEqual(Query(data.get_employees()).agg(top=('salary', 'max')).run(),
+                         [(data.get_maximum_salary(),)])
+
+    def test_queries_are_immutable(self):
+        base = Query(self.store).where('age', '<', 25)
+        base.where('age', '>', 22).select('name')
+        self.assertIsNone(base.columns)
+        self.assertEqual(len(base.run()), len([row for row in self.store if row.age < 25]))
+
+    def test_empty_store(self):
+        query = Query(EmployeeStore()).where('salary', '>', 0).group_by('age').agg(n=('age', 'count'))
+        self.assertEqual(query.run(), [])
+
+    def test_errors(self):
+        query = Query(self.store)
+        with self.assertRaises(ValueError):
+            query.where('height', '>', 1)
+        with self.assertRaises(ValueError):
+            query.where('age', '~', 1)
+        with self.assertRaises(ValueError):
+            query.agg(total=('name', 'sum'))
+        with self.assertRaises(ValueError):
+            query.agg(total=('age', 'median'))
+        with self.assertRaises(ValueError):
+            query.group_by('age').run()
+        with self.assertRaises(ValueError):
+            query.agg(total=('age', 'sum')).order_by('age').run()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,501 @@
+# Columnar employee store
+#
+# Keeps employees in columns instead of one object per employee: names in a
+# list, ages and salaries in typed arrays. Rows are read through
+# EmployeeRow, a slotted view that holds only the store and a row number.
+#
+# A sorted salary index is kept next to the columns, so salary queries do not
+# scan the roster:
+#
+#     max_salary / min_salary          O(1), the ends of the index
+#     salary_greater_than(x)           bisect, then a slice of the index
+#     count_salary_greater_than(x)     bisect only
+#     salary_bounds(op, x)             bisect, for any of SALARY_OPERATORS
+#
+# Employees can be hired, given raises and terminated. Each update adjusts
+# the index with a bisect and keeps running aggregates, so the dashboard
+# figures cost the same whatever the roster size:
+#
+#     salary_stats()                   O(1): count, total, mean, min and max
+#     salary_histogram()               O(buckets): employees per salary bucket
+#
+# Terminated rows stay in the columns, marked inactive, so row numbers and
+# EmployeeRow views stay valid; they are left out of the index, iteration,
+# len() and the aggregates. The salary total is kept exactly, as the partial
+# sums math.fsum uses, so it does not drift however many updates it sees.
+# Salaries must be finite numbers.
+#
+#     store = EmployeeStore(data.employeeList)
+#     store.append("Zoe", 28, 65000)
+#     store.salary_greater_than(100000)
+#
+# Bulk loads sort the index with NumPy when it is installed.
+
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from itertools import chain, filterfalse
+
+# array typecodes of the numeric columns
+AGE_TYPECODE = 'i'
+SALARY_TYPECODE = 'd'
+
+# Width of the salary_histogram buckets
+DEFAULT_BUCKET_WIDTH = 10000
+
+# Comparisons that salary_bounds answers from the salary index
+SALARY_OPERATORS = ('>', '>=', '<', '<=', '==')
+
+
+def _check_salary(salary):
+    if not math.isfinite(salary):
+        raise ValueError(f"Salary must be a finite number, not {salary}")
+
+
+def _column(typecode, values):
+    # values as an array of the column's type, converted before any column
+    # changes so that a bad value leaves the store as it was
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    return array(typecode, values)
+
+
+def _add_exact(partials, value):
+    # Adds value to partials, non-overlapping floats whose exact sum is the
+    # running total (the msum step behind math.fsum)
+    count = 0
+    for partial in partials:
+        if abs(value) < abs(partial):
+            value, partial = partial, value
+        high = value + partial
+        low = partial - (high - value)
+        if low:
+            partials[count] = low
+            count += 1
+        value = high
+    partials[count:] = [value]
+
+
+def _exact_terms(values):
+    # Non-overlapping floats whose exact sum is the sum of values; each fsum
+    # takes the rounded remainder, so this usually ends after one or two
+    terms = []
+    while True:
+        term = math.fsum(chain(values, (-term for term in terms)))
+        if not term:
+            return terms
+        terms.append(term)
+
+
+class EmployeeRow:
+    """
+    A view of one row of an EmployeeStore, with the same attributes as
+    data.Employee. Views are created on access and read through to the
+    store's columns.
+    """
+    __slots__ = ('store', 'index')
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    @property
+    def name(self):
+        return self.store.names[self.index]
+
+    @property
+    def age(self):
+        return self.store.ages[self.index]
+
+    @property
+    def salary(self):
+        return self.store.salaries[self.index]
+
+    def __eq__(self, other):
+        if not isinstance(other, EmployeeRow):
+            return NotImplemented
+        return self.store is other.store and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.store), self.index))
+
+    def __str__(self):
+        salary = self.salary
+        if salary.is_integer():
+            salary = int(salary)
+        return f"Employee(name={self.name}, age={self.age}, salary={salary})"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class EmployeeStore:
+    """
+    Employees stored as columns, with a sorted salary index and running
+    salary aggregates.
+
+    Attributes:
+        names (list): Employee names, by row.
+        ages (array): Employee ages, by row.
+        salaries (array): Employee salaries as floats, by row.
+        active (bytearray): 1 for each current employee, 0 once terminated, by row.
+        bucket_width (float): Width of the salary_histogram buckets.
+
+    Rows are indexed by row number, terminated rows included. Negative
+    indexes count back from the last current employee, as in list(store).
+    """
+    def __init__(self, employees=(), bucket_width=DEFAULT_BUCKET_WIDTH):
+        """
+        Args:
+            employees (iterable): Objects with name, age and salary
+                                  attributes, such as data.Employee
+            bucket_width (float): Width of the salary_histogram buckets
+        """
+        self.names = []
+        self.ages = array(AGE_TYPECODE)
+        self.salaries = array(SALARY_TYPECODE)
+        self.active = bytearray()
+        self.bucket_width = bucket_width
+        # Salaries in ascending order, and the row of each; ties keep row order
+        self._sorted_salaries = array(SALARY_TYPECODE)
+        self._sorted_rows = array('q')
+        # Running aggregates over current employees
+        self._count = 0
+        self._partials = []
+        self._buckets = Counter()
+        self.extend(employees)
+
+    @classmethod
+    def from_columns(cls, names, ages, salaries):
+        """
+        Creates a store from three equally long sequences.
+        """
+        store = cls()
+        store.extend_columns(names, ages, salaries)
+        return store
+
+    def reindex(self):
+        """
+        Rebuilds the salary index from the salary column.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            rows = (index for index, active in enumerate(self.active) if active)
+            order = sorted(rows, key=self.salaries.__getitem__)
+            self._sorted_rows = array('q', order)
+            self._sorted_salaries = array(SALARY_TYPECODE, map(self.salaries.__getitem__, order))
+            return
+        # A stable argsort over the salary column's buffer, without copying it
+        salaries = np.frombuffer(self.salaries, dtype=np.float64)
+        order = np.argsort(salaries, kind='stable')
+        if self._count < len(self.names):
+            order = order[np.frombuffer(self.active, dtype=np.uint8)[order] == 1]
+        self._sorted_rows = array('q')
+        self._sorted_rows.frombytes(order.astype(np.int64).tobytes())
+        self._sorted_salaries = array(SALARY_TYPECODE)
+        self._sorted_salaries.frombytes(salaries[order].tobytes())
+
+    def _bucket(self, salary):
+        return math.floor(salary / self.bucket_width) * self.bucket_width
+
+    def _position(self, index, salary):
+        # Where a row belongs in the salary index: after lower salaries, and
+        # among equal salaries in row order
+        start = bisect_left(self._sorted_salaries, salary)
+        stop = bisect_right(self._sorted_salaries, salary, start)
+        return bisect_left(self._sorted_rows, index, start, stop)
+
+    def _count_salary(self, salary, change):
+        self._count += change
+        if self._count:
+            _add_exact(self._partials, change * salary)
+        else:
+            self._partials = []
+        bucket = self._bucket(salary)
+        self._buckets[bucket] += change
+        if not self._buckets[bucket]:
+            del self._buckets[bucket]
+
+    def _index(self, index, salary):
+        position = self._position(index, salary)
+        self._sorted_salaries.insert(position, salary)
+        self._sorted_rows.insert(position, index)
+        self._count_salary(salary, 1)
+
+    def _unindex(self, index):
+        salary = self.salaries[index]
+        position = self._position(index, salary)
+        del self._sorted_salaries[position]
+        del self._sorted_rows[position]
+        self._count_salary(salary, -1)
+
+    def _reindex_row(self, index, salary):
+        # Moves a row to its new place in the salary index, shifting only the
+        # entries between its old and new places
+        old = self._position(index, self.salaries[index])
+        new = self._position(index, salary)
+        if new > old:
+            new -= 1  # Counted the row's own old entry
+        salaries, rows = self._sorted_salaries, self._sorted_rows
+        if new > old:
+            salaries[old:new] = salaries[old + 1:new + 1]
+            rows[old:new] = rows[old + 1:new + 1]
+        elif new < old:
+            salaries[new + 1:old + 1] = salaries[new:old]
+            rows[new + 1:old + 1] = rows[new:old]
+        salaries[new] = salary
+        rows[new] = index
+
+    def _active_row(self, index):
+        # Row numbers count terminated rows, but negative indexes count back
+        # over current employees only, so store[-1] is list(store)[-1]
+        if index < 0:
+            row = len(self.active)
+            for _ in range(-index):
+                row = self.active.rfind(1, 0, row)
+                if row < 0:
+                    raise IndexError("EmployeeStore index out of range")
+            return row
+        if index >= len(self.names):
+            raise IndexError("EmployeeStore index out of range")
+        if not self.active[index]:
+            raise IndexError(f"Employee {index} was terminated")
+        return index
+
+    def append(self, name, age, salary):
+        """
+        Adds an employee and updates the salary index and aggregates.
+
+        Returns:
+            EmployeeRow: The new row
+
+        Raises:
+            ValueError: If the salary is NaN or infinite
+        """
+        _check_salary(salary)
+        index = len(self.names)
+        self.names.append(name)
+        self.ages.append(age)
+        self.salaries.append(salary)
+        self.active.append(1)
+        self._index(index, self.salaries[index])
+        return EmployeeRow(self, index)
+
+    hire = append
+
+    def set_salary(self, index, salary):
+        """
+        Changes an employee's salary and updates the salary index and
+        aggregates.
+
+        Raises:
+            IndexError: If there is no such row or the employee was terminated
+            ValueError: If the salary is NaN or infinite
+        """
+        index = self._active_row(index)
+        salary = float(salary)
+        _check_salary(salary)
+        self._reindex_row(index, salary)
+        self._count_salary(self.salaries[index], -1)
+        self._count_salary(salary, 1)
+        self.salaries[index] = salary
+
+    def give_raise(self, index, amount):
+        """
+        Adds amount to an employee's salary; see set_salary.
+        """
+        self.set_salary(index, self.salaries[self._active_row(index)] + amount)
+
+    def terminate(self, index):
+        """
+        Removes an employee from the index, iteration and aggregates. The
+        row's columns are kept, so other row numbers do not change.
+
+        Raises:
+            IndexError: If there is no such row or the employee was terminated
+        """
+        index = self._active_row(index)
+        self._unindex(index)
+        self.active[index] = 0
+
+    def extend(self, employees):
+        """
+        Adds employees, rebuilding the salary index once instead of inserting
+        into it per employee.
+        """
+        names, ages, salaries = [], [], []
+        for employee in employees:
+            names.append(employee.name)
+            ages.append(employee.age)
+            salaries.append(employee.salary)
+        self.extend_columns(names, ages, salaries)
+
+    def extend_columns(self, names, ages, salaries, reindex=True):
+        """
+        Adds employees given as three equally long sequences.
+
+        Args:
+            names (list): Employee names
+            ages (sequence): Employee ages
+            salaries (sequence): Employee salaries
+            reindex (bool): Rebuild the salary index now. Loaders adding many
+                            chunks pass False and call reindex() once at the end.
+
+        Raises:
+            ValueError: If the columns differ in length or a salary is NaN or
+                        infinite; nothing is added then
+            OverflowError: If an age does not fit the age column; nothing is
+                           added then
+        """
+        if not len(names) == len(ages) == len(salaries):
+            raise ValueError("Columns must have the same length")
+        ages = _column(AGE_TYPECODE, ages)
+        salaries = _column(SALARY_TYPECODE, salaries)
+        for salary in filterfalse(math.isfinite, salaries):
+            _check_salary(salary)
+        start = len(self.salaries)
+        self.names.extend(names)
+        self.ages.extend(ages)
+        self.salaries.extend(salaries)
+        self.active.extend(b'\x01' * len(names))
+        added = self.salaries[start:]
+        self._count += len(added)
+        for term in _exact_terms(added):
+            _add_exact(self._partials, term)
+        self._buckets.update(map(self._bucket, added))
+        if reindex:
+            self.reindex()
+
+    def truncate(self, length):
+        """
+        Removes every row from row number length on, with its index entries
+        and aggregates, as if those rows had never been added. Loaders use it
+        to undo a load that fails part way.
+        """
+        removed = [salary for salary, active in
+                   zip(self.salaries[length:], self.active[length:]) if active]
+        self._count -= len(removed)
+        if self._count:
+            for term in _exact_terms(removed):
+                _add_exact(self._partials, -term)
+        else:
+            self._partials = []
+        self._buckets.subtract(map(self._bucket, removed))
+        self._buckets = +self._buckets  # Drops the buckets left empty
+        del self.names[length:]
+        del self.ages[length:]
+        del self.salaries[length:]
+        del self.active[length:]
+        self.reindex()
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        return EmployeeRow(self, self._active_row(index))
+
+    def __iter__(self):
+        for index, active in enumerate(self.active):
+            if active:
+                yield EmployeeRow(self, index)
+
+    def max_salary(self):
+        """
+        Returns the highest salary, or None if the store is empty.
+        """
+        return self._sorted_salaries[-1] if self._sorted_salaries else None
+
+    def min_salary(self):
+        """
+        Returns the lowest salary, or None if the store is empty.
+        """
+        return self._sorted_salaries[0] if self._sorted_salaries else None
+
+    def total_salary(self):
+        """
+        Returns the sum of current salaries, correctly rounded.
+        """
+        return math.fsum(self._partials)
+
+    def mean_salary(self):
+        """
+        Returns the mean salary, or None if the store is empty.
+        """
+        return self.total_salary() / self._count if self._count else None
+
+    def salary_stats(self):
+        """
+        Returns the running salary aggregates, without scanning the roster.
+
+        Returns:
+            dict: count, total, mean, min and max salary of current employees
+        """
+        return {
+            'count': self._count,
+            'total': self.total_salary(),
+            'mean': self.mean_salary(),
+            'min': self.min_salary(),
+            'max': self.max_salary(),
+        }
+
+    def salary_histogram(self):
+        """
+        Returns the number of current employees per salary bucket.
+
+        Returns:
+            dict: Maps the lower bound of each non-empty bucket, a multiple of
+                  bucket_width, to its employee count, in ascending order
+        """
+        return dict(sorted(self._buckets.items()))
+
+    def salary_bounds(self, op, salary):
+        """
+        Finds the employees whose salary compares to a value, in the salary
+        index.
+
+        Args:
+            op (str): One of SALARY_OPERATORS, applied as "employee salary op salary"
+            salary (float): The value to compare with
+
+        Returns:
+            tuple: (start, stop) positions of the matching employees in
+                   rows_by_salary()
+        """
+        if op not in SALARY_OPERATORS:
+            raise ValueError(f"Unsupported salary operator: {op}")
+        if op in ('>', '>='):
+            bisect = bisect_right if op == '>' else bisect_left
+            return bisect(self._sorted_salaries, salary), len(self._sorted_salaries)
+        if op in ('<', '<='):
+            bisect = bisect_left if op == '<' else bisect_right
+            return 0, bisect(self._sorted_salaries, salary)
+        return (bisect_left(self._sorted_salaries, salary),
+                bisect_right(self._sorted_salaries, salary))
+
+    def rows_by_salary(self, start=0, stop=None):
+        """
+        Returns row numbers in ascending salary order, ties in row order.
+
+        Returns:
+            array: Row numbers at positions start to stop of the salary index
+        """
+        return self._sorted_rows[start:stop]
+
+    def count_salary_greater_than(self, salary):
+        """
+        Returns the number of employees paid more than salary.
+        """
+        start, stop = self.salary_bounds('>', salary)
+        return stop - start
+
+    def salary_greater_than(self, salary):
+        """
+        Returns the employees paid more than salary.
+
+        Returns:
+            list: EmployeeRow views in ascending salary order
+        """
+        start, stop = self.salary_bounds('>', salary)
+        return [EmployeeRow(self, index) for index in self._sorted_rows[start:stop]]
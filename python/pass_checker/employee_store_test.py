@@ -0,0 +1,175 @@
+import math
+import random
+import unittest
+
+import data
+from employee_store import EmployeeRow, EmployeeStore
+
+
+class TestEmployeeStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = EmployeeStore(data.employeeList)
+
+    def test_rows(self):
+        self.assertEqual(len(self.store), len(data.employeeList))
+        self.assertEqual([str(row) for row in self.store],
+                         [str(employee) for employee in data.employeeList])
+        row = self.store[-1]
+        self.assertEqual((row.name, row.age, row.salary), ("Emily", 60, 120000))
+        self.assertFalse(hasattr(row, '__dict__'))
+        with self.assertRaises(IndexError):
+            self.store[len(self.store)]
+
+    def test_salary_queries_match_data_module(self):
+        self.assertEqual(self.store.max_salary(), data.get_maximum_salary())
+        for salary in [0, 50000, 75000, 100000, 120000]:
+            with self.subTest(salary=salary):
+                expected = [employee.name for employee in
+                            data.get_employees_with_salary_greater_than(salary)]
+                rows = self.store.salary_greater_than(salary)
+                self.assertEqual(sorted(row.name for row in rows), sorted(expected))
+                self.assertEqual(self.store.count_salary_greater_than(salary), len(expected))
+
+    def test_append_keeps_index_sorted(self):
+        row = self.store.append("Zoe", 28, 130000)
+        self.assertEqual(self.store.max_salary(), 130000)
+        self.store.append("Max", 22, 40000)
+        self.store.append("Ann", 33, 70000)
+        self.assertEqual(self.store.min_salary(), 40000)
+        self.assertEqual([row.name for row in self.store.salary_greater_than(60000)],
+                         ["Bob", "Ann", "Alice", "Mike", "Sarah", "Tom", "Emily", "Zoe"])
+        self.assertEqual(row, EmployeeRow(self.store, len(self.store) - 3))
+
+    def assertAggregatesMatch(self, store):
+        salaries = [row.salary for row in store]
+        stats = store.salary_stats()
+        self.assertEqual(stats['count'], len(salaries))
+        self.assertEqual(stats['total'], math.fsum(salaries))
+        self.assertEqual((stats['min'], stats['max']),
+                         (min(salaries, default=None), max(salaries, default=None)))
+        buckets = {}
+        for salary in salaries:
+            bucket = salary // store.bucket_width * store.bucket_width
+            buckets[bucket] = buckets.get(bucket, 0) + 1
+        self.assertEqual(store.salary_histogram(), dict(sorted(buckets.items())))
+        self.assertEqual(store.count_salary_greater_than(-10 ** 9), len(salaries))
+        self.assertEqual([row.index for row in store.salary_greater_than(-10 ** 9)],
+                         sorted((row.index for row in store), key=lambda i: store.salaries[i]))
+
+    def test_mutations_keep_aggregates(self):
+        rng = random.Random(7)
+        store = EmployeeStore.from_columns(["a"] * 50, [30] * 50,
+                                           [rng.randrange(-3, 10) * 5000 for _ in range(50)])
+        for _ in range(500):
+            rows = [row.index for row in store]
+            action = rng.random()
+            if action < 0.3 or not rows:
+                store.hire("new", 25, rng.randrange(-3, 10) * 5000)
+            elif action < 0.7:
+                store.give_raise(rng.choice(rows), rng.randrange(-2, 3) * 5000)
+            else:
+                store.terminate(rng.choice(rows))
+        self.assertAggregatesMatch(store)
+        store.extend(data.employeeList)
+        self.assertAggregatesMatch(store)
+
+    def test_terminate(self):
+        self.store.terminate(0)
+        self.assertEqual(len(self.store), len(data.employeeList) - 1)
+        self.assertEqual(self.store.min_salary(), 60000)
+        self.assertEqual(self.store.salary_stats()['mean'],
+                         sum(e.salary for e in data.employeeList[1:]) / 7)
+        with self.assertRaisesRegex(IndexError, "terminated"):
+            self.store[0]
+        with self.assertRaises(IndexError):
+            self.store.give_raise(0, 1000)
+        self.store.set_salary(1, -500)
+        self.assertEqual(self.store.min_salary(), -500)
+        self.assertEqual(self.store.salary_histogram()[-10000], 1)
+        self.store.reindex()
+        self.assertAggregatesMatch(self.store)
+
+    def test_negative_indexes_skip_terminated_rows(self):
+        last = len(self.store.names) - 1
+        self.store.terminate(last)
+        self.store.terminate(1)
+        rows = list(self.store)
+        for position in range(1, len(rows) + 1):
+            self.assertEqual(self.store[-position], rows[-position])
+        with self.assertRaises(IndexError):
+            self.store[-len(rows) - 1]
+        self.store.give_raise(-1, 1000)
+        self.assertEqual(self.store[last - 1].salary, data.employeeList[last - 1].salary + 1000)
+        with self.assertRaisesRegex(IndexError, "terminated"):
+            self.store[last]
+
+    def test_from_columns(self):
+        store = EmployeeStore.from_columns(["a", "b", "c"], [30, 40, 50], [-10.5, 0, 99.5])
+        self.assertEqual(store.max_salary(), 99.5)
+        self.assertEqual(store.min_salary(), -10.5)
+        self.assertEqual([row.name for row in store.salary_greater_than(-20)], ["a", "b", "c"])
+        with self.assertRaises(ValueError):
+            EmployeeStore.from_columns(["a"], [1, 2], [3])
+
+    def test_total_does_not_drift(self):
+        store = EmployeeStore()
+        rows = [store.hire("a", 30, 0.1) for _ in range(10)]
+        self.assertEqual(store.total_salary(), 1.0)
+        for row in rows:
+            store.terminate(row.index)
+        self.assertEqual(store.salary_stats()['total'], 0.0)
+
+        store.extend_columns(["a"] * 3, [30] * 3, [1e16, 1.0, -1e16])
+        store.give_raise(len(store.names) - 1, 0.1)
+        store.set_salary(len(store.names) - 2, 0.2)
+        self.assertEqual(store.total_salary(), math.fsum([1e16, 0.2, -1e16 + 0.1]))
+
+    def test_rejects_non_finite_salaries(self):
+        store = EmployeeStore(data.employeeList)
+        before = store.salary_stats()
+        for salary in (math.nan, math.inf, -math.inf):
+            with self.subTest(salary=salary):
+                with self.assertRaisesRegex(ValueError, "finite"):
+                    store.append("a", 30, salary)
+                with self.assertRaisesRegex(ValueError, "finite"):
+                    store.set_salary(0, salary)
+                with self.assertRaisesRegex(ValueError, "finite"):
+                    store.extend_columns(["a", "b"], [30, 40], [1000, salary])
+        self.assertEqual(len(store.names), len(data.employeeList))
+        self.assertEqual(store.salary_stats(), before)
+        self.assertAggregatesMatch(store)
+
+    def test_truncate(self):
+        store = EmployeeStore(data.employeeList)
+        before = (list(store.names), store.salary_stats(), store.salary_histogram(),
+                  store.rows_by_salary())
+        store.extend_columns(["a", "b", "c"], [30, 40, 50], [0.1, 250000, 0.2])
+        store.terminate(len(store.names) - 2)
+        store.truncate(len(data.employeeList))
+        self.assertEqual((store.names, store.salary_stats(), store.salary_histogram(),
+                          store.rows_by_salary()), before)
+        self.assertAggregatesMatch(store)
+
+    def test_bad_columns_add_nothing(self):
+        store = EmployeeStore(data.employeeList)
+        for ages, salaries in [([30, 2 ** 40], [1, 2]), ([30, 40], [1, "x"])]:
+            with self.subTest(ages=ages, salaries=salaries):
+                with self.assertRaises((OverflowError, TypeError)):
+                    store.extend_columns(["a", "b"], ages, salaries)
+                self.assertEqual(len(store.names), len(data.employeeList))
+                self.assertEqual((len(store.ages), len(store.salaries), len(store.active)),
+                                 (len(store.names),) * 3)
+        self.assertAggregatesMatch(store)
+
+    def test_empty(self):
+        store = EmployeeStore()
+        self.assertEqual(store.salary_stats(), {'count': 0, 'total': 0.0, 'mean': None,
+                                                'min': None, 'max': None})
+        self.assertIsNone(store.max_salary())
+        self.assertIsNone(store.min_salary())
+        self.assertEqual(store.salary_greater_than(0), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,76 +1,104 @@
 import re
 
-def validate_password(password):
-    if len(password) < 8:
-        return False
+from policy import (ALL_RULES, CHAR_RULES, RULE_DIGIT, RULE_LOWER, RULE_MAX_LENGTH,
+                    RULE_MIN_LENGTH, RULE_NAMES, RULE_SPECIAL, RULE_UPPER, PasswordPolicy,
+                    ValidationResult, Violation, failed_rules)
 
-    if len(password) > 16:
-        return False
+MIN_LENGTH = 8
+MAX_LENGTH = 16
+SPECIAL_CHARS = "!@#$%^&*()-_=+[{]}\\|;:'\",<.>/?`~"
 
-    if not any(char.isdigit() for char in password):
-        return False
+# The rules above, compiled once; other policies can be built with PasswordPolicy
+DEFAULT_POLICY = PasswordPolicy(MIN_LENGTH, MAX_LENGTH, special_chars=SPECIAL_CHARS)
 
-    if not any(char.isupper() for char in password):
-        return False
+# Rules in the order they are reported, with their failure messages
+RULE_MESSAGES = DEFAULT_POLICY.rule_messages
 
-    if not any(char.islower() for char in password):
-        return False
+# Single-pass bitmask check and its interpretation; see PasswordPolicy.check
+check_password = DEFAULT_POLICY.check
+failure_reason = DEFAULT_POLICY.failure_reason
+
+# Every failed rule as Violation codes, without raising; see PasswordPolicy.evaluate
+evaluate_password = DEFAULT_POLICY.evaluate
 
-    # check for special chars:
-    special_chars = "!@#$%^&*()-_=+[{]}\|;:'\",<.>/?`~"
-    if not any(char in special_chars for char in password):
+BREACHED_MESSAGE = DEFAULT_POLICY.violation_messages[Violation.BREACHED]
+
+
+def validate_password(password, breached=None):
+    """
+    Returns True if the password passes every rule. If breached is given (any
+    container of known-compromised passwords, such as a breach.BreachedIndex),
+    passwords that pass the other rules must also not be in it.
+    """
+    if check_password(password) != ALL_RULES:
         return False
+    return breached is None or password not in breached
 
-    return True
 
+def validate_password_and_raise_reason(password, breached=None):
+    result = evaluate_password(password, breached)
+    if not result:
+        raise ValueError(result.reason)
 
-def validate_password_and_raise_reason(password):
-    if len(password) < 8:
-        raise ValueError("Password must be at least 8 characters long")
+    return True  # Password is valid if no exceptions were raised
 
-    if len(password) > 16:
-        raise ValueError("Password must not exceed 16 characters")
 
-    if not any(char.isdigit() for char in password):
-        raise ValueError("Password must contain at least one digit")
+def password_strength(password):
+    """
+    Estimates how hard a password is to guess; see strength.estimate_strength.
+    The estimator and its dictionaries are only loaded on the first call.
+    """
+    from strength import estimate_strength
+    return estimate_strength(password)
 
-    if not any(char.isupper() for char in password):
-        raise ValueError("Password must contain at least one uppercase letter")
 
-    if not any(char.islower() for char in password):
-        raise ValueError("Password must contain at least one lowercase letter")
+# Compiled once instead of on every call
+_DIGIT_PATTERN = re.compile(r"\d")
+_UPPER_PATTERN = re.compile(r"[A-Z]")
+_LOWER_PATTERN = re.compile(r"[a-z]")
+_SPECIAL_PATTERN = re.compile(r"[!@#$%^&*()-_=+\[{\]}\|;:'\",<.>/?`~]")
 
-    # check for special chars:
-    special_chars = "!@#$%^&*()-_=+[{]}\|;:'\",<.>/?`~"
-    if not any(char in special_chars for char in password):
-        raise ValueError(f"Password must contain at least one special character from: {special_chars}")
 
-    return True  # Password is valid if no exceptions were raised
+_REGEX_MESSAGES = {
+    Violation.MIN_LENGTH: "Password must be at least 8 characters long",
+    Violation.MAX_LENGTH: "Password must not exceed 16 characters",
+    Violation.DIGIT: "Password must contain at least one digit",
+    Violation.UPPER: "Password must contain at least one uppercase letter",
+    Violation.LOWER: "Password must contain at least one lowercase letter",
+    Violation.SPECIAL: "Password must contain at least one special character from: !@#$%^&*()-_=+[{}]\\|;:'\",<.>/?`~",
+}
 
 
+def evaluate_password_regex(password):
+    """
+    Finds every rule the password fails using the regular expressions above.
 
-def validate_password_and_raise_reason_regex(password):
+    Returns:
+        ValidationResult: The violations, true if there are none
+    """
+    violations = []
     # Check length
     if len(password) < 8:
-        raise ValueError("Password must be at least 8 characters long")
+        violations.append(Violation.MIN_LENGTH)
     if len(password) > 16:
-        raise ValueError("Password must not exceed 16 characters")
+        violations.append(Violation.MAX_LENGTH)
 
-    # Check for at least one digit
-    if not re.search(r"\d", password):
-        raise ValueError("Password must contain at least one digit")
+    # Check for at least one digit, uppercase letter, lowercase letter and special character
+    if not _DIGIT_PATTERN.search(password):
+        violations.append(Violation.DIGIT)
+    if not _UPPER_PATTERN.search(password):
+        violations.append(Violation.UPPER)
+    if not _LOWER_PATTERN.search(password):
+        violations.append(Violation.LOWER)
+    if not _SPECIAL_PATTERN.search(password):
+        violations.append(Violation.SPECIAL)
 
-    # Check for at least one uppercase letter
-    if not re.search(r"[A-Z]", password):
-        raise ValueError("Password must contain at least one uppercase letter")
+    return ValidationResult(tuple(violations), _REGEX_MESSAGES)
 
-    # Check for at least one lowercase letter
-    if not re.search(r"[a-z]", password):
-        raise ValueError("Password must contain at least one lowercase letter")
 
-    # Check for special characters
-    special_chars = r"[!@#$%^&*()-_=+\[{\]}\|;:'\",<.>/?`~]"
-    if not re.search(special_chars, password):
-        raise ValueError(f"Password must contain at least one special character from: !@#$%^&*()-_=+[{{}}]\\|;:'\",<.>/?`~")
+def validate_password_and_raise_reason_regex(password):
+    result = evaluate_password_regex(password)
+    if not result:
+        raise ValueError(result.reason)
 
     return True  # Password is valid if no exceptions were raised
@@ -1,5 +1,9 @@
 import unittest
-from password_checker import validate_password, validate_password_and_raise_reason
+from password_checker import (ALL_RULES, RULE_DIGIT, RULE_LOWER, RULE_MAX_LENGTH, RULE_MIN_LENGTH,
+                              RULE_SPECIAL, RULE_UPPER, Violation, check_password,
+                              evaluate_password, evaluate_password_regex, validate_password,
+                              validate_password_and_raise_reason,
+                              validate_password_and_raise_reason_regex)
 
 class TestPasswordValidator(unittest.TestCase):
 
@@ -92,7 +96,91 @@ class TestPasswordValidatorWithExceptions(unittest.TestCase):
         special_chars = "!@#$%^&*()-_=+[{]}\\|;:'\",<.>/?`~"
         for char in special_chars:
             self.assertTrue(validate_password_and_raise_reason(f"ValidPass1{char}"))
-            
+
+
+class TestCheckPassword(unittest.TestCase):
+
+    def test_valid_password(self):
+        self.assertEqual(check_password("P@ssw0rd"), ALL_RULES)
+
+    def test_each_rule(self):
+        self.assertEqual(check_password("Sh0rt!"), ALL_RULES & ~RULE_MIN_LENGTH)
+        self.assertEqual(check_password("ThisPasswordIsWayTooLong123!"), ALL_RULES & ~RULE_MAX_LENGTH)
+        self.assertEqual(check_password("NoDigitsHere!"), ALL_RULES & ~RULE_DIGIT)
+        self.assertEqual(check_password("nouppercase123!"), ALL_RULES & ~RULE_UPPER)
+        self.assertEqual(check_password("NOLOWERCASE123!"), ALL_RULES & ~RULE_LOWER)
+        self.assertEqual(check_password("NoSpecialChar123"), ALL_RULES & ~RULE_SPECIAL)
+
+    def test_several_failures(self):
+        self.assertEqual(check_password(""), RULE_MAX_LENGTH)
+        self.assertEqual(check_password("abc"), RULE_MAX_LENGTH | RULE_LOWER)
+
+    def test_unicode(self):
+        # Classified with the str methods, like the original any() checks
+        self.assertEqual(check_password("Ünïcödé²!"), ALL_RULES)
+        self.assertTrue(validate_password("ΣίγμαΣ1!"))
+        self.assertFalse(validate_password("ΣΊΓΜΑΣ1!"))
+
+
+class TestEvaluatePassword(unittest.TestCase):
+
+    def test_valid_password(self):
+        result = evaluate_password("P@ssw0rd")
+        self.assertTrue(result)
+        self.assertTrue(result.valid)
+        self.assertEqual((result.violations, result.reason, result.messages), ((), None, []))
+
+    def test_all_violations(self):
+        result = evaluate_password("abc")
+        self.assertFalse(result)
+        self.assertEqual(result.violations, (Violation.MIN_LENGTH, Violation.DIGIT,
+                                             Violation.UPPER, Violation.SPECIAL))
+        self.assertEqual(result.reason, "Password must be at least 8 characters long")
+        self.assertEqual(len(result.messages), 4)
+
+    def test_breached(self):
+        breached = {"P@ssw0rd", "abc"}
+        self.assertEqual(evaluate_password("P@ssw0rd", breached).violations, (Violation.BREACHED,))
+        self.assertEqual(evaluate_password("abc", breached).violations[-1], Violation.BREACHED)
+        self.assertTrue(evaluate_password("Abcd1234!", breached))
+
+    def test_reason_matches_raising_wrappers(self):
+        for password in ["", "Sh0rt!", "ThisPasswordIsWayTooLong123!", "NoDigitsHere!",
+                         "nouppercase123!", "NOLOWERCASE123!", "nospecialchar"]:
+            for evaluate, validate in [(evaluate_password, validate_password_and_raise_reason),
+                                       (evaluate_password_regex,
+                                        validate_password_and_raise_reason_regex)]:
+                with self.subTest(password=password, evaluate=evaluate.__name__):
+                    with self.assertRaises(ValueError) as raised:
+                        validate(password)
+                    self.assertEqual(evaluate(password).reason, str(raised.exception))
+
+    def test_regex_violations(self):
+        self.assertTrue(evaluate_password_regex("P@ssw0rd"))
+        # The special character pattern's ")-_" range also matches uppercase letters
+        self.assertEqual(evaluate_password_regex("ABCDEFGHIJKLMNOPQ").violations,
+                         (Violation.MAX_LENGTH, Violation.DIGIT, Violation.LOWER))
+
+
+class TestPasswordValidatorRegex(unittest.TestCase):
+
+    def test_valid_password(self):
+        self.assertTrue(validate_password_and_raise_reason_regex("P@ssw0rd"))
+        self.assertTrue(validate_password_and_raise_reason_regex("Abcd1234!"))
+
+    def test_failures(self):
+        cases = [
+            ("Sh0rt!", "at least 8 characters"),
+            ("ThisPasswordIsWayTooLong123!", "must not exceed 16 characters"),
+            ("NoDigitsHere!", "digit"),
+            ("nouppercase123!", "uppercase"),
+            ("NOLOWERCASE123!", "lowercase"),
+        ]
+        for password, reason in cases:
+            with self.subTest(password=password):
+                with self.assertRaisesRegex(ValueError, reason):
+                    validate_password_and_raise_reason_regex(password)
+
 
 if __name__ == '__main__':
     unittest.main()
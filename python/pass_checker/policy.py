@@ -0,0 +1,342 @@
+# Declarative password policies
+#
+# A PasswordPolicy holds the length bounds, which character classes are
+# required and the special characters, and can be loaded from a dict, JSON
+# or TOML. It is compiled once, when it is created, into a 256-entry table
+# of rule bits per character, so checking a password is a single pass with
+# no strings or regexes built per call. Create one policy per tenant and
+# reuse it.
+
+import enum
+import json
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# Rule bits returned by PasswordPolicy.check
+RULE_MIN_LENGTH = 1 << 0
+RULE_MAX_LENGTH = 1 << 1
+RULE_DIGIT = 1 << 2
+RULE_UPPER = 1 << 3
+RULE_LOWER = 1 << 4
+RULE_SPECIAL = 1 << 5
+CHAR_RULES = RULE_DIGIT | RULE_UPPER | RULE_LOWER | RULE_SPECIAL
+ALL_RULES = RULE_MIN_LENGTH | RULE_MAX_LENGTH | CHAR_RULES
+
+# Short rule names, in the order rules are reported
+RULE_NAMES = (
+    (RULE_MIN_LENGTH, "min_length"),
+    (RULE_MAX_LENGTH, "max_length"),
+    (RULE_DIGIT, "digit"),
+    (RULE_UPPER, "upper"),
+    (RULE_LOWER, "lower"),
+    (RULE_SPECIAL, "special"),
+)
+
+
+class Violation(enum.IntEnum):
+    """
+    Codes for failed rules, in the order they are reported. The value of
+    each composition rule's code is its RULE_* bit.
+    """
+    MIN_LENGTH = RULE_MIN_LENGTH
+    MAX_LENGTH = RULE_MAX_LENGTH
+    DIGIT = RULE_DIGIT
+    UPPER = RULE_UPPER
+    LOWER = RULE_LOWER
+    SPECIAL = RULE_SPECIAL
+    # Found in a breached-password list; not a bit in check() bitmasks
+    BREACHED = 1 << 6
+
+
+# The violations of every check() bitmask, in report order
+_VIOLATIONS = tuple(
+    tuple(Violation(rule) for rule, _ in RULE_NAMES if not passed & rule)
+    for passed in range(ALL_RULES + 1)
+)
+
+DEFAULT_SPECIAL_CHARS = "!@#$%^&*()-_=+[{]}\\|;:'\",<.>/?`~"
+
+# Message templates; {min_length}, {max_length} and {special_chars} are filled in
+DEFAULT_MESSAGES = {
+    "min_length": "Password must be at least {min_length} characters long",
+    "max_length": "Password must not exceed {max_length} characters",
+    "digit": "Password must contain at least one digit",
+    "upper": "Password must contain at least one uppercase letter",
+    "lower": "Password must contain at least one lowercase letter",
+    "special": "Password must contain at least one special character from: {special_chars}",
+    "breached": "Password has appeared in a data breach",
+}
+
+_REQUIRE_OPTIONS = (
+    ("require_digit", RULE_DIGIT),
+    ("require_upper", RULE_UPPER),
+    ("require_lower", RULE_LOWER),
+    ("require_special", RULE_SPECIAL),
+)
+
+
+class ValidationResult:
+    """
+    Every rule a password fails, found without raising.
+
+    A result is true when the password is valid, so it can be used directly
+    in an if statement.
+
+    Attributes:
+        violations (tuple): The Violation codes, in the order rules are reported.
+    """
+    __slots__ = ('violations', '_messages')
+
+    def __init__(self, violations, messages):
+        self.violations = violations
+        self._messages = messages
+
+    @property
+    def valid(self):
+        return not self.violations
+
+    def __bool__(self):
+        return not self.violations
+
+    @property
+    def reason(self):
+        """
+        The message for the first violation, as raised by the
+        validate_password_and_raise_reason functions, or None if valid.
+        """
+        return self._messages[self.violations[0]] if self.violations else None
+
+    @property
+    def messages(self):
+        """
+        The message for every violation.
+        """
+        return [self._messages[violation] for violation in self.violations]
+
+    def __repr__(self):
+        return f"ValidationResult({', '.join(violation.name for violation in self.violations)})"
+
+
+class PasswordPolicy:
+    """
+    A compiled set of password rules.
+
+    Rules that a policy does not require are always reported as passed, so a
+    password is valid when check() returns ALL_RULES, whatever the policy.
+
+    Attributes:
+        min_length (int): Minimum number of characters.
+        max_length (int or None): Maximum number of characters, or None for no limit.
+        require_digit (bool): Whether a digit is required.
+        require_upper (bool): Whether an uppercase letter is required.
+        require_lower (bool): Whether a lowercase letter is required.
+        require_special (bool): Whether a character from special_chars is required.
+        special_chars (str): The characters that count as special.
+        messages (dict): Failure message for each rule name.
+        rule_messages (tuple): (rule bit, message) pairs in the order rules are reported.
+        char_rules (int): Bits of the character rules this policy requires.
+    """
+    def __init__(self, min_length=8, max_length=16, require_digit=True, require_upper=True,
+                 require_lower=True, require_special=True, special_chars=DEFAULT_SPECIAL_CHARS,
+                 messages=None):
+        if min_length < 0 or (max_length is not None and max_length < min_length):
+            raise ValueError(f"Invalid length bounds: {min_length} to {max_length}")
+        unknown = set(messages or ()) - set(DEFAULT_MESSAGES)
+        if unknown:
+            raise ValueError(f"Unknown rules in messages: {', '.join(sorted(unknown))}")
+
+        self.min_length = min_length
+        self.max_length = max_length
+        self.require_digit = require_digit
+        self.require_upper = require_upper
+        self.require_lower = require_lower
+        self.require_special = require_special
+        self.special_chars = special_chars
+
+        templates = dict(DEFAULT_MESSAGES, **(messages or {}))
+        self.messages = {
+            name: template.format(min_length=min_length, max_length=max_length,
+                                  special_chars=special_chars)
+            for name, template in templates.items()
+        }
+        self.rule_messages = tuple((rule, self.messages[name]) for rule, name in RULE_NAMES)
+        self.violation_messages = {violation: self.messages[violation.name.lower()]
+                                   for violation in Violation}
+
+        # Compile: which rules are checked per character, which always pass,
+        # and the rule bits of every Latin-1 character
+        self.char_rules = 0
+        for option, rule in _REQUIRE_OPTIONS:
+            if getattr(self, option):
+                self.char_rules |= rule
+        self._always_passed = CHAR_RULES & ~self.char_rules
+        if max_length is None:
+            self._always_passed |= RULE_MAX_LENGTH
+        self._special_set = frozenset(special_chars)
+        self._classes = tuple(self.classify(chr(code)) for code in range(256))
+        self._valid_result = ValidationResult((), self.violation_messages)
+
+    @classmethod
+    def from_dict(cls, config):
+        """
+        Creates a policy from a dict of the constructor's keyword arguments.
+
+        Raises:
+            ValueError: If the dict has keys that are not policy options
+        """
+        options = ('min_length', 'max_length', 'special_chars', 'messages') + tuple(
+            option for option, _ in _REQUIRE_OPTIONS)
+        unknown = set(config) - set(options)
+        if unknown:
+            raise ValueError(f"Unknown policy options: {', '.join(sorted(unknown))}")
+        return cls(**config)
+
+    @classmethod
+    def from_json(cls, text):
+        """
+        Creates a policy from a JSON object.
+        """
+        return cls.from_dict(json.loads(text))
+
+    @classmethod
+    def from_toml(cls, text):
+        """
+        Creates a policy from a TOML document.
+
+        Raises:
+            ImportError: If no TOML parser is available (Python < 3.11 without tomli)
+        """
+        if tomllib is None:
+            raise ImportError("Reading TOML needs Python 3.11+ or the tomli package")
+        return cls.from_dict(tomllib.loads(text))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Creates a policy from a .json or .toml file.
+        """
+        with open(path, encoding='utf-8') as config_file:
+            text = config_file.read()
+        if path.endswith('.toml'):
+            return cls.from_toml(text)
+        return cls.from_json(text)
+
+    def to_dict(self):
+        """
+        Returns the policy's options, as accepted by from_dict.
+        """
+        config = {
+            'min_length': self.min_length,
+            'max_length': self.max_length,
+            'special_chars': self.special_chars,
+        }
+        for option, _ in _REQUIRE_OPTIONS:
+            config[option] = getattr(self, option)
+        return config
+
+    def classify(self, char):
+        """
+        Returns the bits of the required character rules that one character satisfies.
+        """
+        bits = 0
+        if char.isdigit():
+            bits |= RULE_DIGIT
+        if char.isupper():
+            bits |= RULE_UPPER
+        if char.islower():
+            bits |= RULE_LOWER
+        if char in self._special_set:
+            bits |= RULE_SPECIAL
+        return bits & self.char_rules
+
+    def check(self, password):
+        """
+        Checks every rule in a single pass over the password.
+
+        Returns:
+            int: A bitmask of the RULE_* bits for the rules the password passes;
+                 the password is valid if it equals ALL_RULES
+        """
+        length = len(password)
+        passed = self._always_passed
+        if length >= self.min_length:
+            passed |= RULE_MIN_LENGTH
+        if self.max_length is not None and length <= self.max_length:
+            passed |= RULE_MAX_LENGTH
+
+        char_rules = self.char_rules
+        if char_rules:
+            classes = self._classes
+            seen = 0
+            for char in password:
+                code = ord(char)
+                seen |= classes[code] if code < 256 else self.classify(char)
+                if seen == char_rules:
+                    break
+            passed |= seen
+        return passed
+
+    def failure_reason(self, passed):
+        """
+        Returns the message for the first rule missing from a check() bitmask,
+        or None if every rule passed.
+        """
+        for rule, message in self.rule_messages:
+            if not passed & rule:
+                return message
+        return None
+
+    def evaluate(self, password, breached=None):
+        """
+        Finds every rule the password fails in a single pass.
+
+        Args:
+            password (str): The password to check
+            breached: Optional container of known-compromised passwords,
+                      such as a breach.BreachedIndex
+
+        Returns:
+            ValidationResult: The violations, true if there are none
+        """
+        violations = _VIOLATIONS[self.check(password)]
+        if breached is not None and password in breached:
+            violations += (Violation.BREACHED,)
+        if not violations:
+            return self._valid_result
+        return ValidationResult(violations, self.violation_messages)
+
+    def validate(self, password):
+        """
+        Returns True if the password passes every rule.
+        """
+        return self.check(password) == ALL_RULES
+
+    def validate_and_raise_reason(self, password):
+        """
+        Returns True if the password passes every rule.
+
+        Raises:
+            ValueError: With the message of the first rule it fails
+        """
+        result = self.evaluate(password)
+        if not result:
+            raise ValueError(result.reason)
+        return True
+
+    def __repr__(self):
+        options = ', '.join(f"{key}={value!r}" for key, value in self.to_dict().items())
+        return f"PasswordPolicy({options})"
+
+
+def failed_rules(passed):
+    """
+    Returns the names of every rule missing from a check() bitmask,
+    in the order they are reported.
+    """
+    return [name for rule, name in RULE_NAMES if not passed & rule]
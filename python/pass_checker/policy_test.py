@@ -0,0 +1,102 @@
+import json
+import os
+import tempfile
+import unittest
+
+from password_checker import (DEFAULT_POLICY, MAX_LENGTH, MIN_LENGTH, SPECIAL_CHARS,
+                              validate_password_and_raise_reason)
+from policy import (ALL_RULES, RULE_DIGIT, RULE_MAX_LENGTH, RULE_SPECIAL, PasswordPolicy,
+                    Violation, failed_rules)
+
+
+class TestPasswordPolicy(unittest.TestCase):
+
+    def test_default_policy_matches_module_constants(self):
+        self.assertEqual(DEFAULT_POLICY.min_length, MIN_LENGTH)
+        self.assertEqual(DEFAULT_POLICY.max_length, MAX_LENGTH)
+        self.assertEqual(DEFAULT_POLICY.special_chars, SPECIAL_CHARS)
+
+    def test_validate(self):
+        policy = PasswordPolicy()
+        self.assertTrue(policy.validate("P@ssw0rd"))
+        self.assertFalse(policy.validate("Password1"))
+        self.assertFalse(policy.validate("P@ssw0rd" * 3))
+
+    def test_reason_matches_module_function(self):
+        for password in ["", "Sh0rt!", "ThisPasswordIsWayTooLong123!", "Password!",
+                         "password1!", "PASSWORD1!", "Password123"]:
+            with self.subTest(password=password):
+                with self.assertRaises(ValueError) as expected:
+                    validate_password_and_raise_reason(password)
+                with self.assertRaises(ValueError) as actual:
+                    DEFAULT_POLICY.validate_and_raise_reason(password)
+                self.assertEqual(str(actual.exception), str(expected.exception))
+
+    def test_optional_rules_always_pass(self):
+        policy = PasswordPolicy(min_length=4, max_length=None, require_special=False,
+                                require_upper=False)
+        self.assertEqual(policy.check("abc1"), ALL_RULES)
+        self.assertEqual(policy.check("abc1" * 100), ALL_RULES)
+        self.assertEqual(failed_rules(policy.check("abcd")), ["digit"])
+
+    def test_evaluate_uses_policy_messages(self):
+        policy = PasswordPolicy(require_special=False,
+                                messages={'digit': "Add a digit", 'breached': "Leaked"})
+        result = policy.evaluate("Password", breached={"Password"})
+        self.assertEqual(result.violations, (Violation.DIGIT, Violation.BREACHED))
+        self.assertEqual(result.messages, ["Add a digit", "Leaked"])
+        self.assertIs(policy.evaluate("Passw0rd"), policy.evaluate("Abcdefg1"))
+
+    def test_custom_special_chars(self):
+        policy = PasswordPolicy(special_chars="#")
+        self.assertEqual(policy.check("Passw0rd#"), ALL_RULES)
+        self.assertFalse(policy.check("Passw0rd!") & RULE_SPECIAL)
+
+    def test_non_latin1_characters(self):
+        policy = PasswordPolicy(special_chars="€")
+        self.assertTrue(policy.validate("Passw0rd€"))
+        self.assertTrue(policy.check("Passwórd٣!") & RULE_DIGIT)
+
+    def test_custom_messages(self):
+        policy = PasswordPolicy(max_length=10,
+                                messages={"max_length": "At most {max_length} characters"})
+        self.assertEqual(policy.failure_reason(ALL_RULES & ~RULE_MAX_LENGTH),
+                         "At most 10 characters")
+        self.assertIsNone(policy.failure_reason(ALL_RULES))
+
+    def test_from_dict_rejects_unknown_options(self):
+        with self.assertRaises(ValueError):
+            PasswordPolicy.from_dict({"min_len": 8})
+        with self.assertRaises(ValueError):
+            PasswordPolicy.from_dict({"messages": {"length": "Too short"}})
+
+    def test_invalid_length_bounds(self):
+        with self.assertRaises(ValueError):
+            PasswordPolicy(min_length=10, max_length=8)
+
+    def test_from_json_round_trip(self):
+        policy = PasswordPolicy(min_length=12, max_length=64, require_special=False)
+        loaded = PasswordPolicy.from_json(json.dumps(policy.to_dict()))
+        self.assertEqual(loaded.to_dict(), policy.to_dict())
+
+    def test_from_toml(self):
+        policy = PasswordPolicy.from_toml('min_length = 12\nspecial_chars = "!?"\n'
+                                          '[messages]\nspecial = "Use ! or ?"\n')
+        self.assertEqual(policy.min_length, 12)
+        self.assertTrue(policy.validate("LongerPassw0rd?"))
+        with self.assertRaisesRegex(ValueError, "Use ! or \\?"):
+            policy.validate_and_raise_reason("LongerPassw0rd#")
+
+    def test_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for name, text in [("tenant.json", '{"min_length": 10}'),
+                               ("tenant.toml", "min_length = 10")]:
+                path = os.path.join(directory, name)
+                with open(path, "w") as config_file:
+                    config_file.write(text)
+                with self.subTest(name=name):
+                    self.assertEqual(PasswordPolicy.load(path).min_length, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
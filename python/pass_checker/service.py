@@ -0,0 +1,506 @@
+# Asyncio password validation service
+#
+# One shared endpoint for password checks, speaking two protocols on the
+# same port. Line protocol clients send one command per line; replies come
+# back in order, and commands may be pipelined:
+#
+#     CHECK <password>     "OK VALID", or "OK INVALID <rule,...> <reason>"
+#                          where <reason> is the message
+#                          validate_password_and_raise_reason raises
+#     STATS                Counters and latency percentiles
+#     QUIT                 Close the connection
+#
+# HTTP clients can use:
+#
+#     POST /validate       {"password": "..."} or {"passwords": [...]}
+#     GET /stats           Counters and histograms as JSON
+#     GET /metrics         The same in Prometheus text format
+#
+# Concurrent checks are micro-batched: they are collected until a batch has
+# max_batch passwords or the oldest has waited max_delay seconds, and each
+# batch is validated in one call on a worker pool.
+#
+#     python service.py --port 8765 --workers 4
+
+import argparse
+import asyncio
+import bisect
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from password_checker import ALL_RULES, check_password, failed_rules, failure_reason
+
+DEFAULT_MAX_BATCH = 256
+DEFAULT_MAX_DELAY = 0.002
+
+# Line protocol commands a connection may have waiting for their replies;
+# reading from a client that does not read its replies pauses at this many
+MAX_PIPELINED = 1024
+
+# Largest HTTP request body accepted, in bytes
+MAX_BODY_SIZE = 1 << 20
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, float('inf'))
+
+HTTP_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                413: 'Payload Too Large'}
+
+
+def check_passwords(passwords):
+    """
+    Checks a batch of passwords. Runs on the worker pool.
+
+    Returns:
+        list: The check_password bitmask of each password
+    """
+    return [check_password(password) for password in passwords]
+
+
+def verdict(passed):
+    """
+    Turns a check_password bitmask into a JSON-serializable verdict.
+
+    Returns:
+        dict: valid, the failed rule names and the first failure's message
+    """
+    return {'valid': passed == ALL_RULES, 'failed': failed_rules(passed),
+            'reason': failure_reason(passed)}
+
+
+class LatencyHistogram:
+    """
+    Counts durations in the fixed LATENCY_BUCKETS.
+
+    Attributes:
+        counts (list): Number of durations per bucket.
+        count (int): Total number of durations.
+        total (float): Sum of all durations, in seconds.
+    """
+    def __init__(self):
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, seconds):
+        """
+        Adds one duration.
+        """
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def percentile(self, pct):
+        """
+        Returns the upper bound of the bucket holding the pct-th percentile,
+        or 0.0 if nothing was recorded.
+        """
+        if not self.count:
+            return 0.0
+        rank = pct / 100 * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return LATENCY_BUCKETS[-1]
+
+    def as_dict(self):
+        """
+        Returns the histogram as a JSON-serializable dict.
+        """
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'buckets': {('+Inf' if bound == float('inf') else repr(bound)): count
+                        for bound, count in zip(LATENCY_BUCKETS, self.counts)},
+            'p50': self.percentile(50),
+            'p99': self.percentile(99),
+        }
+
+
+class MicroBatcher:
+    """
+    Collects concurrent checks into batches for the worker pool.
+
+    Attributes:
+        max_batch (int): A batch is dispatched as soon as it has this many passwords.
+        max_delay (float): Seconds the first password of a batch waits at most.
+        batches (int): Batches dispatched.
+        passwords (int): Passwords checked.
+        batch_latency (LatencyHistogram): Time the worker pool took per batch.
+    """
+    def __init__(self, executor, max_batch=DEFAULT_MAX_BATCH, max_delay=DEFAULT_MAX_DELAY):
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+        self.passwords = 0
+        self.batch_latency = LatencyHistogram()
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+
+    async def check(self, password):
+        """
+        Checks one password as part of the next batch.
+
+        Returns:
+            int: Its check_password bitmask
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((password, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch):
+        start = time.perf_counter()
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self.executor, check_passwords, [password for password, _ in batch])
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        self.batch_latency.record(time.perf_counter() - start)
+        self.batches += 1
+        self.passwords += len(batch)
+        for (_, future), passed in zip(batch, results):
+            if not future.done():
+                future.set_result(passed)
+
+
+class ValidationService:
+    """
+    Serves password checks over the line protocol and HTTP.
+
+    Attributes:
+        host (str): Address to listen on.
+        port (int): Port to listen on; 0 picks a free port, which is stored
+                    here once the service has started.
+        batcher (MicroBatcher): Batches the checks for the worker pool.
+        requests (int): Line commands and HTTP requests handled.
+        request_latency (LatencyHistogram): Time from receiving a check to replying.
+    """
+    def __init__(self, host='127.0.0.1', port=0, executor=None, workers=None,
+                 max_batch=DEFAULT_MAX_BATCH, max_delay=DEFAULT_MAX_DELAY):
+        self.host = host
+        self.port = port
+        self._own_executor = executor is None
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        self.batcher = MicroBatcher(executor, max_batch, max_delay)
+        self.requests = 0
+        self.request_latency = LatencyHistogram()
+        self.started_at = None
+        self._server = None
+
+    async def start(self):
+        """
+        Starts listening for connections.
+        """
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.started_at = time.perf_counter()
+
+    async def serve_forever(self):
+        """
+        Starts the service if needed and serves until cancelled.
+        """
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """
+        Stops accepting connections and shuts down the worker pool if the
+        service created it.
+        """
+        self._server.close()
+        await self._server.wait_closed()
+        if self._own_executor:
+            self.batcher.executor.shutdown()
+
+    async def validate(self, password):
+        """
+        Checks one password through the batcher and records its latency.
+
+        Returns:
+            dict: The verdict()
+        """
+        start = time.perf_counter()
+        passed = await self.batcher.check(password)
+        self.request_latency.record(time.perf_counter() - start)
+        return verdict(passed)
+
+    def stats(self):
+        """
+        Returns the service-wide counters and histograms.
+        """
+        elapsed = time.perf_counter() - self.started_at if self.started_at else 0.0
+        batcher = self.batcher
+        return {
+            'requests': self.requests,
+            'passwords': batcher.passwords,
+            'batches': batcher.batches,
+            'mean_batch_size': batcher.passwords / batcher.batches if batcher.batches else 0.0,
+            'passwords_per_sec': batcher.passwords / elapsed if elapsed else 0.0,
+            'request_latency': self.request_latency.as_dict(),
+            'batch_latency': batcher.batch_latency.as_dict(),
+        }
+
+    def metrics(self):
+        """
+        Returns the counters and histograms in Prometheus text format.
+        """
+        stats = self.stats()
+        lines = []
+        for name in ('requests', 'passwords', 'batches'):
+            lines.append(f"# TYPE password_service_{name}_total counter")
+            lines.append(f"password_service_{name}_total {stats[name]}")
+        for name in ('request_latency', 'batch_latency'):
+            histogram = stats[name]
+            metric = f"password_service_{name}_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for bound, count in histogram['buckets'].items():
+                cumulative += count
+                lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+            lines.append(f"{metric}_sum {histogram['sum']}")
+            lines.append(f"{metric}_count {histogram['count']}")
+        return '\n'.join(lines) + '\n'
+
+    async def _handle_client(self, reader, writer):
+        try:
+            first = await reader.readline()
+            if first.startswith((b'GET ', b'POST ')):
+                await self._handle_http(first, reader, writer)
+            else:
+                await self._handle_lines(first, reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except ValueError:
+            # The first line was longer than the stream limit
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _handle_lines(self, line, reader, writer):
+        # Commands are handled concurrently, so pipelined checks can share a
+        # batch, and the replies are written back in order. At most MAX_PIPELINED
+        # commands are outstanding; reading waits for replies to be written.
+        replies = asyncio.Queue(MAX_PIPELINED)
+
+        async def write_replies():
+            while True:
+                reply = await replies.get()
+                if reply is None:
+                    return
+                try:
+                    reply = await reply
+                except Exception as error:
+                    reply = f"ERR Internal error: {error}"
+                if reply is None:
+                    return
+                writer.write(reply.encode('utf-8') + b'\n')
+                await writer.drain()
+
+        async def send(reply):
+            # Queues a reply, unless the writer stopped first (the client
+            # went away), in which case returns False
+            if not replies.full():
+                replies.put_nowait(reply)
+                return True
+            put = asyncio.ensure_future(replies.put(reply))
+            await asyncio.wait((put, writer_task), return_when=asyncio.FIRST_COMPLETED)
+            if put.done():
+                return True
+            put.cancel()
+            return False
+
+        writer_task = asyncio.create_task(write_replies())
+        try:
+            while line:
+                command = line.decode('utf-8', 'replace').rstrip('\r\n')
+                reply = asyncio.ensure_future(self.handle_command(command))
+                if not await send(reply):
+                    reply.cancel()
+                    break
+                if command.split(' ', 1)[0].upper() == 'QUIT':
+                    break
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    await send(_completed("ERR Line too long"))
+                    break
+            await send(None)
+            await writer_task
+        finally:
+            writer_task.cancel()
+            while not replies.empty():
+                reply = replies.get_nowait()
+                if reply is not None:
+                    reply.cancel()
+
+    async def handle_command(self, line):
+        """
+        Handles one line protocol command.
+
+        Args:
+            line (str): The command, without its newline
+
+        Returns:
+            str or None: The reply line, or None if the connection should close
+        """
+        self.requests += 1
+        command, _, argument = line.partition(' ')
+        command = command.upper()
+        if command == 'QUIT':
+            return None
+        if command == 'CHECK':
+            result = await self.validate(argument)
+            if result['valid']:
+                return "OK VALID"
+            return f"OK INVALID {','.join(result['failed'])} {result['reason']}"
+        if command == 'STATS':
+            stats = self.stats()
+            latency = stats['request_latency']
+            return (f"OK requests={stats['requests']} passwords={stats['passwords']} "
+                    f"batches={stats['batches']} mean_batch_size={stats['mean_batch_size']:.1f} "
+                    f"passwords_per_sec={stats['passwords_per_sec']:.1f} "
+                    f"p50_ms={latency['p50'] * 1000:.2f} p99_ms={latency['p99'] * 1000:.2f}")
+        if not command:
+            return "ERR Empty command"
+        return f"ERR Unknown command: {command}"
+
+    async def _handle_http(self, request_line, reader, writer):
+        self.requests += 1
+        try:
+            method, path, _ = request_line.decode('latin-1').split(' ', 2)
+        except ValueError:
+            method, path = '', ''
+        headers = {}
+        try:
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+        except ValueError:
+            # A header line longer than the stream limit
+            await self._send_http(writer, *_http_error(413, "header too long"))
+            return
+
+        length = headers.get('content-length', '0').strip() or '0'
+        if not length.isdigit():
+            status, content_type, payload = _http_error(400, "invalid Content-Length")
+        elif int(length) > MAX_BODY_SIZE:
+            status, content_type, payload = _http_error(413, "body too large")
+        else:
+            body = await reader.readexactly(int(length))
+            status, content_type, payload = await self.handle_http(method, path, body)
+        await self._send_http(writer, status, content_type, payload)
+
+    async def _send_http(self, writer, status, content_type, payload):
+        writer.write(f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+                     f"Content-Type: {content_type}\r\n"
+                     f"Content-Length: {len(payload)}\r\n"
+                     "Connection: close\r\n\r\n".encode('latin-1') + payload)
+        await writer.drain()
+
+    async def handle_http(self, method, path, body):
+        """
+        Handles one HTTP request.
+
+        Returns:
+            tuple: (status, content type, body bytes)
+        """
+        if path == '/stats' and method == 'GET':
+            return 200, 'application/json', json.dumps(self.stats()).encode()
+        if path == '/metrics' and method == 'GET':
+            return 200, 'text/plain; version=0.0.4', self.metrics().encode()
+        if path != '/validate':
+            return _http_error(404, "not found")
+        if method != 'POST':
+            return _http_error(405, "use POST")
+
+        try:
+            request = json.loads(body)
+        except ValueError:
+            request = None
+        passwords = None
+        if isinstance(request, dict):
+            if 'passwords' in request:
+                passwords = request['passwords']
+            elif 'password' in request:
+                passwords = [request['password']]
+        if not isinstance(passwords, list) or not all(isinstance(p, str) for p in passwords):
+            return _http_error(400, 'expected {"password": str} or {"passwords": [str, ...]}')
+
+        results = await asyncio.gather(*(self.validate(password) for password in passwords))
+        response = {'results': results} if 'passwords' in request else results[0]
+        return 200, 'application/json', json.dumps(response).encode()
+
+
+def _http_error(status, message):
+    return status, 'application/json', json.dumps({'error': message}).encode()
+
+
+def _completed(result):
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(result)
+    return future
+
+
+def main():
+    """
+    Runs the validation service from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Password validation service")
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on")
+    parser.add_argument('--port', type=int, default=8765, help="port to listen on")
+    parser.add_argument('--workers', type=int, help="worker processes (default: CPU count)")
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH,
+                        help="passwords per batch at most")
+    parser.add_argument('--max-delay-ms', type=float, default=DEFAULT_MAX_DELAY * 1000,
+                        help="milliseconds a check waits for its batch at most")
+    args = parser.parse_args()
+
+    service = ValidationService(args.host, args.port, workers=args.workers,
+                                max_batch=args.max_batch, max_delay=args.max_delay_ms / 1000)
+
+    async def run():
+        await service.start()
+        print(f"Serving password checks on {service.host}:{service.port}")
+        await service.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\nService stopped.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+import asyncio
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import service
+from password_checker import validate_password_and_raise_reason
+from service import LATENCY_BUCKETS, MAX_BODY_SIZE, LatencyHistogram, ValidationService
+
+PASSWORDS = ["P@ssw0rd", "short", "NoDigitsHere!", "ThisPasswordIsWayTooLong123!", "Abcd 1234!"]
+
+
+def expected_reply(password):
+    try:
+        validate_password_and_raise_reason(password)
+    except ValueError as error:
+        return str(error)
+    return None
+
+
+class TestValidationService(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.executor = ThreadPoolExecutor(2)
+        self.service = ValidationService(executor=self.executor, max_batch=4, max_delay=0.01)
+        await self.service.start()
+
+    async def asyncTearDown(self):
+        await self.service.close()
+        self.executor.shutdown()
+
+    async def connect(self):
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.service.port)
+        self.addAsyncCleanup(self.disconnect, writer)
+        return reader, writer
+
+    async def disconnect(self, writer):
+        writer.close()
+        await writer.wait_closed()
+
+    async def http(self, method, path, body=None, length=None):
+        reader, writer = await self.connect()
+        payload = json.dumps(body).encode() if body is not None else b''
+        length = len(payload) if length is None else length
+        writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+                     f"Content-Length: {length}\r\n\r\n".encode() + payload)
+        await writer.drain()
+        response = await reader.read()
+        head, _, content = response.partition(b'\r\n\r\n')
+        return int(head.split()[1]), content
+
+    async def test_line_protocol(self):
+        reader, writer = await self.connect()
+        for password in PASSWORDS:
+            writer.write(f"CHECK {password}\n".encode())
+        writer.write(b"QUIT\n")
+        await writer.drain()
+        replies = [(await reader.readline()).decode().rstrip('\n') for _ in PASSWORDS]
+        self.assertEqual(replies[0], "OK VALID")
+        self.assertEqual(replies[4], "OK VALID")
+        self.assertEqual(replies[2], f"OK INVALID digit {expected_reply('NoDigitsHere!')}")
+        self.assertEqual(replies[1], f"OK INVALID min_length,digit,upper,special {expected_reply('short')}")
+        self.assertEqual(await reader.readline(), b'')
+
+    async def test_pipelined_checks_are_batched(self):
+        reader, writer = await self.connect()
+        writer.write(b"".join(f"CHECK {password}\n".encode() for password in PASSWORDS * 4))
+        await writer.drain()
+        for password in PASSWORDS * 4:
+            reply = (await reader.readline()).decode().rstrip('\n')
+            reason = expected_reply(password)
+            self.assertEqual(reply == "OK VALID", reason is None)
+            if reason:
+                self.assertTrue(reply.endswith(reason))
+        self.assertEqual(self.service.batcher.passwords, 20)
+        self.assertEqual(self.service.batcher.batches, 5)
+
+    async def test_errors_and_stats(self):
+        reader, writer = await self.connect()
+        writer.write(b"HELLO\nCHECK P@ssw0rd\n")
+        await writer.drain()
+        self.assertEqual(await reader.readline(), b"ERR Unknown command: HELLO\n")
+        self.assertEqual(await reader.readline(), b"OK VALID\n")
+        # Pipelined commands run concurrently, so ask for stats once the check is done
+        writer.write(b"STATS\n")
+        await writer.drain()
+        stats = (await reader.readline()).decode()
+        self.assertIn("passwords=1 batches=1", stats)
+        self.assertIn("p99_ms=", stats)
+
+    async def test_http_validate(self):
+        status, content = await self.http('POST', '/validate', {'password': "Password!"})
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(content), {'valid': False, 'failed': ['digit'],
+                                               'reason': expected_reply("Password!")})
+
+        status, content = await self.http('POST', '/validate', {'passwords': PASSWORDS})
+        results = json.loads(content)['results']
+        self.assertEqual([result['reason'] for result in results],
+                         [expected_reply(password) for password in PASSWORDS])
+
+    async def test_http_errors(self):
+        self.assertEqual((await self.http('POST', '/validate', {'pass': 1}))[0], 400)
+        self.assertEqual((await self.http('POST', '/validate', [1, 2]))[0], 400)
+        self.assertEqual((await self.http('POST', '/validate', ["password"]))[0], 400)
+        self.assertEqual((await self.http('POST', '/validate', {'passwords': "Ab1!"}))[0], 400)
+        self.assertEqual((await self.http('POST', '/validate', {'passwords': [1]}))[0], 400)
+        self.assertEqual((await self.http('POST', '/validate', {'password': None}))[0], 400)
+        self.assertEqual((await self.http('GET', '/validate'))[0], 405)
+        self.assertEqual((await self.http('GET', '/nowhere'))[0], 404)
+
+    async def test_http_bad_lengths(self):
+        for length, status in [("abc", 400), ("-5", 400), (MAX_BODY_SIZE + 1, 413)]:
+            with self.subTest(length=length):
+                self.assertEqual((await self.http('POST', '/validate', length=length))[0], status)
+
+        reader, writer = await self.connect()
+        writer.write(b"GET /stats HTTP/1.1\r\nX-Long: " + b"x" * 100_000 + b"\r\n\r\n")
+        await writer.drain()
+        self.assertTrue((await reader.read()).startswith(b"HTTP/1.1 413 "))
+
+    async def test_line_too_long(self):
+        reader, writer = await self.connect()
+        writer.write(b"CHECK P@ssw0rd\nCHECK " + b"x" * 100_000 + b"\n")
+        await writer.drain()
+        self.assertEqual(await reader.readline(), b"OK VALID\n")
+        self.assertEqual(await reader.readline(), b"ERR Line too long\n")
+        self.assertEqual(await reader.readline(), b'')
+
+    async def test_batch_errors_become_error_lines(self):
+        with mock.patch.object(service, 'check_passwords', side_effect=RuntimeError("boom")):
+            reader, writer = await self.connect()
+            writer.write(b"CHECK P@ssw0rd\nSTATS\n")
+            await writer.drain()
+            self.assertEqual(await reader.readline(), b"ERR Internal error: boom\n")
+            self.assertTrue((await reader.readline()).startswith(b"OK requests="))
+
+    async def test_pipeline_is_bounded(self):
+        with mock.patch.object(service, 'MAX_PIPELINED', 2):
+            reader, writer = await self.connect()
+            writer.write(b"".join(f"CHECK {password}\n".encode() for password in PASSWORDS * 4))
+            await writer.drain()
+            for password in PASSWORDS * 4:
+                reply = (await reader.readline()).decode().rstrip('\n')
+                self.assertEqual(reply == "OK VALID", expected_reply(password) is None)
+
+    async def test_http_stats_and_metrics(self):
+        await self.http('POST', '/validate', {'passwords': PASSWORDS})
+        status, content = await self.http('GET', '/stats')
+        stats = json.loads(content)
+        self.assertEqual(stats['passwords'], len(PASSWORDS))
+        self.assertEqual(stats['request_latency']['count'], len(PASSWORDS))
+
+        status, content = await self.http('GET', '/metrics')
+        metrics = content.decode()
+        self.assertIn("password_service_passwords_total 5", metrics)
+        self.assertIn('password_service_request_latency_seconds_bucket{le="+Inf"} 5', metrics)
+
+
+class TestProcessPool(unittest.IsolatedAsyncioTestCase):
+
+    async def test_default_worker_pool(self):
+        service = ValidationService(workers=1, max_delay=0.001)
+        await service.start()
+        try:
+            results = await asyncio.gather(*(service.validate(password) for password in PASSWORDS))
+        finally:
+            await service.close()
+        self.assertEqual([result['reason'] for result in results],
+                         [expected_reply(password) for password in PASSWORDS])
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        self.assertEqual(histogram.percentile(50), 0.0)
+        for seconds in [0.0002] * 90 + [0.03] * 9 + [10.0]:
+            histogram.record(seconds)
+        self.assertEqual(histogram.count, 100)
+        self.assertEqual(histogram.percentile(50), 0.00025)
+        self.assertEqual(histogram.percentile(95), 0.05)
+        self.assertEqual(histogram.percentile(100), LATENCY_BUCKETS[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
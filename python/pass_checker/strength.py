@@ -0,0 +1,322 @@
+# Password strength estimation
+#
+# Estimates how many guesses an attacker would need, in the spirit of
+# zxcvbn. The password is searched for patterns that attackers try first:
+#
+#     dictionary   common passwords and words, also in l33t speak ("P@ssw0rd")
+#     keyboard     walks over adjacent keys ("qwerty", "zxcvbn", "1qaz")
+#     repeat       repeated characters or blocks ("aaaa", "abcabc")
+#     sequence     runs with a constant step ("abcd", "9876", "2468")
+#
+# Each match gets a guess count, and the cheapest way to cover the whole
+# password with matches and brute-forced characters is the estimate.
+#
+# The dictionary trie and keyboard graph are built on first use, so
+# importing this module (or password_checker) stays cheap. A call never
+# analyzes more than MAX_ANALYZED_LENGTH characters and stops looking for
+# patterns once its time budget is spent, which keeps it safe to call
+# inline while handling a signup request.
+
+import math
+import os
+import re
+import time
+
+DICTIONARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'common_words.txt')
+
+MIN_MATCH_LENGTH = 3
+MAX_ANALYZED_LENGTH = 64
+DEFAULT_BUDGET = 0.005  # Seconds of pattern matching per call
+
+# Guess counts at or above which a password gets each score from 1 to 4
+SCORE_THRESHOLDS = (10 ** 3, 10 ** 6, 10 ** 8, 10 ** 10)
+
+L33T_SUBSTITUTIONS = {
+    '4': 'a', '@': 'a', '8': 'b', '(': 'c', '3': 'e', '6': 'g', '1': 'i', '!': 'i',
+    '|': 'l', '0': 'o', '$': 's', '5': 's', '7': 't', '+': 't', '2': 'z',
+}
+
+KEYBOARD_ROWS = (
+    ("`1234567890-=", "~!@#$%^&*()_+"),
+    ("qwertyuiop[]\\", "QWERTYUIOP{}|"),
+    ("asdfghjkl;'", 'ASDFGHJKL:"'),
+    ("zxcvbnm,./", "ZXCVBNM<>?"),
+)
+# Horizontal position of each row's first key, in key widths
+KEYBOARD_ROW_OFFSETS = (0, 1.5, 1.75, 2.25)
+
+# Built on first use by _load()
+_trie = None
+_keyboard = None
+
+
+class Match:
+    """
+    A pattern found in a password, covering password[start:end].
+
+    Attributes:
+        pattern (str): 'dictionary', 'keyboard', 'repeat', 'sequence' or 'bruteforce'.
+        start (int): Index of the first character.
+        end (int): Index after the last character.
+        token (str): The matched characters.
+        guesses (float): Estimated guesses to find the token on its own.
+    """
+    __slots__ = ('pattern', 'start', 'end', 'token', 'guesses')
+
+    def __init__(self, pattern, start, end, token, guesses):
+        self.pattern = pattern
+        self.start = start
+        self.end = end
+        self.token = token
+        self.guesses = guesses
+
+    def __repr__(self):
+        return f"Match({self.pattern!r}, {self.start}, {self.end}, {self.token!r}, {self.guesses:.0f})"
+
+
+class StrengthResult:
+    """
+    The estimated strength of a password.
+
+    Attributes:
+        guesses (float): Estimated number of guesses to crack the password.
+        entropy (float): log2 of guesses, in bits.
+        score (int): 0 (trivial) to 4 (strong), from SCORE_THRESHOLDS.
+        matches (list): The Match objects of the cheapest cover, in order.
+        complete (bool): False if the password was truncated or the time
+                         budget ran out before every pattern was searched.
+        seconds (float): Time spent on the estimate.
+    """
+    def __init__(self, guesses, matches, complete, seconds):
+        self.guesses = guesses
+        self.entropy = math.log2(guesses) if guesses > 1 else 0.0
+        self.score = sum(guesses >= threshold for threshold in SCORE_THRESHOLDS)
+        self.matches = matches
+        self.complete = complete
+        self.seconds = seconds
+
+    def __repr__(self):
+        return f"StrengthResult(score={self.score}, entropy={self.entropy:.1f})"
+
+
+def load_words(path=DICTIONARY_PATH):
+    """
+    Reads a word list, one word per line with the most common first.
+    Blank lines and lines starting with '#' are skipped.
+    """
+    with open(path, encoding='utf-8') as word_file:
+        return [line.strip().lower() for line in word_file
+                if line.strip() and not line.startswith('#')]
+
+
+def build_trie(words):
+    """
+    Compiles words into a trie of nested dicts. A word's 1-based rank is
+    stored under the '' key of its final node.
+    """
+    trie = {}
+    for rank, word in enumerate(words, start=1):
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node.setdefault('', rank)
+    return trie
+
+
+def _build_keyboard():
+    # Maps every key, shifted or not, to its neighbours (and their shifted
+    # forms). Keys are neighbours if they are side by side, or on adjacent
+    # rows less than one key width apart.
+    positions = {}
+    for row, (plain, shifted) in enumerate(KEYBOARD_ROWS):
+        for col, (lower, upper) in enumerate(zip(plain, shifted)):
+            positions[lower] = positions[upper] = (row, KEYBOARD_ROW_OFFSETS[row] + col)
+    keyboard = {}
+    for key, (row, x) in positions.items():
+        keyboard[key] = {
+            other for other, (other_row, other_x) in positions.items()
+            if (other_row == row and abs(other_x - x) == 1)
+            or (abs(other_row - row) == 1 and abs(other_x - x) < 1)
+        }
+    return keyboard
+
+
+def _load():
+    global _trie, _keyboard
+    if _trie is None:
+        _trie = build_trie(load_words())
+        _keyboard = _build_keyboard()
+
+
+def _cardinality(char):
+    if char.isdigit():
+        return 10
+    if char.isalpha():
+        return 26
+    if ord(char) < 128:
+        return 33
+    return 100
+
+
+def _case_variations(token):
+    # Extra guesses for capitalisation: a first or all capital is tried
+    # early, anything else is one of the ways to mix the cases
+    upper = sum(char.isupper() for char in token)
+    if not upper:
+        return 1
+    if token.isupper() or upper == 1 and token[0].isupper():
+        return 2
+    lower = sum(char.islower() for char in token)
+    return sum(math.comb(upper + lower, count) for count in range(1, min(upper, lower) + 1))
+
+
+def _dictionary_matches(password, deadline):
+    lowered = password.lower()
+    unleeted = ''.join(L33T_SUBSTITUTIONS.get(char, char) for char in lowered)
+    matches = []
+    for start in range(len(password)):
+        if time.perf_counter() > deadline:
+            return matches, False
+        for text, leet in ((lowered, False), (unleeted, True)):
+            if leet and unleeted[start:] == lowered[start:]:
+                break
+            node = _trie
+            for end in range(start, len(text)):
+                node = node.get(text[end])
+                if node is None:
+                    break
+                rank = node.get('')
+                if rank is not None and end + 1 - start >= MIN_MATCH_LENGTH:
+                    token = password[start:end + 1]
+                    guesses = rank * _case_variations(token)
+                    if leet:
+                        substitutions = sum(a != b for a, b in zip(lowered[start:end + 1],
+                                                                   unleeted[start:end + 1]))
+                        if not substitutions:
+                            continue
+                        guesses *= 2 ** substitutions
+                    matches.append(Match('dictionary', start, end + 1, token, guesses))
+    return matches, True
+
+
+def _keyboard_matches(password):
+    matches = []
+    start = 0
+    while start < len(password) - 1:
+        end = start + 1
+        while end < len(password) and password[end] in _keyboard.get(password[end - 1], ()):
+            end += 1
+        if end - start >= MIN_MATCH_LENGTH:
+            token = password[start:end]
+            # Any of the ~47 keys to start, about 4 likely directions per step
+            guesses = 47 * 4 ** (end - start - 1) * _case_variations(token)
+            matches.append(Match('keyboard', start, end, token, guesses))
+            start = end
+        else:
+            start += 1
+    return matches
+
+
+def _sequence_matches(password):
+    matches = []
+    start = 0
+    while start < len(password) - 2:
+        cardinality = _cardinality(password[start])
+        step = ord(password[start + 1]) - ord(password[start])
+        end = start + 1
+        if 1 <= abs(step) <= 2:
+            while (end < len(password) and ord(password[end]) - ord(password[end - 1]) == step
+                   and _cardinality(password[end]) == cardinality):
+                end += 1
+        if end - start >= MIN_MATCH_LENGTH:
+            token = password[start:end]
+            # Runs from an obvious first character are tried first
+            base = 4 if token[0] in 'aAzZ019' else cardinality
+            guesses = base * len(token) * abs(step) * (2 if step < 0 else 1)
+            matches.append(Match('sequence', start, end, token, guesses))
+            start = end
+        else:
+            start += 1
+    return matches
+
+
+_REPEAT_PATTERN = re.compile(r'(.+?)\1+', re.DOTALL)
+
+
+def _repeat_matches(password, deadline):
+    matches = []
+    for found in _REPEAT_PATTERN.finditer(password):
+        token = found.group(0)
+        if len(token) < MIN_MATCH_LENGTH:
+            continue
+        base = found.group(1)
+        base_guesses, _ = _cheapest_cover(base, _find_matches(base, deadline)[0])
+        matches.append(Match('repeat', found.start(), found.end(), token,
+                             base_guesses * (len(token) // len(base))))
+    return matches
+
+
+def _find_matches(password, deadline):
+    matches, complete = _dictionary_matches(password, deadline)
+    for finder in (_keyboard_matches, _sequence_matches):
+        if time.perf_counter() > deadline:
+            return matches, False
+        matches.extend(finder(password))
+    if time.perf_counter() > deadline:
+        return matches, False
+    matches.extend(_repeat_matches(password, deadline))
+    return matches, complete
+
+
+def _cheapest_cover(password, matches):
+    # Dynamic programming over prefixes: the fewest guesses for
+    # password[:end] is the cheapest prefix before a match (or a single
+    # brute-forced character) times the guesses for that match
+    length = len(password)
+    by_end = [[] for _ in range(length + 1)]
+    for match in matches:
+        by_end[match.end].append(match)
+
+    best = [1.0] + [math.inf] * length
+    chosen = [None] * (length + 1)
+    for end in range(1, length + 1):
+        char = password[end - 1]
+        best[end] = best[end - 1] * _cardinality(char)
+        chosen[end] = Match('bruteforce', end - 1, end, char, _cardinality(char))
+        for match in by_end[end]:
+            guesses = best[match.start] * max(match.guesses, 1)
+            if guesses < best[end]:
+                best[end] = guesses
+                chosen[end] = match
+
+    cover = []
+    end = length
+    while end > 0:
+        cover.append(chosen[end])
+        end = chosen[end].start
+    cover.reverse()
+    return best[length], cover
+
+
+def estimate_strength(password, budget=DEFAULT_BUDGET):
+    """
+    Estimates how hard a password is to guess.
+
+    Args:
+        password (str): The password to score
+        budget (float): Seconds to spend looking for patterns; characters
+                        not covered by a pattern found in time count as
+                        brute-forced
+
+    Returns:
+        StrengthResult: The estimate
+    """
+    _load()
+    start = time.perf_counter()
+    analyzed = password[:MAX_ANALYZED_LENGTH]
+    matches, complete = _find_matches(analyzed, start + budget)
+    guesses, cover = _cheapest_cover(analyzed, matches)
+    for char in password[MAX_ANALYZED_LENGTH:]:
+        guesses *= _cardinality(char)
+    complete = complete and len(password) <= MAX_ANALYZED_LENGTH
+    return StrengthResult(guesses, cover, complete, time.perf_counter() - start)
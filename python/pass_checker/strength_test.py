@@ -0,0 +1,101 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import strength
+from password_checker import password_strength
+from strength import (MAX_ANALYZED_LENGTH, StrengthResult, build_trie, estimate_strength,
+                      load_words)
+
+
+def patterns(result):
+    return [(match.pattern, match.token) for match in result.matches if match.pattern != 'bruteforce']
+
+
+class TestEstimateStrength(unittest.TestCase):
+
+    def test_dictionary_words(self):
+        self.assertEqual(patterns(estimate_strength("password")), [('dictionary', "password")])
+        self.assertEqual(patterns(estimate_strength("Dragon")), [('dictionary', "Dragon")])
+
+    def test_l33t_speak(self):
+        result = estimate_strength("P@ssw0rd")
+        self.assertEqual(patterns(result), [('dictionary', "P@ssw0rd")])
+        self.assertEqual(result.score, 0)
+
+    def test_keyboard_walks(self):
+        self.assertEqual(patterns(estimate_strength("zxcvbnm")), [('keyboard', "zxcvbnm")])
+        self.assertIn(('keyboard', "1qaz"), patterns(estimate_strength("1qaz!QAZ")))
+
+    def test_repeats(self):
+        self.assertEqual(patterns(estimate_strength("aaaaaaaa")), [('repeat', "aaaaaaaa")])
+        self.assertEqual(patterns(estimate_strength("xyzxyzxyz")), [('repeat', "xyzxyzxyz")])
+
+    def test_sequences(self):
+        self.assertEqual(patterns(estimate_strength("abcdefg")), [('sequence', "abcdefg")])
+        self.assertEqual(patterns(estimate_strength("97531")), [('sequence', "97531")])
+
+    def test_random_passwords_score_high(self):
+        for password in ["x7$Kq!9vLm#2", "Tr0ub4dor&3", "correcthorsebatterystaple"]:
+            with self.subTest(password=password):
+                self.assertEqual(estimate_strength(password).score, 4)
+
+    def test_patterns_lower_the_estimate(self):
+        self.assertLess(estimate_strength("Summer2024!").entropy,
+                        estimate_strength("Smmuer0242!").entropy)
+
+    def test_cover_spans_password(self):
+        password = "myP@ssw0rd123qwerty"
+        result = estimate_strength(password)
+        self.assertEqual(''.join(match.token for match in result.matches), password)
+        self.assertTrue(result.complete)
+
+    def test_empty_password(self):
+        result = estimate_strength("")
+        self.assertEqual((result.score, result.entropy, result.matches), (0, 0.0, []))
+
+    def test_long_passwords_are_truncated(self):
+        result = estimate_strength("a" * 10000)
+        self.assertFalse(result.complete)
+        self.assertLess(result.seconds, 0.05)
+        self.assertTrue(estimate_strength("a" * MAX_ANALYZED_LENGTH).complete)
+        longer = estimate_strength("a" * MAX_ANALYZED_LENGTH + "b")
+        self.assertFalse(longer.complete)
+        self.assertGreater(longer.guesses, estimate_strength("a" * MAX_ANALYZED_LENGTH).guesses)
+
+    def test_budget(self):
+        result = estimate_strength("password" * 8, budget=0)
+        self.assertFalse(result.complete)
+        self.assertIsInstance(result, StrengthResult)
+
+    def test_password_checker_wrapper(self):
+        self.assertEqual(password_strength("P@ssw0rd").score, 0)
+
+
+class TestDictionaries(unittest.TestCase):
+
+    def test_trie(self):
+        trie = build_trie(["pass", "password", "pass"])
+        node = trie
+        for char in "pass":
+            node = node[char]
+        self.assertEqual(node[''], 1)
+        self.assertNotIn('', node['w'])
+
+    def test_word_list(self):
+        words = load_words()
+        self.assertEqual(words[:2], ["123456", "password"])
+        self.assertTrue(all(word == word.lower() and word.strip() == word for word in words))
+
+    def test_loaded_lazily(self):
+        code = ("import sys; import password_checker, strength; "
+                "assert strength._trie is None; "
+                "assert password_checker.password_strength('x').complete; "
+                "assert strength._trie is not None")
+        here = os.path.dirname(os.path.abspath(strength.__file__))
+        subprocess.run([sys.executable, '-c', code], cwd=here, check=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
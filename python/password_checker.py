@@ -1,65 +1,44 @@
+import os
+import sys
+
+# pass_checker is a plain directory next to this file, not an installed
+# package; it imports as a namespace package once this directory is on
+# sys.path, wherever this file was loaded from
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+
+from pass_checker.policy import ALL_RULES, PasswordPolicy
+
+# The rules of this checker, compiled once. Its special characters and
+# messages differ from pass_checker's; both are now declared as policies.
+POLICY = PasswordPolicy.from_dict({
+    "min_length": 8,
+    "max_length": 16,
+    "special_chars": "!@#$%^&*()_+-=[]{}|;:,.<>?",
+    "messages": {
+        "max_length": "Password must be at most {max_length} characters long",
+        "special": "Password must contain at least one special character",
+    },
+})
+
+
 def validate_password(password):
-    if len(password) < 8:
-        return False
-    
-    if len(password) > 16:
-        return False
-    
-    if not any(char.isdigit() for char in password):
-        return False
-    
-    if not any(char.isupper() for char in password):
-        return False
-    
-    if not any(char.islower() for char in password):
-        return False
-    
-    # check for special chars (put special chars in a separeted var):
-    special_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
-    if not any(char in special_chars for char in password):
-        return False
-    
-    return True
+    return POLICY.check(password) == ALL_RULES
 
 
 def validate_password_and_raise_reason(password):
     """
     Validates a password and raises a ValueError with the specific reason if invalid.
-    Uses regular expressions for validation.
-    
+    Uses the same compiled policy as validate_password, so both always agree.
+
     Args:
         password: The password string to validate
-        
+
     Returns:
         True if the password is valid
-        
+
     Raises:
         ValueError: With a message explaining why the password is invalid
     """
-    import re
-    
-    # Check length
-    if len(password) < 8:
-        raise ValueError("Password must be at least 8 characters long")
-    
-    if len(password) > 16:
-        raise ValueError("Password must be at most 16 characters long")
-    
-    # Check for at least one digit
-    if not re.search(r"\d", password):
-        raise ValueError("Password must contain at least one digit")
-    
-    # Check for at least one uppercase letter
-    if not re.search(r"[A-Z]", password):
-        raise ValueError("Password must contain at least one uppercase letter")
-    
-    # Check for at least one lowercase letter
-    if not re.search(r"[a-z]", password):
-        raise ValueError("Password must contain at least one lowercase letter")
-    
-    # Check for at least one special character
-    special_chars = r"[!@#$%^&*()_+\-=\[\]{}|;:,.<>?]"
-    if not re.search(special_chars, password):
-        raise ValueError("Password must contain at least one special character")
-    
-    return True
\ No newline at end of file
+    return POLICY.validate_and_raise_reason(password)
@@ -1,4 +1,9 @@
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
+import password_checker
 from password_checker import validate_password, validate_password_and_raise_reason
 
 class TestPasswordValidator(unittest.TestCase):
@@ -161,5 +166,45 @@ class TestPasswordValidatorWithReason(unittest.TestCase):
         self.assertIn("special character", str(context.exception))
 
 
+class TestUnicodeCharacters(unittest.TestCase):
+    """
+    Both functions classify characters with the str methods, as
+    validate_password always did. validate_password_and_raise_reason used
+    ASCII-only regex classes before the two were unified.
+    """
+
+    def test_unicode_digits_and_letters_count(self):
+        for password in ["Passwor²!", "Ⅻabcdef1!", "Ñandú123!", "ΣίγμαΣ12!"]:
+            with self.subTest(password=password):
+                self.assertTrue(validate_password(password))
+                self.assertTrue(validate_password_and_raise_reason(password))
+
+    def test_unicode_reasons(self):
+        cases = [
+            ("ПАРОЛЬ123!", "lowercase"),
+            ("пароль123!", "uppercase"),
+            ("Пароль!!!!", "digit"),
+        ]
+        for password, reason in cases:
+            with self.subTest(password=password):
+                self.assertFalse(validate_password(password))
+                with self.assertRaises(ValueError) as context:
+                    validate_password_and_raise_reason(password)
+                self.assertIn(reason, str(context.exception))
+
+
+class TestStandaloneImport(unittest.TestCase):
+
+    def test_import_without_parent_directory_on_path(self):
+        """Test that the module loads by path from another working directory."""
+        code = ("import importlib.util, sys; "
+                f"spec = importlib.util.spec_from_file_location('checker', {password_checker.__file__!r}); "
+                "module = importlib.util.module_from_spec(spec); spec.loader.exec_module(module); "
+                "assert module.validate_password('Password1!')")
+        with tempfile.TemporaryDirectory() as directory:
+            subprocess.run([sys.executable, '-c', code], cwd=directory, check=True,
+                           env={key: value for key, value in os.environ.items() if key != 'PYTHONPATH'})
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
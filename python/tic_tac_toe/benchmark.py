@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# Benchmarks for the Tic-Tac-Toe hot paths
+#
+# Times make_move, check_winner, get_empty_cells and make_ai_move on
+# opening, midgame and endgame positions, plus full-game throughput, for
+# each board engine. Every benchmark is calibrated, warmed up and repeated;
+# the median and 95th percentile time per operation are reported and can
+# be saved as JSON and compared against a saved baseline:
+#
+#     python benchmark.py --output baseline.json
+#     python benchmark.py --compare baseline.json
+
+import os
+import random
+import sys
+import time
+
+# benchmark_harness.py, shared with pass_checker/benchmark.py, is in the
+# parent directory
+_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT not in sys.path:
+    sys.path.append(_PARENT)
+
+import benchmark_harness
+from benchmark_harness import DEFAULT_REPEATS, DEFAULT_WARMUP, MIN_REPEAT_SECONDS
+from bitboard import BitboardTicTacToe
+from tic_tac_toe import TicTacToe, make_ai_move
+
+ENGINES = {
+    'TicTacToe': TicTacToe,
+    'BitboardTicTacToe': BitboardTicTacToe,
+}
+
+# Positions with 'O' to move (make_ai_move always plays 'O'), and an empty
+# cell to play in each of them
+POSITIONS = {
+    'opening': ([(0, 0)], (1, 1)),
+    'midgame': ([(0, 0), (1, 1), (2, 2)], (0, 1)),
+    'endgame': ([(0, 0), (1, 1), (2, 2), (0, 2), (2, 0), (1, 0), (1, 2)], (0, 1)),
+}
+
+
+def measure(setup, repeats=DEFAULT_REPEATS, warmup=DEFAULT_WARMUP, min_seconds=MIN_REPEAT_SECONDS):
+    """
+    Times a benchmark.
+
+    Args:
+        setup (callable): Takes a number of operations and returns a function
+                          that performs that many operations. Only the
+                          returned function is timed.
+        repeats (int): Number of timed repeats
+        warmup (int): Number of untimed repeats run first
+        min_seconds (float): Minimum duration of one repeat, used to pick
+                             the number of operations per repeat
+
+    Returns:
+        dict: median_ns, p95_ns, min_ns and mean_ns per operation, plus the
+              number of operations per repeat and the number of repeats
+    """
+    number = 1
+    while True:
+        run = setup(number)
+        start = time.perf_counter_ns()
+        run()
+        elapsed = time.perf_counter_ns() - start
+        if elapsed >= min_seconds * 1e9 or number >= 10 ** 7:
+            break
+        number *= 10
+
+    for _ in range(warmup):
+        setup(number)()
+
+    samples = []
+    for _ in range(repeats):
+        run = setup(number)
+        start = time.perf_counter_ns()
+        run()
+        samples.append((time.perf_counter_ns() - start) / number)
+
+    return benchmark_harness.summarize(samples, number=number)
+
+
+def make_position(engine, moves):
+    """
+    Returns a new game of the given engine with the moves played.
+    """
+    game = engine()
+    for row, col in moves:
+        game.make_move(row, col)
+    return game
+
+
+def _make_move_setup(engine, moves, cell):
+    # The games are built once and reset with pop_move between repeats,
+    # which is much cheaper than rebuilding them
+    games = []
+
+    def setup(number):
+        for game in games[:number]:
+            if game.moves_count > len(moves):
+                game.pop_move()
+        while len(games) < number:
+            games.append(make_position(engine, moves))
+        batch = games[:number]
+
+        def run():
+            for game in batch:
+                game.make_move(*cell)
+        return run
+    return setup
+
+
+def _method_setup(engine, moves, method):
+    def setup(number):
+        func = getattr(make_position(engine, moves), method)
+
+        def run():
+            for _ in range(number):
+                func()
+        return run
+    return setup
+
+
+def _ai_move_setup(engine, moves):
+    def setup(number):
+        game = make_position(engine, moves)
+
+        def run():
+            for _ in range(number):
+                make_ai_move(game)
+        return run
+    return setup
+
+
+def _full_game_setup(engine):
+    def setup(number):
+        rng = random.Random(0)
+
+        def run():
+            for _ in range(number):
+                game = engine()
+                winner = None
+                while not winner:
+                    if game.current_player == 'X':
+                        row, col = rng.choice(game.get_empty_cells())
+                    else:
+                        row, col = make_ai_move(game)
+                    game.make_move(row, col)
+                    winner = game.check_winner()
+        return run
+    return setup
+
+
+def get_benchmarks():
+    """
+    Returns every benchmark, named "<engine>.<operation>.<position>".
+
+    Returns:
+        dict: Maps benchmark names to setup functions for measure()
+    """
+    benchmarks = {}
+    for engine_name, engine in ENGINES.items():
+        for phase, (moves, cell) in POSITIONS.items():
+            prefix = f"{engine_name}.%s.{phase}"
+            benchmarks[prefix % 'make_move'] = _make_move_setup(engine, moves, cell)
+            benchmarks[prefix % 'check_winner'] = _method_setup(engine, moves, 'check_winner')
+            benchmarks[prefix % 'get_empty_cells'] = _method_setup(engine, moves, 'get_empty_cells')
+            benchmarks[prefix % 'make_ai_move'] = _ai_move_setup(engine, moves)
+        benchmarks[f"{engine_name}.full_game.ai_vs_random"] = _full_game_setup(engine)
+    return benchmarks
+
+
+def run_benchmarks(name_filter=None, repeats=DEFAULT_REPEATS, warmup=DEFAULT_WARMUP,
+                   min_seconds=MIN_REPEAT_SECONDS, benchmarks=None):
+    """
+    Runs the benchmarks and collects their statistics.
+
+    Args:
+        name_filter (str): Only run benchmarks whose name contains this
+        repeats (int): Timed repeats per benchmark
+        warmup (int): Untimed repeats per benchmark
+        min_seconds (float): Minimum duration of one repeat
+        benchmarks (dict): Benchmarks to run; defaults to get_benchmarks()
+
+    Returns:
+        dict: A JSON-serializable report with "meta" and "results" keys
+    """
+    if benchmarks is None:
+        benchmarks = get_benchmarks()
+    results = {}
+    for name, setup in benchmarks.items():
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = measure(setup, repeats, warmup, min_seconds)
+    return benchmark_harness.make_report(results)
+
+
+def main(argv=None):
+    """
+    Runs the benchmark suite from the command line; see benchmark_harness.main.
+    """
+    return benchmark_harness.main("Benchmark the Tic-Tac-Toe hot paths", run_benchmarks, argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
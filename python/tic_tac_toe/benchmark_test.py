@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+import json
+import unittest
+from benchmark import POSITIONS, ENGINES, get_benchmarks, make_position, measure, run_benchmarks
+
+class TestBenchmark(unittest.TestCase):
+    """
+    Test cases for the benchmark suite. Timings are not checked, only that
+    the benchmarks measure and report correctly.
+    """
+
+    def test_measure(self):
+        """
+        Test that measure calibrates, warms up and repeats.
+        """
+        calls = []
+
+        def setup(number):
+            calls.append(number)
+            return lambda: None
+        stats = measure(setup, repeats=4, warmup=2, min_seconds=0)
+        self.assertEqual(stats['number'], 1)
+        self.assertEqual(stats['repeats'], 4)
+        self.assertEqual(len(calls), 1 + 2 + 4)
+        self.assertLessEqual(stats['min_ns'], stats['median_ns'])
+        self.assertLessEqual(stats['median_ns'], stats['p95_ns'])
+
+    def test_positions_are_in_progress(self):
+        """
+        Test that every position has 'O' to move, no winner and an empty target cell.
+        """
+        for engine in ENGINES.values():
+            for moves, (row, col) in POSITIONS.values():
+                game = make_position(engine, moves)
+                self.assertEqual(game.current_player, 'O')
+                self.assertIsNone(game.check_winner())
+                self.assertIn((row, col), game.get_empty_cells())
+
+    def test_run_benchmarks(self):
+        """
+        Test that a filtered run produces a JSON-serializable report.
+        """
+        report = run_benchmarks('BitboardTicTacToe.make_move', repeats=2, warmup=1, min_seconds=0)
+        self.assertEqual(sorted(report['results']), [
+            'BitboardTicTacToe.make_move.endgame',
+            'BitboardTicTacToe.make_move.midgame',
+            'BitboardTicTacToe.make_move.opening',
+        ])
+        self.assertEqual(json.loads(json.dumps(report)), report)
+
+    def test_every_benchmark_runs(self):
+        """
+        Test that every benchmark runs once without errors.
+        """
+        for name, setup in get_benchmarks().items():
+            with self.subTest(name=name):
+                setup(2)()
+                setup(3)()
+
+
+if __name__ == '__main__':
+    unittest.main()
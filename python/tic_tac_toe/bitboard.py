@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# Bitboard Tic-Tac-Toe engine
+
+from tic_tac_toe import TicTacToe
+
+# Cell (row, col) is stored in bit row * 3 + col of each player's mask.
+FULL_BOARD = 0b111111111
+
+# The eight winning lines: three rows, three columns and two diagonals
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,
+    0b001001001, 0b010010010, 0b100100100,
+    0b100010001, 0b001010100,
+)
+
+# Lookup tables indexed by a 9-bit mask, built once at import time
+WINNING = tuple(
+    any(bits & mask == mask for mask in WIN_MASKS) for bits in range(FULL_BOARD + 1)
+)
+_EMPTY_CELLS = tuple(
+    tuple((cell // 3, cell % 3) for cell in range(9) if not occupied >> cell & 1)
+    for occupied in range(FULL_BOARD + 1)
+)
+
+
+def cell_bit(row, col):
+    """
+    Returns the bit for the given cell.
+
+    Args:
+        row (int): Row index (0-2)
+        col (int): Column index (0-2)
+
+    Returns:
+        int: A mask with only the cell's bit set
+    """
+    return 1 << (row * 3 + col)
+
+
+def board_to_bits(game):
+    """
+    Returns the bitmasks for the marks on any TicTacToe board.
+
+    Args:
+        game (TicTacToe): The game to read; BitboardTicTacToe instances are
+                          read directly from their masks.
+
+    Returns:
+        tuple: (x_bits, o_bits)
+    """
+    if isinstance(game, BitboardTicTacToe):
+        return game.x_bits, game.o_bits
+    x_bits = o_bits = 0
+    for row in range(3):
+        for col in range(3):
+            mark = game.board[row][col]
+            if mark == 'X':
+                x_bits |= cell_bit(row, col)
+            elif mark == 'O':
+                o_bits |= cell_bit(row, col)
+    return x_bits, o_bits
+
+
+class _RowView:
+    """
+    A single row of a BitboardTicTacToe board, behaving like a list of
+    ' ', 'X' and 'O' strings. Writes go straight through to the bitmasks.
+    """
+    __slots__ = ('_game', '_row')
+
+    def __init__(self, game, row):
+        self._game = game
+        self._row = row
+
+    def __getitem__(self, col):
+        if not 0 <= col < 3:
+            raise IndexError("column index out of range")
+        bit = cell_bit(self._row, col)
+        if self._game.x_bits & bit:
+            return 'X'
+        if self._game.o_bits & bit:
+            return 'O'
+        return ' '
+
+    def __setitem__(self, col, value):
+        if not 0 <= col < 3:
+            raise IndexError("column index out of range")
+        bit = cell_bit(self._row, col)
+        game = self._game
+        game.x_bits &= ~bit
+        game.o_bits &= ~bit
+        if value == 'X':
+            game.x_bits |= bit
+        elif value == 'O':
+            game.o_bits |= bit
+
+    def __len__(self):
+        return 3
+
+    def __iter__(self):
+        return (self[col] for col in range(3))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _BoardView:
+    """
+    A 3x3 nested-list view over a BitboardTicTacToe, so that code written
+    against TicTacToe.board keeps working.
+    """
+    __slots__ = ('_rows',)
+
+    def __init__(self, game):
+        self._rows = tuple(_RowView(game, row) for row in range(3))
+
+    def __getitem__(self, row):
+        return self._rows[row]
+
+    def __len__(self):
+        return 3
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __eq__(self, other):
+        return [list(row) for row in self] == [list(row) for row in other]
+
+    def __repr__(self):
+        return repr([list(row) for row in self])
+
+
+class BitboardTicTacToe(TicTacToe):
+    """
+    A Tic-Tac-Toe game that stores each player's marks as a 9-bit integer.
+
+    Win detection is a table lookup against the eight precomputed line masks
+    instead of a scan over rows, columns and diagonals. The public API is the
+    same as TicTacToe's, and `board` is still available as a nested-list view
+    that is only built the first time it is accessed.
+
+    Attributes:
+        x_bits (int): Bitmask of the cells taken by 'X'.
+        o_bits (int): Bitmask of the cells taken by 'O'.
+        current_player (str): Keeps track of whose turn it is ('X' or 'O').
+        moves_count (int): Number of moves played so far.
+    """
+    def __init__(self):
+        self.x_bits = 0
+        self.o_bits = 0
+        self.current_player = 'X'
+        self.moves_count = 0
+        self._board_view = None
+        # Cell bits of the moves made through make_move, for pop_move
+        self._history = []
+
+    @property
+    def board(self):
+        """
+        A 3x3 nested-list view of the board, built lazily on first access.
+        """
+        if self._board_view is None:
+            self._board_view = _BoardView(self)
+        return self._board_view
+
+    def make_move(self, row, col):
+        """
+        Attempts to make a move at the specified position.
+
+        Args:
+            row (int): Row index (0-2)
+            col (int): Column index (0-2)
+
+        Returns:
+            bool: True if the move was successful, False otherwise
+        """
+        if not (0 <= row < 3 and 0 <= col < 3):
+            return False
+        bit = cell_bit(row, col)
+        if (self.x_bits | self.o_bits) & bit:
+            return False
+        if self.current_player == 'X':
+            self.x_bits |= bit
+            self.current_player = 'O'
+        else:
+            self.o_bits |= bit
+            self.current_player = 'X'
+        self.moves_count += 1
+        self._history.append(bit)
+        return True
+
+    def pop_move(self):
+        """
+        Undoes the most recent move, restoring the board, current_player and
+        moves_count to what they were before it.
+
+        Returns:
+            tuple: (row, col) of the move that was undone
+
+        Raises:
+            IndexError: If there are no moves to undo
+        """
+        bit = self._history.pop()
+        if self.x_bits & bit:
+            self.x_bits &= ~bit
+            self.current_player = 'X'
+        else:
+            self.o_bits &= ~bit
+            self.current_player = 'O'
+        self.moves_count -= 1
+        cell = bit.bit_length() - 1
+        return (cell // 3, cell % 3)
+
+    def check_winner(self):
+        """
+        Checks if there is a winner or if the game is a tie.
+
+        Returns:
+            str or None: 'X' or 'O' if there's a winner, 'Tie' if the game is a tie,
+                        None if the game is still ongoing.
+        """
+        if WINNING[self.x_bits]:
+            return 'X'
+        if WINNING[self.o_bits]:
+            return 'O'
+        if self.moves_count == 9:
+            return 'Tie'
+        return None
+
+    def get_empty_cells(self):
+        """
+        Returns a list of empty cells on the board.
+
+        Returns:
+            list: List of (row, col) tuples representing empty cells
+        """
+        return list(_EMPTY_CELLS[self.x_bits | self.o_bits])
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+import unittest
+import tic_tac_toe_test
+from bitboard import BitboardTicTacToe, WIN_MASKS, cell_bit
+from tic_tac_toe import TicTacToe, make_ai_move
+
+class TestBitboardTicTacToeCompat(tic_tac_toe_test.TestTicTacToe):
+    """
+    Runs the TicTacToe test cases against the bitboard engine.
+    """
+
+    def setUp(self):
+        """
+        Set up a new bitboard game instance before each test.
+        """
+        self.game = BitboardTicTacToe()
+
+
+class TestBitboardTicTacToe(unittest.TestCase):
+    """
+    Test cases specific to the BitboardTicTacToe class.
+    """
+
+    def setUp(self):
+        """
+        Set up a new game instance before each test.
+        """
+        self.game = BitboardTicTacToe()
+
+    def test_win_masks(self):
+        """
+        Test that there are eight distinct lines of three cells each.
+        """
+        self.assertEqual(len(set(WIN_MASKS)), 8)
+        for mask in WIN_MASKS:
+            self.assertEqual(bin(mask).count('1'), 3)
+
+    def test_make_move_sets_bits(self):
+        """
+        Test that moves are stored in the right player's bitmask.
+        """
+        self.game.make_move(0, 0)
+        self.game.make_move(2, 1)
+        self.assertEqual(self.game.x_bits, cell_bit(0, 0))
+        self.assertEqual(self.game.o_bits, cell_bit(2, 1))
+
+    def test_board_view_is_lazy(self):
+        """
+        Test that the board view is only built when accessed.
+        """
+        self.assertIsNone(self.game._board_view)
+        board = self.game.board
+        self.assertIs(self.game.board, board)
+
+    def test_board_view_reflects_moves(self):
+        """
+        Test that the board view matches the bitmasks.
+        """
+        self.game.make_move(1, 1)
+        self.game.make_move(0, 2)
+        self.assertEqual(self.game.board, [
+            [' ', ' ', 'O'],
+            [' ', 'X', ' '],
+            [' ', ' ', ' '],
+        ])
+
+    def test_board_view_writes_through(self):
+        """
+        Test that writing to the board view updates and clears the bitmasks.
+        """
+        self.game.board[2][2] = 'O'
+        self.assertEqual(self.game.o_bits, cell_bit(2, 2))
+        self.game.board[2][2] = ' '
+        self.assertEqual(self.game.o_bits, 0)
+        self.assertEqual(self.game.x_bits, 0)
+
+    def test_full_game_against_ai(self):
+        """
+        Test that a game against the AI finishes with the same result on both engines.
+        """
+        results = []
+        for game in (TicTacToe(), self.game):
+            winner = None
+            while not winner:
+                if game.current_player == 'X':
+                    row, col = game.get_empty_cells()[-1]
+                else:
+                    row, col = make_ai_move(game)
+                game.make_move(row, col)
+                winner = game.check_winner()
+            results.append((winner, [list(row) for row in game.board]))
+        self.assertEqual(results[0], results[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# Monte Carlo Tree Search player
+
+import math
+import random
+import time
+
+
+def _legal_moves(game):
+    # Large boards only search cells next to existing marks
+    if hasattr(game, 'get_candidate_moves'):
+        moves = game.get_candidate_moves()
+        if moves:
+            return moves
+    return game.get_empty_cells()
+
+
+class _Node:
+    """
+    A node of the search tree: the position after `move` was played by `player`.
+    """
+    __slots__ = ('move', 'player', 'parent', 'children', 'untried', 'visits', 'wins')
+
+    def __init__(self, move, player, parent, untried):
+        self.move = move
+        self.player = player
+        self.parent = parent
+        self.children = {}
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+
+
+class MCTSPlayer:
+    """
+    An AI that picks moves with Monte Carlo Tree Search (UCT).
+
+    Each move runs random playouts until its budget is used up: a number of
+    iterations, a time limit in seconds, or whichever comes first if both are
+    given. Searches use push_move/pop_move on the game itself, so any engine
+    with that API works: TicTacToe, BitboardTicTacToe or MNKGame. The tree is
+    kept between turns and reused when the game continues from the last move.
+
+    Instances are callable like make_ai_move, and one instance should be used
+    per game.
+
+    Attributes:
+        iterations (int or None): Playouts per move.
+        time_limit (float or None): Seconds per move.
+        exploration (float): UCT exploration constant.
+        last_playouts (int): Playouts run for the most recent move.
+        last_seconds (float): Time spent on the most recent move.
+        reused_visits (int): Visits inherited from the previous turn's tree.
+    """
+    def __init__(self, iterations=None, time_limit=None, exploration=math.sqrt(2), seed=None):
+        if iterations is None and time_limit is None:
+            iterations = 1000
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.last_playouts = 0
+        self.last_seconds = 0.0
+        self.reused_visits = 0
+        self._rng = random.Random(seed)
+        self._root = None
+        self._root_cells = None
+
+    @property
+    def playouts_per_second(self):
+        """
+        Search speed for the most recent move.
+        """
+        return self.last_playouts / self.last_seconds if self.last_seconds else 0.0
+
+    def __call__(self, game):
+        """
+        Makes a move for the current player.
+
+        Args:
+            game (TicTacToe): The current game state; it is left unchanged
+
+        Returns:
+            tuple: (row, col) representing the AI's move
+        """
+        root = self._find_root(game)
+        self.reused_visits = root.visits
+        start = time.perf_counter()
+        deadline = start + self.time_limit if self.time_limit is not None else None
+        playouts = 0
+        while True:
+            if self.iterations is not None and playouts >= self.iterations:
+                break
+            if deadline is not None and playouts and time.perf_counter() >= deadline:
+                break
+            self._playout(game, root)
+            playouts += 1
+        self.last_playouts = playouts
+        self.last_seconds = time.perf_counter() - start
+
+        if not root.children:
+            raise ValueError("No moves left on the board")
+        best = max(root.children.values(), key=lambda child: child.visits)
+
+        # Keep the chosen subtree for the next turn
+        best.parent = None
+        self._root = best
+        self._root_cells = self._cells(game)
+        row, col = best.move
+        self._root_cells[row * len(game.board[0]) + col] = game.current_player
+        return best.move
+
+    @staticmethod
+    def _cells(game):
+        return [mark for row in game.board for mark in row]
+
+    def _find_root(self, game):
+        # Reuse the subtree for the opponent's reply if the game continued
+        # from our last move with exactly one more move.
+        root = self._root
+        if root is not None:
+            cells = self._cells(game)
+            if len(cells) == len(self._root_cells):
+                changed = [index for index, (old, new) in enumerate(zip(self._root_cells, cells))
+                           if old != new]
+                if len(changed) == 1 and self._root_cells[changed[0]] == ' ':
+                    cols = len(game.board[0])
+                    move = (changed[0] // cols, changed[0] % cols)
+                    child = root.children.get(move)
+                    if child is not None:
+                        child.parent = None
+                        return child
+        player = 'O' if game.current_player == 'X' else 'X'
+        return _Node(None, player, None, list(_legal_moves(game)))
+
+    def _playout(self, game, root):
+        rng = self._rng
+        node = root
+        depth = 0
+
+        # Selection
+        while not node.untried and node.children:
+            log_visits = math.log(node.visits)
+            exploration = self.exploration
+            node = max(
+                node.children.values(),
+                key=lambda child: child.wins / child.visits
+                + exploration * math.sqrt(log_visits / child.visits),
+            )
+            game.push_move(*node.move)
+            depth += 1
+
+        # Expansion
+        winner = game.check_winner()
+        if winner is None and node.untried:
+            untried = node.untried
+            index = rng.randrange(len(untried))
+            untried[index], untried[-1] = untried[-1], untried[index]
+            move = untried.pop()
+            player = game.current_player
+            game.push_move(*move)
+            depth += 1
+            winner = game.check_winner()
+            child = _Node(move, player, node, [] if winner else list(_legal_moves(game)))
+            node.children[move] = child
+            node = child
+
+        # Simulation
+        while winner is None:
+            game.push_move(*rng.choice(_legal_moves(game)))
+            depth += 1
+            winner = game.check_winner()
+
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            if winner == node.player:
+                node.wins += 1.0
+            elif winner == 'Tie':
+                node.wins += 0.5
+            node = node.parent
+
+        for _ in range(depth):
+            game.pop_move()
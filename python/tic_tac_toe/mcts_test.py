@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+import random
+import unittest
+from bitboard import BitboardTicTacToe
+from mcts import MCTSPlayer
+from mnk import MNKGame
+from tic_tac_toe import TicTacToe
+
+class TestMCTSPlayer(unittest.TestCase):
+    """
+    Test cases for the Monte Carlo Tree Search player.
+    """
+
+    def setUp(self):
+        """
+        Set up a new game and a seeded player before each test.
+        """
+        self.game = TicTacToe()
+        self.player = MCTSPlayer(iterations=2000, seed=0)
+
+    def test_takes_winning_move(self):
+        """
+        Test that MCTS completes its own line.
+        """
+        for row, col in [(1, 0), (0, 0), (1, 1), (0, 1), (2, 2)]:
+            self.game.make_move(row, col)
+        self.assertEqual(self.player(self.game), (0, 2))
+
+    def test_blocks_opponent(self):
+        """
+        Test that MCTS blocks the opponent's line.
+        """
+        for row, col in [(0, 0), (1, 1), (0, 1)]:
+            self.game.make_move(row, col)
+        self.assertEqual(self.player(self.game), (0, 2))
+
+    def test_leaves_game_unchanged(self):
+        """
+        Test that searching does not change the game.
+        """
+        self.game.make_move(0, 0)
+        self.player(self.game)
+        self.assertEqual(self.game.board, [['X', ' ', ' '], [' ', ' ', ' '], [' ', ' ', ' ']])
+        self.assertEqual(self.game.current_player, 'O')
+        self.assertEqual(self.game.moves_count, 1)
+
+    def test_iteration_budget(self):
+        """
+        Test that the iteration budget is respected and speed is reported.
+        """
+        self.player(self.game)
+        self.assertEqual(self.player.last_playouts, 2000)
+        self.assertGreater(self.player.playouts_per_second, 0)
+
+    def test_time_budget(self):
+        """
+        Test that a time-limited search stops close to its deadline.
+        """
+        player = MCTSPlayer(time_limit=0.05, seed=0)
+        player(MNKGame(9, 9, 5))
+        self.assertGreater(player.last_playouts, 0)
+        self.assertLess(player.last_seconds, 0.5)
+
+    def test_tree_reuse(self):
+        """
+        Test that the subtree for the opponent's reply is kept between turns.
+        """
+        game = BitboardTicTacToe()
+        game.make_move(*self.player(game))
+        self.assertEqual(self.player.reused_visits, 0)
+        game.make_move(*game.get_empty_cells()[0])
+        game.make_move(*self.player(game))
+        self.assertGreater(self.player.reused_visits, 0)
+
+        # A new game starts a new tree
+        self.player(BitboardTicTacToe())
+        self.assertEqual(self.player.reused_visits, 0)
+
+    def test_does_not_lose_to_random(self):
+        """
+        Test that MCTS playing 'O' never loses to random moves.
+        """
+        rng = random.Random(1)
+        for _ in range(10):
+            game = BitboardTicTacToe()
+            player = MCTSPlayer(iterations=500, seed=rng.random())
+            while not game.check_winner():
+                if game.current_player == 'X':
+                    game.make_move(*rng.choice(game.get_empty_cells()))
+                else:
+                    game.make_move(*player(game))
+            self.assertNotEqual(game.check_winner(), 'X')
+
+    def test_large_board_blocks(self):
+        """
+        Test that MCTS blocks an open three on a 9x9, k=4 board.
+        """
+        game = MNKGame(9, 9, 4)
+        for row, col in [(4, 2), (0, 0), (4, 3), (8, 8), (4, 4)]:
+            game.make_move(row, col)
+        self.assertIn(MCTSPlayer(iterations=3000, seed=0)(game), [(4, 1), (4, 5)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# Generalized m,n,k game (Tic-Tac-Toe, Gomoku, ...)
+
+# The four line directions through a cell: horizontal, vertical and the two diagonals
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+class MNKGame:
+    """
+    A class representing an m,n,k game: two players take turns placing 'X'
+    and 'O' on a rows x cols board, and the first to get win_length marks in
+    a row (horizontally, vertically or diagonally) wins. TicTacToe is the
+    3,3,3 game; Gomoku is 15,15,5.
+
+    Win detection is incremental: each move only checks the four lines through
+    the cell just played, which costs O(win_length) instead of a full board scan.
+    Because of that, the board must only be changed through make_move.
+
+    Attributes:
+        rows (int): Number of rows on the board.
+        cols (int): Number of columns on the board.
+        win_length (int): Marks in a row needed to win.
+        board (list): A rows x cols nested list. Empty spaces are ' '.
+        current_player (str): Keeps track of whose turn it is ('X' or 'O').
+        moves_count (int): Number of moves played so far.
+        winner (str or None): 'X' or 'O' once a player has won.
+        last_move (tuple or None): (row, col) of the most recent move.
+    """
+    def __init__(self, rows=3, cols=3, win_length=3, neighborhood=1):
+        if rows < 1 or cols < 1:
+            raise ValueError("The board must have at least one row and one column")
+        if not 1 <= win_length <= max(rows, cols):
+            raise ValueError(f"Win length must be between 1 and {max(rows, cols)}")
+        if neighborhood < 1:
+            raise ValueError("The candidate neighborhood must be at least 1")
+        self.rows = rows
+        self.cols = cols
+        self.win_length = win_length
+        self.board = [[' ' for _ in range(cols)] for _ in range(rows)]
+        self.current_player = 'X'
+        self.moves_count = 0
+        self.winner = None
+        self.last_move = None
+        # Empty cells within `neighborhood` steps of a mark, kept up to date by make_move
+        self._neighborhood = neighborhood
+        self._candidates = set()
+        # (row, col, previous last_move, was a candidate, candidates added) per move, for pop_move
+        self._history = []
+
+    def make_move(self, row, col):
+        """
+        Attempts to make a move at the specified position.
+
+        Args:
+            row (int): Row index (0 to rows - 1)
+            col (int): Column index (0 to cols - 1)
+
+        Returns:
+            bool: True if the move was successful, False otherwise
+        """
+        if self.winner or not (0 <= row < self.rows and 0 <= col < self.cols):
+            return False
+        if self.board[row][col] != ' ':
+            return False
+        player = self.current_player
+        if self.is_winning_move(row, col, player):
+            self.winner = player
+        self.board[row][col] = player
+        self.moves_count += 1
+        previous_move = self.last_move
+        self.last_move = (row, col)
+        self.current_player = 'O' if player == 'X' else 'X'
+
+        candidates = self._candidates
+        was_candidate = (row, col) in candidates
+        candidates.discard((row, col))
+        added = []
+        reach = self._neighborhood
+        for r in range(max(0, row - reach), min(self.rows, row + reach + 1)):
+            for c in range(max(0, col - reach), min(self.cols, col + reach + 1)):
+                if self.board[r][c] == ' ' and (r, c) not in candidates:
+                    candidates.add((r, c))
+                    added.append((r, c))
+        self._history.append((row, col, previous_move, was_candidate, added))
+        return True
+
+    def push_move(self, row, col):
+        """
+        Makes a move that can later be undone with pop_move.
+
+        This is the same as make_move; it exists so that searches read as
+        push_move/pop_move pairs on a single board instead of copying games.
+
+        Args:
+            row (int): Row index
+            col (int): Column index
+
+        Returns:
+            bool: True if the move was successful, False otherwise
+        """
+        return self.make_move(row, col)
+
+    def pop_move(self):
+        """
+        Undoes the most recent move, restoring the board, current_player,
+        moves_count, winner, last_move and candidate moves to what they were
+        before it.
+
+        Returns:
+            tuple: (row, col) of the move that was undone
+
+        Raises:
+            IndexError: If there are no moves to undo
+        """
+        row, col, previous_move, was_candidate, added = self._history.pop()
+        self.current_player = self.board[row][col]
+        self.board[row][col] = ' '
+        self.moves_count -= 1
+        # No move is accepted after a win, so the position before any move had no winner
+        self.winner = None
+        self.last_move = previous_move
+        candidates = self._candidates
+        candidates.difference_update(added)
+        if was_candidate:
+            candidates.add((row, col))
+        return (row, col)
+
+    def _run_length(self, row, col, d_row, d_col, player):
+        # Marks of `player` next to (row, col) in one direction, up to win_length - 1
+        length = 0
+        row += d_row
+        col += d_col
+        while (length < self.win_length - 1 and 0 <= row < self.rows and 0 <= col < self.cols
+               and self.board[row][col] == player):
+            length += 1
+            row += d_row
+            col += d_col
+        return length
+
+    def line_length(self, row, col, player):
+        """
+        Returns the longest line `player` would have through (row, col) after
+        playing there, capped at win_length.
+
+        Args:
+            row (int): Row index
+            col (int): Column index
+            player (str): 'X' or 'O'
+
+        Returns:
+            int: Length of the longest line through the cell
+        """
+        longest = 0
+        for d_row, d_col in DIRECTIONS:
+            length = (1 + self._run_length(row, col, d_row, d_col, player)
+                      + self._run_length(row, col, -d_row, -d_col, player))
+            if length > longest:
+                longest = length
+        return min(longest, self.win_length)
+
+    def is_winning_move(self, row, col, player):
+        """
+        Checks whether `player` would win by playing at (row, col), without
+        changing the board. Only the four lines through the cell are checked.
+
+        Args:
+            row (int): Row index
+            col (int): Column index
+            player (str): 'X' or 'O'
+
+        Returns:
+            bool: True if the move completes a line of win_length
+        """
+        return self.line_length(row, col, player) >= self.win_length
+
+    def check_winner(self):
+        """
+        Checks if there is a winner or if the game is a tie.
+
+        Returns:
+            str or None: 'X' or 'O' if there's a winner, 'Tie' if the game is a tie,
+                        None if the game is still ongoing.
+        """
+        if self.winner:
+            return self.winner
+        if self.moves_count == self.rows * self.cols:
+            return 'Tie'
+        return None
+
+    def print_board(self):
+        """
+        Prints the current state of the board with row and column indices.
+        """
+        width = len(str(max(self.rows, self.cols)))
+        print("\n" + " " * (width + 1) + " ".join(f"{col + 1:>{width}}" for col in range(self.cols)))
+        separator = " " * (width + 1) + "+".join("-" * width for _ in range(self.cols))
+        for i in range(self.rows):
+            print(f"{i + 1:>{width}} " + "|".join(f"{mark:>{width}}" for mark in self.board[i]))
+            if i < self.rows - 1:
+                print(separator)
+
+    def get_empty_cells(self):
+        """
+        Returns a list of empty cells on the board.
+
+        Returns:
+            list: List of (row, col) tuples representing empty cells
+        """
+        return [(row, col) for row in range(self.rows) for col in range(self.cols)
+                if self.board[row][col] == ' ']
+
+    def get_candidate_moves(self):
+        """
+        Returns the empty cells near existing marks, which are the only moves
+        worth searching on a large board. On an empty board this is the center.
+
+        Returns:
+            list: List of (row, col) tuples, sorted by row then column
+        """
+        if self.moves_count == 0:
+            return [(self.rows // 2, self.cols // 2)]
+        return sorted(self._candidates)
+
+    def is_board_full(self):
+        """
+        Checks if the board is full.
+
+        Returns:
+            bool: True if the board is full, False otherwise
+        """
+        return self.moves_count == self.rows * self.cols
+
+
+def make_mnk_ai_move(game):
+    """
+    Makes a move for the current player on any m,n,k board.
+
+    Strategy:
+    1. If there's a winning move, take it
+    2. If the opponent has a winning move, block it
+    3. Otherwise play the candidate cell that makes the longest own line or
+       blocks the longest opponent line, preferring attack, then cells
+       closer to the center
+
+    Only cells next to existing marks are considered, so the cost depends on
+    the number of marks rather than the size of the board.
+
+    Args:
+        game (MNKGame): The current game state
+
+    Returns:
+        tuple: (row, col) representing the AI's move
+    """
+    player = game.current_player
+    opponent = 'O' if player == 'X' else 'X'
+    candidates = game.get_candidate_moves()
+
+    for row, col in candidates:
+        if game.is_winning_move(row, col, player):
+            return (row, col)
+    for row, col in candidates:
+        if game.is_winning_move(row, col, opponent):
+            return (row, col)
+
+    center_row = (game.rows - 1) / 2
+    center_col = (game.cols - 1) / 2
+
+    def score(cell):
+        row, col = cell
+        attack = game.line_length(row, col, player)
+        defense = game.line_length(row, col, opponent)
+        distance = max(abs(row - center_row), abs(col - center_col))
+        return (max(attack, defense), attack, -distance)
+
+    return max(candidates, key=score)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+import random
+import unittest
+from mnk import MNKGame, make_mnk_ai_move
+
+def play(game, moves):
+    """
+    Plays a list of (row, col) moves, alternating players.
+    """
+    for row, col in moves:
+        assert game.make_move(row, col), (row, col)
+
+
+class TestMNKGame(unittest.TestCase):
+    """
+    Test cases for the MNKGame class.
+    """
+
+    def setUp(self):
+        """
+        Set up a new 15x15 Gomoku game before each test.
+        """
+        self.game = MNKGame(15, 15, 5)
+
+    def test_initial_board(self):
+        """
+        Test that the board is initialized correctly.
+        """
+        self.assertEqual(len(self.game.board), 15)
+        self.assertTrue(all(len(row) == 15 for row in self.game.board))
+        self.assertEqual(len(self.game.get_empty_cells()), 225)
+        self.assertIsNone(self.game.check_winner())
+
+    def test_invalid_parameters(self):
+        """
+        Test that impossible boards are rejected.
+        """
+        with self.assertRaises(ValueError):
+            MNKGame(0, 3, 3)
+        with self.assertRaises(ValueError):
+            MNKGame(3, 3, 4)
+        with self.assertRaises(ValueError):
+            MNKGame(3, 3, 3, neighborhood=0)
+
+    def test_make_move(self):
+        """
+        Test valid, occupied and out-of-bounds moves.
+        """
+        self.assertTrue(self.game.make_move(7, 7))
+        self.assertEqual(self.game.board[7][7], 'X')
+        self.assertEqual(self.game.last_move, (7, 7))
+        self.assertFalse(self.game.make_move(7, 7))
+        self.assertFalse(self.game.make_move(15, 0))
+        self.assertEqual(self.game.current_player, 'O')
+        self.assertEqual(self.game.moves_count, 1)
+
+    def test_wins_in_every_direction(self):
+        """
+        Test horizontal, vertical and diagonal wins, with the winning mark
+        played in the middle of the line.
+        """
+        lines = [
+            [(3, 0), (3, 1), (3, 3), (3, 4), (3, 2)],
+            [(0, 9), (1, 9), (3, 9), (4, 9), (2, 9)],
+            [(5, 5), (6, 6), (8, 8), (9, 9), (7, 7)],
+            [(5, 9), (6, 8), (8, 6), (9, 5), (7, 7)],
+        ]
+        for line in lines:
+            with self.subTest(line=line):
+                game = MNKGame(15, 15, 5)
+                filler = [(14, col) for col in range(0, 14, 3)]
+                moves = [move for pair in zip(line, filler) for move in pair][:-1]
+                play(game, moves)
+                self.assertEqual(game.check_winner(), 'X')
+                self.assertFalse(game.make_move(0, 0))
+
+    def test_no_win_with_gap(self):
+        """
+        Test that four marks with a gap do not win.
+        """
+        play(self.game, [(0, 0), (10, 0), (0, 1), (10, 2), (0, 3), (10, 4), (0, 4), (10, 6)])
+        self.assertIsNone(self.game.check_winner())
+
+    def test_tic_tac_toe_tie(self):
+        """
+        Test that a full 3x3 board with no line is a tie.
+        """
+        game = MNKGame()
+        play(game, [(0, 0), (0, 1), (0, 2), (1, 1), (1, 0), (1, 2), (2, 1), (2, 0), (2, 2)])
+        self.assertEqual(game.check_winner(), 'Tie')
+        self.assertTrue(game.is_board_full())
+
+    def test_candidate_moves(self):
+        """
+        Test that candidates are the empty cells next to existing marks.
+        """
+        self.assertEqual(self.game.get_candidate_moves(), [(7, 7)])
+        self.game.make_move(0, 0)
+        self.assertEqual(self.game.get_candidate_moves(), [(0, 1), (1, 0), (1, 1)])
+        self.game.make_move(0, 1)
+        self.assertEqual(self.game.get_candidate_moves(), [(0, 2), (1, 0), (1, 1), (1, 2)])
+
+    def test_push_and_pop_restore_state(self):
+        """
+        Test that undoing every move of a random game restores each earlier state.
+        """
+        self.game = MNKGame(5, 5, 3)
+        rng = random.Random(1)
+        snapshots = []
+        while not self.game.check_winner():
+            snapshots.append((
+                [row[:] for row in self.game.board], self.game.current_player,
+                self.game.moves_count, self.game.last_move, self.game.get_candidate_moves(),
+            ))
+            self.game.push_move(*rng.choice(self.game.get_empty_cells()))
+        self.assertIsNotNone(self.game.winner)
+        while snapshots:
+            self.game.pop_move()
+            self.assertIsNone(self.game.winner)
+            self.assertEqual((
+                self.game.board, self.game.current_player, self.game.moves_count,
+                self.game.last_move, self.game.get_candidate_moves(),
+            ), snapshots.pop())
+        with self.assertRaises(IndexError):
+            self.game.pop_move()
+
+
+class TestMNKAI(unittest.TestCase):
+    """
+    Test cases for make_mnk_ai_move.
+    """
+
+    def test_takes_win(self):
+        """
+        Test that the AI completes its own line of five.
+        """
+        game = MNKGame(15, 15, 5)
+        play(game, [(7, 3), (0, 0), (7, 4), (0, 14), (7, 5), (14, 0), (7, 6), (7, 7)])
+        self.assertEqual(make_mnk_ai_move(game), (7, 2))
+
+    def test_blocks_opponent(self):
+        """
+        Test that the AI blocks an open four.
+        """
+        game = MNKGame(15, 15, 5)
+        play(game, [(7, 3), (0, 0), (7, 4), (0, 14), (7, 5), (7, 2), (7, 6)])
+        self.assertEqual(make_mnk_ai_move(game), (7, 7))
+
+    def test_opens_in_center(self):
+        """
+        Test that the AI opens in the center.
+        """
+        self.assertEqual(make_mnk_ai_move(MNKGame(15, 15, 5)), (7, 7))
+        self.assertEqual(make_mnk_ai_move(MNKGame()), (1, 1))
+
+    def test_beats_random_on_3x3(self):
+        """
+        Test that the AI mostly beats random moves as 'O' on the classic board.
+        """
+        rng = random.Random(0)
+        results = []
+        for _ in range(200):
+            game = MNKGame()
+            while not game.check_winner():
+                if game.current_player == 'X':
+                    move = rng.choice(game.get_empty_cells())
+                else:
+                    move = make_mnk_ai_move(game)
+                game.make_move(*move)
+            results.append(game.check_winner())
+        self.assertGreater(results.count('O'), 150)
+        self.assertLess(results.count('X'), 10)
+
+    def test_gomoku_self_play_finishes(self):
+        """
+        Test that a full Gomoku game between two AIs finishes.
+        """
+        game = MNKGame(15, 15, 5)
+        while not game.check_winner():
+            self.assertTrue(game.make_move(*make_mnk_ai_move(game)))
+        self.assertIn(game.check_winner(), ('X', 'O', 'Tie'))
+
+
+if __name__ == '__main__':
+    unittest.main()
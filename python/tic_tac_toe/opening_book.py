@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# Precomputed Tic-Tac-Toe move table
+#
+# The book is a flat binary file with one byte per base-3 board encoding
+# (3^9 = 19683 entries). Cell (row, col) contributes 3 ** (row * 3 + col)
+# times 1 for 'X' or 2 for 'O'. Each byte holds the best cell (row * 3 + col)
+# for the player to move, or NO_MOVE for unreachable and finished positions.
+#
+# Build it once with:
+#     python opening_book.py [path]
+
+import mmap
+import os
+import sys
+
+from bitboard import FULL_BOARD, WINNING, board_to_bits
+from tic_tac_toe import make_ai_move
+
+BOOK_SIZE = 3 ** 9
+NO_MOVE = 0xFF
+DEFAULT_BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tic_tac_toe.book')
+
+# Base-3 value of each 9-bit mask, so a board index is two table lookups
+_BASE3 = tuple(
+    sum(3 ** cell for cell in range(9) if mask >> cell & 1) for mask in range(FULL_BOARD + 1)
+)
+
+
+def board_index(x_bits, o_bits):
+    """
+    Returns the base-3 encoding of a board.
+
+    Args:
+        x_bits (int): Bitmask of the cells taken by 'X'
+        o_bits (int): Bitmask of the cells taken by 'O'
+
+    Returns:
+        int: Index into the book (0 to 19682)
+    """
+    return _BASE3[x_bits] + 2 * _BASE3[o_bits]
+
+
+def reachable_positions():
+    """
+    Enumerates every position reachable in legal play where the game is not over.
+
+    Returns:
+        dict: Maps (x_bits, o_bits) to the player to move ('X' or 'O')
+    """
+    positions = {}
+    stack = [(0, 0, 'X')]
+    while stack:
+        x_bits, o_bits, player = stack.pop()
+        if (x_bits, o_bits) in positions:
+            continue
+        if WINNING[x_bits] or WINNING[o_bits] or (x_bits | o_bits) == FULL_BOARD:
+            continue
+        positions[(x_bits, o_bits)] = player
+        occupied = x_bits | o_bits
+        for cell in range(9):
+            bit = 1 << cell
+            if occupied & bit:
+                continue
+            if player == 'X':
+                stack.append((x_bits | bit, o_bits, 'O'))
+            else:
+                stack.append((x_bits, o_bits | bit, 'X'))
+    return positions
+
+
+def build_book(path=DEFAULT_BOOK_PATH):
+    """
+    Solves every reachable position and writes the move table to a file.
+
+    Args:
+        path (str): Where to write the book
+
+    Returns:
+        int: Number of positions stored in the book
+    """
+    # The solver is only needed to build the book, never to read it
+    from bitboard import BitboardTicTacToe
+    from solver import clear_cache, make_perfect_move
+
+    # Start from an empty cache so the same moves are chosen on every build
+    clear_cache()
+    table = bytearray([NO_MOVE]) * BOOK_SIZE
+    positions = reachable_positions()
+    for (x_bits, o_bits), player in positions.items():
+        game = BitboardTicTacToe()
+        game.x_bits = x_bits
+        game.o_bits = o_bits
+        game.current_player = player
+        row, col = make_perfect_move(game)
+        table[board_index(x_bits, o_bits)] = row * 3 + col
+    with open(path, 'wb') as book_file:
+        book_file.write(table)
+    return len(positions)
+
+
+class OpeningBook:
+    """
+    A read-only, memory-mapped view of a move table built by build_book.
+
+    Attributes:
+        path (str): The file the book was loaded from.
+    """
+    def __init__(self, path=DEFAULT_BOOK_PATH):
+        self.path = path
+        with open(path, 'rb') as book_file:
+            self._table = mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ)
+        size = len(self._table)
+        if size != BOOK_SIZE:
+            self._table.close()
+            raise ValueError(f"Book {path} has {size} bytes, expected {BOOK_SIZE}")
+
+    def lookup(self, game):
+        """
+        Returns the book move for the current position.
+
+        Args:
+            game (TicTacToe): The current game state
+
+        Returns:
+            tuple or None: (row, col) of the best move, or None if the position
+                          is not in the book (finished, unreachable, or the
+                          wrong player is to move).
+        """
+        x_bits, o_bits = board_to_bits(game)
+        x_count = bin(x_bits).count('1')
+        o_count = bin(o_bits).count('1')
+        if game.current_player != ('X' if x_count == o_count else 'O'):
+            return None
+        cell = self._table[board_index(x_bits, o_bits)]
+        if cell == NO_MOVE:
+            return None
+        return (cell // 3, cell % 3)
+
+    def close(self):
+        """
+        Releases the memory map.
+        """
+        self._table.close()
+
+
+_default_book = None
+
+
+def make_book_move(game):
+    """
+    Makes a move for the current player from the default opening book.
+
+    The book is memory-mapped on the first call. Positions that are not in
+    the book fall back to make_ai_move.
+
+    Args:
+        game (TicTacToe): The current game state
+
+    Returns:
+        tuple: (row, col) representing the AI's move
+    """
+    global _default_book
+    if _default_book is None:
+        _default_book = OpeningBook()
+    move = _default_book.lookup(game)
+    if move is None:
+        return make_ai_move(game)
+    return move
+
+
+if __name__ == "__main__":
+    book_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_BOOK_PATH
+    count = build_book(book_path)
+    print(f"Wrote {count} positions to {book_path}")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+import os
+import tempfile
+import unittest
+from opening_book import (BOOK_SIZE, DEFAULT_BOOK_PATH, OpeningBook, board_index,
+                          build_book, make_book_move, reachable_positions)
+from tic_tac_toe import TicTacToe
+
+class TestOpeningBook(unittest.TestCase):
+    """
+    Test cases for the precomputed opening book.
+    """
+
+    def setUp(self):
+        """
+        Build a fresh book in a temporary directory before each test.
+        """
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'test.book')
+        self.count = build_book(self.path)
+        self.book = OpeningBook(self.path)
+
+    def tearDown(self):
+        """
+        Release the book and remove the temporary directory.
+        """
+        self.book.close()
+        self.tmp_dir.cleanup()
+
+    def test_board_index(self):
+        """
+        Test the base-3 board encoding.
+        """
+        self.assertEqual(board_index(0, 0), 0)
+        self.assertEqual(board_index(1, 0), 1)
+        self.assertEqual(board_index(0, 1), 2)
+        self.assertEqual(board_index(0b111111111, 0), (BOOK_SIZE - 1) // 2)
+        self.assertEqual(board_index(0, 0b111111111), BOOK_SIZE - 1)
+
+    def test_reachable_positions(self):
+        """
+        Test that every non-final position of legal play is enumerated.
+        """
+        self.assertEqual(len(reachable_positions()), 4520)
+        self.assertEqual(self.count, 4520)
+
+    def test_book_size(self):
+        """
+        Test that the book holds one byte per board encoding.
+        """
+        self.assertEqual(os.path.getsize(self.path), BOOK_SIZE)
+
+    def test_shipped_book_is_current(self):
+        """
+        Test that the book shipped with the game matches a fresh build.
+        """
+        with open(DEFAULT_BOOK_PATH, 'rb') as shipped, open(self.path, 'rb') as built:
+            self.assertEqual(shipped.read(), built.read())
+
+    def test_lookup(self):
+        """
+        Test book moves for an opening and a forced block.
+        """
+        game = TicTacToe()
+        self.assertEqual(self.book.lookup(game), (1, 1))
+
+        game.make_move(0, 0)
+        game.make_move(1, 1)
+        game.make_move(0, 1)
+        self.assertEqual(self.book.lookup(game), (0, 2))
+
+    def test_lookup_wrong_player(self):
+        """
+        Test that positions with the wrong player to move are not in the book.
+        """
+        game = TicTacToe()
+        game.current_player = 'O'
+        self.assertIsNone(self.book.lookup(game))
+
+    def test_make_book_move_falls_back(self):
+        """
+        Test that positions outside the book fall back to the simple AI.
+        """
+        game = TicTacToe()
+        game.board[0][0] = 'X'
+        game.board[0][1] = 'X'
+        game.current_player = 'O'
+        self.assertEqual(make_book_move(game), (0, 2))
+
+    def test_rejects_wrong_size(self):
+        """
+        Test that a truncated book is rejected.
+        """
+        with open(self.path, 'wb') as book_file:
+            book_file.write(b'\x00' * 10)
+        with self.assertRaises(ValueError):
+            OpeningBook(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# Asyncio Tic-Tac-Toe game server
+#
+# Each TCP connection is one game session. Clients send one command per
+# line and get exactly one line back:
+#
+#     NEW [human|<AI strength>]       Start a game. With an AI strength the
+#                                     client plays 'X' and the AI plays 'O'.
+#                                     Strengths are listed in AI_STRENGTHS;
+#                                     the default is 'basic'.
+#     MOVE <row> <col>                Play at row, col (1-3, like play_game)
+#     BOARD                           Show the current game
+#     STATS                           Session latency and server counters
+#     QUIT                            Close the session
+#
+# Game replies look like "OK <cells> <state> [AI <row> <col>]", where
+# <cells> is the board row by row with '.' for empty cells and <state> is
+# the player to move ('X' or 'O'), 'WIN:X', 'WIN:O' or 'TIE'. Errors are
+# "ERR <message>". A line longer than the stream limit (64 KiB) gets
+# "ERR Line too long" and the session is closed.
+#
+#     python server.py --port 9999
+
+import argparse
+import asyncio
+import itertools
+import time
+
+from bitboard import BitboardTicTacToe
+from tic_tac_toe import AI_STRENGTHS, get_ai_player
+
+# AI strengths that can take long enough to stall other sessions, and are
+# therefore run in a worker thread instead of on the event loop
+OFFLOADED_STRENGTHS = {'perfect', 'mcts'}
+
+
+class GameSession:
+    """
+    One client's game and its latency counters.
+
+    Attributes:
+        session_id (int): Unique id of the session on this server.
+        game (BitboardTicTacToe or None): The current game, if one was started.
+        opponent (str): 'human' or the AI strength playing 'O'.
+        ai_player (callable or None): The AI's move function, if any.
+        commands (int): Number of commands handled.
+        total_latency (float): Seconds spent handling commands.
+        max_latency (float): Slowest command, in seconds.
+    """
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.game = None
+        self.opponent = 'human'
+        self.ai_player = None
+        self.commands = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def record_latency(self, seconds):
+        """
+        Adds one command's handling time to the counters.
+
+        Args:
+            seconds (float): Time taken by the command
+        """
+        self.commands += 1
+        self.total_latency += seconds
+        if seconds > self.max_latency:
+            self.max_latency = seconds
+
+    @property
+    def mean_latency(self):
+        """
+        Average seconds per command.
+        """
+        return self.total_latency / self.commands if self.commands else 0.0
+
+
+def describe(game):
+    """
+    Returns the "<cells> <state>" part of a game reply.
+
+    Args:
+        game (TicTacToe): The game to describe
+
+    Returns:
+        str: The board cells and the game state
+    """
+    cells = ''.join(mark if mark != ' ' else '.' for row in game.board for mark in row)
+    winner = game.check_winner()
+    if winner == 'Tie':
+        state = 'TIE'
+    elif winner:
+        state = f'WIN:{winner}'
+    else:
+        state = game.current_player
+    return f"{cells} {state}"
+
+
+class GameServer:
+    """
+    Hosts many concurrent Tic-Tac-Toe sessions over a line-based TCP protocol.
+
+    Attributes:
+        host (str): Address to listen on.
+        port (int): Port to listen on; 0 picks a free port, which is stored
+                    here once the server has started.
+        sessions (dict): Maps session ids to the open GameSession objects.
+        total_moves (int): Moves played by clients and AIs since start.
+    """
+    def __init__(self, host='127.0.0.1', port=0):
+        self.host = host
+        self.port = port
+        self.sessions = {}
+        self.total_moves = 0
+        self.started_at = None
+        self._server = None
+        self._session_ids = itertools.count(1)
+
+    async def start(self):
+        """
+        Starts listening for connections.
+        """
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.started_at = time.perf_counter()
+
+    async def serve_forever(self):
+        """
+        Starts the server if needed and serves until cancelled.
+        """
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """
+        Stops accepting connections and waits for the listener to close.
+        """
+        self._server.close()
+        await self._server.wait_closed()
+
+    def stats(self):
+        """
+        Returns the server-wide counters.
+
+        Returns:
+            dict: Open sessions, total moves and moves per second since start
+        """
+        elapsed = time.perf_counter() - self.started_at if self.started_at else 0.0
+        return {
+            'sessions': len(self.sessions),
+            'moves': self.total_moves,
+            'moves_per_sec': self.total_moves / elapsed if elapsed else 0.0,
+        }
+
+    async def _handle_client(self, reader, writer):
+        session = GameSession(next(self._session_ids))
+        self.sessions[session.session_id] = session
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # The line was longer than the stream limit; its rest
+                    # cannot be told apart from the next command, so close
+                    writer.write(b"ERR Line too long\n")
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                start = time.perf_counter()
+                reply = await self.handle_command(session, line.decode('utf-8', 'replace'))
+                if reply is None:
+                    break
+                writer.write(reply.encode() + b'\n')
+                session.record_latency(time.perf_counter() - start)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            del self.sessions[session.session_id]
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def handle_command(self, session, line):
+        """
+        Handles one command line for a session.
+
+        Args:
+            session (GameSession): The client's session
+            line (str): The command, with or without its newline
+
+        Returns:
+            str or None: The reply line, or None if the session should close
+        """
+        parts = line.split()
+        if not parts:
+            return "ERR Empty command"
+        command = parts[0].upper()
+
+        if command == 'QUIT':
+            return None
+        if command == 'NEW':
+            return self._new_game(session, parts[1:])
+        if command == 'STATS':
+            stats = self.stats()
+            return (f"OK sessions={stats['sessions']} moves={stats['moves']} "
+                    f"moves_per_sec={stats['moves_per_sec']:.1f} commands={session.commands} "
+                    f"mean_latency_ms={session.mean_latency * 1000:.3f} "
+                    f"max_latency_ms={session.max_latency * 1000:.3f}")
+        if session.game is None:
+            return "ERR No game in progress. Send NEW first."
+        if command == 'BOARD':
+            return f"OK {describe(session.game)}"
+        if command == 'MOVE':
+            return await self._move(session, parts[1:])
+        return f"ERR Unknown command: {parts[0]}"
+
+    def _new_game(self, session, args):
+        opponent = args[0].lower() if args else 'basic'
+        if opponent != 'human' and opponent not in AI_STRENGTHS:
+            return f"ERR Unknown opponent: {opponent}"
+        session.game = BitboardTicTacToe()
+        session.opponent = opponent
+        session.ai_player = None if opponent == 'human' else get_ai_player(opponent)
+        return f"OK {describe(session.game)}"
+
+    async def _move(self, session, args):
+        game = session.game
+        if game.check_winner():
+            return "ERR The game is over. Send NEW to play again."
+        try:
+            row, col = map(int, args)
+        except ValueError:
+            return "ERR Invalid input. Send MOVE followed by two numbers."
+        if not (1 <= row <= 3 and 1 <= col <= 3):
+            return "ERR Invalid move. Row and column must be between 1 and 3."
+        if not game.make_move(row - 1, col - 1):
+            return "ERR That position is already taken."
+        self.total_moves += 1
+
+        if session.ai_player is None or game.check_winner():
+            return f"OK {describe(game)}"
+
+        if session.opponent in OFFLOADED_STRENGTHS:
+            loop = asyncio.get_running_loop()
+            ai_row, ai_col = await loop.run_in_executor(None, session.ai_player, game)
+        else:
+            ai_row, ai_col = session.ai_player(game)
+        game.make_move(ai_row, ai_col)
+        self.total_moves += 1
+        return f"OK {describe(game)} AI {ai_row + 1} {ai_col + 1}"
+
+
+def main():
+    """
+    Runs the game server from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Tic-Tac-Toe game server")
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on")
+    parser.add_argument('--port', type=int, default=9999, help="port to listen on")
+    args = parser.parse_args()
+
+    server = GameServer(args.host, args.port)
+
+    async def run():
+        await server.start()
+        print(f"Serving Tic-Tac-Toe on {server.host}:{server.port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+import asyncio
+import unittest
+from server import GameServer
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases for the asyncio game server, against localhost.
+    """
+
+    async def asyncSetUp(self):
+        """
+        Start a server on a free port before each test.
+        """
+        self.server = GameServer(port=0)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        """
+        Stop the server after each test.
+        """
+        await self.server.close()
+
+    async def connect(self):
+        """
+        Opens a client connection and returns a function that sends one
+        command and returns the reply line.
+        """
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.server.port)
+        self.addAsyncCleanup(self.disconnect, writer)
+
+        async def send(command):
+            writer.write(command.encode() + b'\n')
+            await writer.drain()
+            return (await reader.readline()).decode().rstrip('\n')
+        return send
+
+    async def disconnect(self, writer):
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_human_game(self):
+        """
+        Test a hot-seat game that X wins.
+        """
+        send = await self.connect()
+        self.assertEqual(await send("NEW human"), "OK ......... X")
+        self.assertEqual(await send("MOVE 1 1"), "OK X........ O")
+        await send("MOVE 2 1")
+        await send("MOVE 1 2")
+        await send("MOVE 2 2")
+        self.assertEqual(await send("MOVE 1 3"), "OK XXXOO.... WIN:X")
+        self.assertTrue((await send("MOVE 3 3")).startswith("ERR"))
+        self.assertEqual(await send("BOARD"), "OK XXXOO.... WIN:X")
+
+    async def test_ai_game(self):
+        """
+        Test that the AI answers every move, including offloaded strengths.
+        """
+        for strength in ('basic', 'perfect', 'book'):
+            with self.subTest(strength=strength):
+                send = await self.connect()
+                await send(f"NEW {strength}")
+                reply = await send("MOVE 1 1")
+                self.assertEqual(reply, "OK X...O.... X AI 2 2")
+
+    async def test_errors(self):
+        """
+        Test replies to invalid commands and moves.
+        """
+        send = await self.connect()
+        self.assertTrue((await send("MOVE 1 1")).startswith("ERR No game"))
+        self.assertTrue((await send("NEW grandmaster")).startswith("ERR Unknown opponent"))
+        await send("NEW human")
+        self.assertTrue((await send("MOVE 4 1")).startswith("ERR Invalid move"))
+        self.assertTrue((await send("MOVE a b")).startswith("ERR Invalid input"))
+        await send("MOVE 1 1")
+        self.assertTrue((await send("MOVE 1 1")).startswith("ERR That position"))
+        self.assertTrue((await send("JUMP")).startswith("ERR Unknown command"))
+        self.assertTrue((await send("")).startswith("ERR Empty"))
+
+    async def test_stats(self):
+        """
+        Test that moves and latencies are counted.
+        """
+        send = await self.connect()
+        await send("NEW basic")
+        await send("MOVE 1 1")
+        reply = await send("STATS")
+        self.assertTrue(reply.startswith("OK sessions=1 moves=2 "))
+        self.assertIn("commands=2", reply)
+        self.assertIn("max_latency_ms=", reply)
+
+    async def test_quit_closes_session(self):
+        """
+        Test that QUIT ends the session.
+        """
+        send = await self.connect()
+        await send("NEW")
+        self.assertEqual(await send("QUIT"), "")
+        self.assertEqual(self.server.sessions, {})
+
+    async def test_line_too_long(self):
+        """
+        Test that a line over the stream limit gets an error and closes the
+        session, without affecting other sessions.
+        """
+        other = await self.connect()
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.server.port)
+        self.addAsyncCleanup(self.disconnect, writer)
+        writer.write(b"NEW " + b"x" * 100_000 + b"\n")
+        await writer.drain()
+        self.assertEqual(await reader.readline(), b"ERR Line too long\n")
+        self.assertEqual(await reader.read(), b"")
+        self.assertEqual(len(self.server.sessions), 1)
+        self.assertEqual(await other("NEW human"), "OK ......... X")
+
+    async def test_concurrent_sessions(self):
+        """
+        Test that many sessions play full games at the same time.
+        """
+        async def play():
+            send = await self.connect()
+            await send("NEW book")
+            reply = ""
+            for row, col in [(1, 1), (1, 2), (1, 3), (2, 1), (2, 2), (2, 3), (3, 1), (3, 2), (3, 3)]:
+                candidate = await send(f"MOVE {row} {col}")
+                if candidate.startswith("OK"):
+                    reply = candidate
+                if "WIN" in reply or "TIE" in reply:
+                    break
+            return reply.split()[2]
+
+        results = await asyncio.gather(*(play() for _ in range(200)))
+        self.assertEqual(len(results), 200)
+        self.assertNotIn('WIN:X', results)
+        self.assertGreater(self.server.stats()['moves'], 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# Batched Tic-Tac-Toe self-play simulator
+#
+# Plays N games at once without any input() or print() calls. Boards are an
+# (N, 9) int8 array with cell (row, col) in column row * 3 + col, holding
+# 1 for 'X', -1 for 'O' and 0 for an empty cell. Every game in a batch
+# starts together, so all unfinished games have the same player to move.
+#
+# Run it to see how the heuristic policy does against the other policies,
+# playing either side:
+#     python simulator.py [games]
+
+import sys
+import time
+
+import numpy as np
+
+from bitboard import WIN_MASKS
+from opening_book import BOOK_SIZE, DEFAULT_BOOK_PATH, NO_MOVE
+
+X = 1
+O = -1
+
+# (9, 8) matrix with a 1 where a cell belongs to a winning line. A board
+# times this matrix gives each line's sum, which is +3 or -3 on a win.
+LINES = np.array(
+    [[mask >> cell & 1 for mask in WIN_MASKS] for cell in range(9)], dtype=np.int8
+)
+
+_CELLS = np.arange(9)
+_BASE3 = (3 ** _CELLS).astype(np.int32)
+
+# make_ai_move's fallback order: center, then corners, then edges, ties
+# going to the lowest cell index
+_STATIC_PRIORITY = np.array([100, 0, 100, 0, 200, 0, 100, 0, 100], dtype=np.int16) - _CELLS
+
+
+def winners(boards):
+    """
+    Returns the winner of each board.
+
+    Args:
+        boards (numpy.ndarray): (N, 9) int8 boards
+
+    Returns:
+        numpy.ndarray: (N,) int8 array of X, O, or 0 when nobody has won
+    """
+    line_sums = boards @ LINES
+    return np.where((line_sums == 3).any(axis=1), X,
+                    np.where((line_sums == -3).any(axis=1), O, 0)).astype(np.int8)
+
+
+def random_policy(boards, player, rng):
+    """
+    Picks a uniformly random empty cell on each board.
+
+    Args:
+        boards (numpy.ndarray): (N, 9) int8 boards, none of them full
+        player (int): X or O, the player to move
+        rng (numpy.random.Generator): Source of randomness
+
+    Returns:
+        numpy.ndarray: (N,) cell indices
+    """
+    noise = rng.random(boards.shape)
+    noise[boards != 0] = -1.0
+    return noise.argmax(axis=1)
+
+
+def heuristic_policy(boards, player, rng):
+    """
+    The make_ai_move strategy for either player, applied to a whole batch
+    at once.
+
+    Wins if possible, then blocks, then takes the center, a corner or an edge,
+    breaking ties by the lowest cell index. As 'O' this is exactly
+    make_ai_move. make_ai_move itself always plays for 'O', so called for
+    'X' it would block before winning; this policy wins first for either
+    player.
+
+    Args:
+        boards (numpy.ndarray): (N, 9) int8 boards, none of them full
+        player (int): X or O, the player to move
+        rng (numpy.random.Generator): Unused; kept for the policy signature
+
+    Returns:
+        numpy.ndarray: (N,) cell indices
+    """
+    empty = boards == 0
+    empty_counts = empty.astype(np.int8) @ LINES
+    line_sums = boards @ LINES
+    open_lines = empty_counts == 1
+    winning_cells = ((line_sums == 2 * player) & open_lines).astype(np.int8) @ LINES.T > 0
+    blocking_cells = ((line_sums == -2 * player) & open_lines).astype(np.int8) @ LINES.T > 0
+
+    scores = np.where(winning_cells, 400 - _CELLS,
+                      np.where(blocking_cells, 300 - _CELLS, _STATIC_PRIORITY))
+    scores = np.where(empty, scores, -1000)
+    return scores.argmax(axis=1)
+
+
+_book_table = None
+
+
+def solver_policy(boards, player, rng):
+    """
+    Perfect play, read from the opening book for the whole batch.
+
+    Args:
+        boards (numpy.ndarray): (N, 9) int8 boards reached in legal play
+        player (int): X or O, the player to move
+        rng (numpy.random.Generator): Unused; kept for the policy signature
+
+    Returns:
+        numpy.ndarray: (N,) cell indices
+    """
+    global _book_table
+    if _book_table is None:
+        _book_table = np.fromfile(DEFAULT_BOOK_PATH, dtype=np.uint8)
+        if _book_table.size != BOOK_SIZE:
+            raise ValueError(f"Book {DEFAULT_BOOK_PATH} has {_book_table.size} bytes, expected {BOOK_SIZE}")
+    # -1 % 3 == 2, which is the book's code for 'O'
+    indices = (boards.astype(np.int32) % 3) @ _BASE3
+    moves = _book_table[indices]
+    if (moves == NO_MOVE).any():
+        raise ValueError("Board is not a reachable position in the opening book")
+    return moves.astype(np.intp)
+
+
+POLICIES = {
+    'random': random_policy,
+    'heuristic': heuristic_policy,
+    'solver': solver_policy,
+}
+
+
+class SimulationResult:
+    """
+    Outcome counts for a batch of simulated games.
+
+    Attributes:
+        games (int): Number of games played.
+        x_wins (int): Games won by 'X'.
+        o_wins (int): Games won by 'O'.
+        draws (int): Games that ended in a tie.
+        seconds (float): Wall-clock time taken.
+    """
+    def __init__(self, x_wins, o_wins, draws, seconds=0.0):
+        self.x_wins = x_wins
+        self.o_wins = o_wins
+        self.draws = draws
+        self.games = x_wins + o_wins + draws
+        self.seconds = seconds
+
+    def rates(self, player):
+        """
+        Returns the win, draw and loss rates from one player's point of view.
+
+        Args:
+            player (str): 'X' or 'O'
+
+        Returns:
+            tuple: (win_rate, draw_rate, loss_rate) as fractions of all games
+        """
+        wins, losses = (self.x_wins, self.o_wins) if player == 'X' else (self.o_wins, self.x_wins)
+        return (wins / self.games, self.draws / self.games, losses / self.games)
+
+    @property
+    def games_per_second(self):
+        """
+        Throughput of the simulation run.
+        """
+        return self.games / self.seconds if self.seconds else float('inf')
+
+    def __repr__(self):
+        return (f"SimulationResult(x_wins={self.x_wins}, o_wins={self.o_wins}, "
+                f"draws={self.draws})")
+
+
+def simulate(x_policy, o_policy, games, seed=None):
+    """
+    Plays a batch of games between two policies.
+
+    Args:
+        x_policy (callable or str): Policy for 'X', or a name from POLICIES
+        o_policy (callable or str): Policy for 'O', or a name from POLICIES
+        games (int): Number of games to play
+        seed (int): Seed for the random number generator
+
+    Returns:
+        SimulationResult: The outcome counts
+    """
+    x_policy = POLICIES[x_policy] if isinstance(x_policy, str) else x_policy
+    o_policy = POLICIES[o_policy] if isinstance(o_policy, str) else o_policy
+    rng = np.random.default_rng(seed)
+    start = time.perf_counter()
+
+    boards = np.zeros((games, 9), dtype=np.int8)
+    results = np.zeros(games, dtype=np.int8)
+    active = np.arange(games)
+    player = X
+    for _ in range(9):
+        if active.size == 0:
+            break
+        batch = boards[active]
+        policy = x_policy if player == X else o_policy
+        moves = policy(batch, player, rng)
+        batch[np.arange(active.size), moves] = player
+        boards[active] = batch
+
+        # Only the player who just moved can have completed a line
+        won = ((batch @ LINES) == 3 * player).any(axis=1)
+        results[active[won]] = player
+        active = active[~won]
+        player = -player
+
+    x_wins = int(np.count_nonzero(results == X))
+    o_wins = int(np.count_nonzero(results == O))
+    return SimulationResult(x_wins, o_wins, games - x_wins - o_wins,
+                            time.perf_counter() - start)
+
+
+def main(games=100000):
+    """
+    Reports how the heuristic policy does against every policy, as 'O',
+    where it plays exactly like make_ai_move in play_game, and as 'X', where
+    it plays the same strategy for 'X' rather than make_ai_move's moves.
+    """
+    print("heuristic (O) is make_ai_move; heuristic (X) is its strategy played for 'X'")
+    print(f"{'matchup':<26} {'win':>7} {'draw':>7} {'loss':>7} {'games/s':>12}")
+    for opponent in POLICIES:
+        for heuristic_side in ('O', 'X'):
+            if heuristic_side == 'O':
+                result = simulate(opponent, 'heuristic', games, seed=0)
+                label = f"heuristic (O) vs {opponent}"
+            else:
+                result = simulate('heuristic', opponent, games, seed=0)
+                label = f"heuristic (X) vs {opponent}"
+            win, draw, loss = result.rates(heuristic_side)
+            print(f"{label:<26} {win:>7.2%} {draw:>7.2%} {loss:>7.2%} "
+                  f"{result.games_per_second:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+import unittest
+import numpy as np
+from opening_book import make_book_move, reachable_positions
+from simulator import (O, X, heuristic_policy, random_policy, simulate,
+                       solver_policy, winners)
+from tic_tac_toe import TicTacToe, make_ai_move
+
+def positions_to_play(player):
+    """
+    Returns every reachable position with the given player to move, both as
+    TicTacToe games and as an (N, 9) int8 array.
+    """
+    games = []
+    rows = []
+    for (x_bits, o_bits), to_move in reachable_positions().items():
+        if to_move != player:
+            continue
+        game = TicTacToe()
+        row = []
+        for cell in range(9):
+            mark = 'X' if x_bits >> cell & 1 else 'O' if o_bits >> cell & 1 else ' '
+            game.board[cell // 3][cell % 3] = mark
+            row.append(X if mark == 'X' else O if mark == 'O' else 0)
+        game.current_player = player
+        game.moves_count = bin(x_bits | o_bits).count('1')
+        games.append(game)
+        rows.append(row)
+    return games, np.array(rows, dtype=np.int8)
+
+
+def heuristic_move(game, player):
+    """
+    make_ai_move's strategy for either player: win, block, then the center,
+    corners and edges.
+    """
+    opponent = 'O' if player == 'X' else 'X'
+    empty_cells = game.get_empty_cells()
+    for mark in (player, opponent):
+        for row, col in empty_cells:
+            game.board[row][col] = mark
+            completes_line = game.check_winner() == mark
+            game.board[row][col] = ' '
+            if completes_line:
+                return (row, col)
+    for cell in [(1, 1), (0, 0), (0, 2), (2, 0), (2, 2), (0, 1), (1, 0), (1, 2), (2, 1)]:
+        if cell in empty_cells:
+            return cell
+
+
+class TestSimulator(unittest.TestCase):
+    """
+    Test cases for the batched simulator.
+    """
+
+    def test_winners(self):
+        """
+        Test winner detection on a batch of boards.
+        """
+        boards = np.array([
+            [1, 1, 1, -1, -1, 0, 0, 0, 0],
+            [1, 1, -1, 0, -1, 0, -1, 0, 1],
+            [1, -1, 1, 1, -1, -1, -1, 1, 1],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+        ], dtype=np.int8)
+        self.assertEqual(winners(boards).tolist(), [X, O, 0, 0])
+
+    def test_random_policy_picks_empty_cells(self):
+        """
+        Test that random moves always land on empty cells.
+        """
+        rng = np.random.default_rng(0)
+        _, boards = positions_to_play('O')
+        moves = random_policy(boards, O, rng)
+        self.assertTrue((boards[np.arange(len(boards)), moves] == 0).all())
+
+    def test_heuristic_policy_matches_make_ai_move(self):
+        """
+        Test that the batched heuristic plays exactly like make_ai_move as 'O'.
+        """
+        games, boards = positions_to_play('O')
+        moves = heuristic_policy(boards, O, None)
+        for game, move in zip(games, moves):
+            self.assertEqual(make_ai_move(game), (move // 3, move % 3))
+
+    def test_heuristic_policy_plays_both_sides(self):
+        """
+        Test that the batched heuristic wins before it blocks for either player.
+        """
+        for player, mark in ((X, 'X'), (O, 'O')):
+            games, boards = positions_to_play(mark)
+            moves = heuristic_policy(boards, player, None)
+            for game, move in zip(games, moves):
+                self.assertEqual(heuristic_move(game, mark), (move // 3, move % 3))
+
+    def test_solver_policy_matches_book(self):
+        """
+        Test that the batched solver plays exactly like the opening book.
+        """
+        for player, mark in ((X, 'X'), (O, 'O')):
+            games, boards = positions_to_play(mark)
+            moves = solver_policy(boards, player, None)
+            for game, move in zip(games, moves):
+                self.assertEqual(make_book_move(game), (move // 3, move % 3))
+
+    def test_simulate_counts(self):
+        """
+        Test that every game is counted exactly once and seeds are reproducible.
+        """
+        result = simulate('random', 'random', 2000, seed=1)
+        self.assertEqual(result.games, 2000)
+        self.assertEqual(result.x_wins + result.o_wins + result.draws, 2000)
+        again = simulate('random', 'random', 2000, seed=1)
+        self.assertEqual((result.x_wins, result.o_wins, result.draws),
+                         (again.x_wins, again.o_wins, again.draws))
+        self.assertAlmostEqual(sum(result.rates('X')), 1.0)
+
+    def test_solver_never_loses(self):
+        """
+        Test that perfect play never loses to random play on either side.
+        """
+        self.assertEqual(simulate('solver', 'random', 2000, seed=2).o_wins, 0)
+        self.assertEqual(simulate('random', 'solver', 2000, seed=3).x_wins, 0)
+        self.assertEqual(simulate('solver', 'solver', 10).draws, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# Perfect-play Tic-Tac-Toe solver
+
+from bitboard import FULL_BOARD, WINNING, board_to_bits
+
+# The 8 symmetries of the square as (row, col) -> (row, col) maps:
+# identity, three rotations, and four reflections.
+_TRANSFORMS = (
+    lambda r, c: (r, c),
+    lambda r, c: (c, 2 - r),
+    lambda r, c: (2 - r, 2 - c),
+    lambda r, c: (2 - c, r),
+    lambda r, c: (r, 2 - c),
+    lambda r, c: (2 - r, c),
+    lambda r, c: (c, r),
+    lambda r, c: (2 - c, 2 - r),
+)
+
+
+def _cell_permutation(transform):
+    permutation = []
+    for cell in range(9):
+        row, col = transform(cell // 3, cell % 3)
+        permutation.append(row * 3 + col)
+    return tuple(permutation)
+
+
+def _mask_table(permutation):
+    table = []
+    for mask in range(FULL_BOARD + 1):
+        mapped = 0
+        for cell in range(9):
+            if mask >> cell & 1:
+                mapped |= 1 << permutation[cell]
+        table.append(mapped)
+    return tuple(table)
+
+
+# Cell permutations, their inverses, and 512-entry mask tables per symmetry
+_PERMUTATIONS = tuple(_cell_permutation(transform) for transform in _TRANSFORMS)
+_INVERSES = tuple(
+    tuple(permutation.index(cell) for cell in range(9)) for permutation in _PERMUTATIONS
+)
+_MASK_TABLES = tuple(_mask_table(permutation) for permutation in _PERMUTATIONS)
+
+# Center first, then corners, then edges: strong moves first means more cutoffs
+_MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+# Transposition table flags
+_EXACT = 0
+_LOWER = 1
+_UPPER = 2
+
+_INFINITY = 100
+
+# Canonical position -> (value, flag)
+_transposition_table = {}
+# Canonical position -> best cell, in canonical orientation
+_best_moves = {}
+
+
+def canonical_key(own, opp):
+    """
+    Returns the canonical hash of a position under the 8 symmetries of the board.
+
+    Args:
+        own (int): Bitmask of the player to move
+        opp (int): Bitmask of the other player
+
+    Returns:
+        tuple: (key, symmetry) where key is the smallest 18-bit encoding of the
+               position over all symmetries and symmetry is the index of the
+               transform that produces it.
+    """
+    best_key = None
+    best_symmetry = 0
+    for symmetry, table in enumerate(_MASK_TABLES):
+        key = table[own] << 9 | table[opp]
+        if best_key is None or key < best_key:
+            best_key = key
+            best_symmetry = symmetry
+    return best_key, best_symmetry
+
+
+def _negamax(own, opp, alpha, beta):
+    # The opponent just moved, so only they can have completed a line.
+    # Scores are scaled by the empty cells left so that faster wins rank higher.
+    occupied = own | opp
+    if WINNING[opp]:
+        return -1 - (9 - bin(occupied).count('1'))
+    if occupied == FULL_BOARD:
+        return 0
+
+    key, _ = canonical_key(own, opp)
+    entry = _transposition_table.get(key)
+    if entry is not None:
+        value, flag = entry
+        if flag == _EXACT:
+            return value
+        if flag == _LOWER:
+            alpha = max(alpha, value)
+        else:
+            beta = min(beta, value)
+        if alpha >= beta:
+            return value
+
+    original_alpha = alpha
+    best = -_INFINITY
+    for cell in _MOVE_ORDER:
+        bit = 1 << cell
+        if occupied & bit:
+            continue
+        value = -_negamax(opp, own | bit, -beta, -alpha)
+        if value > best:
+            best = value
+        if best > alpha:
+            alpha = best
+        if alpha >= beta:
+            break
+
+    if best <= original_alpha:
+        flag = _UPPER
+    elif best >= beta:
+        flag = _LOWER
+    else:
+        flag = _EXACT
+    _transposition_table[key] = (best, flag)
+    return best
+
+
+def _player_masks(game):
+    x_bits, o_bits = board_to_bits(game)
+    if game.current_player == 'X':
+        return x_bits, o_bits
+    return o_bits, x_bits
+
+
+def evaluate(game):
+    """
+    Returns the game-theoretic value of a position for the player to move.
+
+    Args:
+        game (TicTacToe): The current game state
+
+    Returns:
+        int: Positive if the player to move wins with perfect play, negative if
+             they lose, 0 for a draw. Larger magnitudes mean faster results.
+    """
+    own, opp = _player_masks(game)
+    return _negamax(own, opp, -_INFINITY, _INFINITY)
+
+
+def make_perfect_move(game):
+    """
+    Makes a move for the current player using full negamax search.
+
+    Results are cached by canonical position, so each of the distinct
+    positions is searched at most once per process and later calls are
+    a dictionary lookup.
+
+    Args:
+        game (TicTacToe): The current game state
+
+    Returns:
+        tuple: (row, col) representing the best move
+    """
+    own, opp = _player_masks(game)
+    key, symmetry = canonical_key(own, opp)
+    canonical_cell = _best_moves.get(key)
+    if canonical_cell is None:
+        occupied = own | opp
+        best_value = -_INFINITY
+        best_cell = None
+        for cell in _MOVE_ORDER:
+            bit = 1 << cell
+            if occupied & bit:
+                continue
+            value = -_negamax(opp, own | bit, -_INFINITY, _INFINITY)
+            if value > best_value:
+                best_value = value
+                best_cell = cell
+        if best_cell is None:
+            raise ValueError("No moves left on the board")
+        canonical_cell = _PERMUTATIONS[symmetry][best_cell]
+        _best_moves[key] = canonical_cell
+    cell = _INVERSES[symmetry][canonical_cell]
+    return (cell // 3, cell % 3)
+
+
+def clear_cache():
+    """
+    Empties the transposition table and the best-move cache.
+    """
+    _transposition_table.clear()
+    _best_moves.clear()
+
+
+def cache_size():
+    """
+    Returns the number of positions held in the transposition table.
+
+    Returns:
+        int: Number of cached canonical positions
+    """
+    return len(_transposition_table)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+import unittest
+from bitboard import BitboardTicTacToe
+from solver import canonical_key, cache_size, clear_cache, evaluate, make_perfect_move
+from tic_tac_toe import TicTacToe
+
+class TestSolver(unittest.TestCase):
+    """
+    Test cases for the perfect-play solver.
+    """
+
+    def setUp(self):
+        """
+        Set up a new game instance before each test.
+        """
+        self.game = TicTacToe()
+
+    def test_empty_board_is_a_draw(self):
+        """
+        Test that the empty board evaluates to a draw.
+        """
+        self.assertEqual(evaluate(self.game), 0)
+
+    def test_takes_winning_move(self):
+        """
+        Test that the solver completes its own line.
+        """
+        self.game.board[0][0] = 'O'
+        self.game.board[0][1] = 'O'
+        self.game.board[1][0] = 'X'
+        self.game.board[1][1] = 'X'
+        self.game.board[2][2] = 'X'
+        self.game.current_player = 'O'
+        self.assertEqual(make_perfect_move(self.game), (0, 2))
+
+    def test_blocks_opponent(self):
+        """
+        Test that the solver blocks the opponent's line.
+        """
+        self.game.board[0][0] = 'X'
+        self.game.board[0][1] = 'X'
+        self.game.board[1][1] = 'O'
+        self.game.current_player = 'O'
+        self.assertEqual(make_perfect_move(self.game), (0, 2))
+
+    def test_canonical_key_is_symmetric(self):
+        """
+        Test that all corner openings share a canonical key.
+        """
+        keys = {canonical_key(1 << cell, 0)[0] for cell in (0, 2, 6, 8)}
+        self.assertEqual(len(keys), 1)
+        self.assertNotEqual(canonical_key(1 << 4, 0)[0], keys.pop())
+
+    def test_cache_is_reused(self):
+        """
+        Test that a second solve does not grow the transposition table.
+        """
+        clear_cache()
+        make_perfect_move(self.game)
+        size = cache_size()
+        self.assertGreater(size, 0)
+        make_perfect_move(TicTacToe())
+        self.assertEqual(cache_size(), size)
+
+    def test_self_play_is_a_draw(self):
+        """
+        Test that two perfect players always draw.
+        """
+        game = BitboardTicTacToe()
+        while not game.check_winner():
+            game.make_move(*make_perfect_move(game))
+        self.assertEqual(game.check_winner(), 'Tie')
+
+    def test_never_loses(self):
+        """
+        Test that the solver never loses against any sequence of opponent moves.
+        """
+        def explore(game, solver_player):
+            winner = game.check_winner()
+            if winner:
+                self.assertNotEqual(winner, 'O' if solver_player == 'X' else 'X')
+                return
+            if game.current_player == solver_player:
+                moves = [make_perfect_move(game)]
+            else:
+                moves = game.get_empty_cells()
+            for row, col in moves:
+                child = BitboardTicTacToe()
+                child.x_bits, child.o_bits = game.x_bits, game.o_bits
+                child.current_player, child.moves_count = game.current_player, game.moves_count
+                child.make_move(row, col)
+                explore(child, solver_player)
+
+        explore(BitboardTicTacToe(), 'X')
+        explore(BitboardTicTacToe(), 'O')
+
+
+if __name__ == '__main__':
+    unittest.main()
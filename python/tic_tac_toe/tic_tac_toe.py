@@ -19,6 +19,8 @@ class TicTacToe:
         self.board = [[' ' for _ in range(3)] for _ in range(3)]
         self.current_player = 'X'
         self.moves_count = 0
+        # Moves made through make_move, so they can be undone with pop_move
+        self._history = []
 
     def make_move(self, row, col):
         """
@@ -35,9 +37,43 @@ class TicTacToe:
             self.board[row][col] = self.current_player
             self.moves_count += 1
             self.current_player = 'O' if self.current_player == 'X' else 'X'
+            self._history.append((row, col))
             return True
         return False
 
+    def push_move(self, row, col):
+        """
+        Makes a move that can later be undone with pop_move.
+
+        This is the same as make_move; it exists so that searches read as
+        push_move/pop_move pairs on a single board instead of copying games.
+
+        Args:
+            row (int): Row index (0-2)
+            col (int): Column index (0-2)
+
+        Returns:
+            bool: True if the move was successful, False otherwise
+        """
+        return self.make_move(row, col)
+
+    def pop_move(self):
+        """
+        Undoes the most recent move, restoring the board, current_player and
+        moves_count to what they were before it.
+
+        Returns:
+            tuple: (row, col) of the move that was undone
+
+        Raises:
+            IndexError: If there are no moves to undo
+        """
+        row, col = self._history.pop()
+        self.current_player = self.board[row][col]
+        self.board[row][col] = ' '
+        self.moves_count -= 1
+        return (row, col)
+
     def check_winner(self):
         """
         Checks if there is a winner or if the game is a tie.
@@ -108,13 +144,15 @@ class TicTacToe:
         return self.moves_count == 9
 
 
-def play_game(ai_opponent=False):
+def play_game(ai_opponent=False, ai_strength='basic'):
     """
     Main game loop function that handles the gameplay of Tic-Tac-Toe.
 
     Args:
         ai_opponent (bool): If True, player 'O' will be controlled by a simple AI.
                            Default is False (human vs human).
+        ai_strength (str): Which AI controls player 'O' (see AI_STRENGTHS).
+                           Default is 'basic'.
 
     This function creates a new TicTacToe game instance and manages the game flow by:
     - Displaying the current board state
@@ -131,6 +169,8 @@ def play_game(ai_opponent=False):
     """
     game = TicTacToe()
     winner = None
+    if ai_opponent:
+        ai_player = get_ai_player(ai_strength)
     
     print("\nWelcome to Tic-Tac-Toe!")
     print("Enter your moves as row and column numbers (1-3).")
@@ -167,7 +207,7 @@ def play_game(ai_opponent=False):
         # AI player's turn
         else:
             print("\nComputer (O) is making a move...")
-            ai_move = make_ai_move(game)
+            ai_move = ai_player(game)
             row, col = ai_move
             game.make_move(row, col)
             winner = game.check_winner()
@@ -245,6 +285,65 @@ def make_ai_move(game):
     return empty_cells[0]
 
 
+# AI strengths selectable in play_game. 'book' plays the same moves as
+# 'perfect' but reads them from the precomputed opening book, and 'mcts'
+# searches with Monte Carlo Tree Search for a fixed time per move.
+AI_STRENGTHS = ('basic', 'perfect', 'book', 'mcts')
+
+# Seconds per move for the 'mcts' strength
+MCTS_TIME_LIMIT = 0.2
+
+
+def get_ai_player(strength='basic'):
+    """
+    Returns the move function for the given AI strength.
+
+    Stronger AIs live in their own modules and are only imported when selected.
+    Call this once per game: some AIs (like 'mcts') keep state between turns.
+
+    Args:
+        strength (str): One of AI_STRENGTHS
+
+    Returns:
+        callable: A function taking a TicTacToe game and returning (row, col)
+
+    Raises:
+        ValueError: If the strength is not recognized
+    """
+    if strength == 'basic':
+        return make_ai_move
+    if strength == 'perfect':
+        from solver import make_perfect_move
+        return make_perfect_move
+    if strength == 'book':
+        from opening_book import make_book_move
+        return make_book_move
+    if strength == 'mcts':
+        from mcts import MCTSPlayer
+        return MCTSPlayer(time_limit=MCTS_TIME_LIMIT)
+    raise ValueError(f"Unknown AI strength: {strength}")
+
+
+def select_ai_strength():
+    """
+    Asks the user which AI strength to play against.
+
+    Returns:
+        str: One of AI_STRENGTHS
+    """
+    while True:
+        print("\nAI Strength:")
+        for number, strength in enumerate(AI_STRENGTHS, start=1):
+            print(f"{number}. {strength.capitalize()}")
+        try:
+            choice = int(input(f"\nSelect the AI strength (1-{len(AI_STRENGTHS)}): "))
+            if 1 <= choice <= len(AI_STRENGTHS):
+                return AI_STRENGTHS[choice - 1]
+            print(f"Invalid choice. Please enter a number between 1 and {len(AI_STRENGTHS)}.")
+        except ValueError:
+            print("Invalid input. Please enter a number.")
+
+
 def main():
     """
     Main function to start the game and handle replay.
@@ -264,7 +363,7 @@ def main():
             if choice == 1:
                 play_game(ai_opponent=False)
             elif choice == 2:
-                play_game(ai_opponent=True)
+                play_game(ai_opponent=True, ai_strength=select_ai_strength())
             elif choice == 3:
                 print("\nThanks for playing! Goodbye!")
                 break
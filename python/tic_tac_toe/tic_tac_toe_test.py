@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 import unittest
-from tic_tac_toe import TicTacToe, make_ai_move
+from tic_tac_toe import AI_STRENGTHS, TicTacToe, get_ai_player, make_ai_move
 
 class TestTicTacToe(unittest.TestCase):
     """
@@ -191,5 +191,51 @@ class TestTicTacToe(unittest.TestCase):
         self.assertEqual((ai_row, ai_col), (0, 2))
 
 
+    def test_push_and_pop_move(self):
+        """
+        Test that pop_move undoes moves in reverse order.
+        """
+        self.assertTrue(self.game.push_move(1, 1))
+        self.assertTrue(self.game.push_move(0, 0))
+        self.assertFalse(self.game.push_move(0, 0))
+        self.assertEqual(self.game.moves_count, 2)
+
+        self.assertEqual(self.game.pop_move(), (0, 0))
+        self.assertEqual(self.game.board[0][0], ' ')
+        self.assertEqual(self.game.board[1][1], 'X')
+        self.assertEqual(self.game.current_player, 'O')
+        self.assertEqual(self.game.moves_count, 1)
+
+        self.assertEqual(self.game.pop_move(), (1, 1))
+        self.assertEqual(self.game.get_empty_cells(), TicTacToe().get_empty_cells())
+        self.assertEqual(self.game.current_player, 'X')
+        self.assertEqual(self.game.moves_count, 0)
+        with self.assertRaises(IndexError):
+            self.game.pop_move()
+
+    def test_pop_move_restores_winner(self):
+        """
+        Test that undoing a winning move clears the winner.
+        """
+        for row, col in [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]:
+            self.game.push_move(row, col)
+        self.assertEqual(self.game.check_winner(), 'X')
+        self.game.pop_move()
+        self.assertIsNone(self.game.check_winner())
+        self.assertEqual(self.game.current_player, 'X')
+
+    def test_get_ai_player(self):
+        """
+        Test that every AI strength returns a move function.
+        """
+        self.assertIs(get_ai_player('basic'), make_ai_move)
+        for strength in AI_STRENGTHS:
+            self.game = TicTacToe()
+            row, col = get_ai_player(strength)(self.game)
+            self.assertIn((row, col), self.game.get_empty_cells())
+        with self.assertRaises(ValueError):
+            get_ai_player('unknown')
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# Multiprocess round-robin tournament between Tic-Tac-Toe AI policies
+#
+# Every ordered pair of policies plays a number of games, split into shards
+# of a fixed size. Each shard has its own seed derived from the tournament
+# seed, so results do not depend on the number of workers or on which
+# worker ran which shard. Shards run on a ProcessPoolExecutor and their
+# statistics are merged into a score table. Elo is computed from each
+# pairing's merged totals, so it depends only on the games' results, not on
+# how they were split into shards.
+#
+#     python tournament.py --games 10000 --workers 8
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from bitboard import BitboardTicTacToe
+from tic_tac_toe import make_ai_move
+
+INITIAL_ELO = 1500.0
+ELO_K = 16.0
+
+
+def random_policy(game, rng):
+    """
+    Picks a random empty cell.
+
+    Args:
+        game (TicTacToe): The current game state
+        rng (random.Random): The shard's random number generator
+
+    Returns:
+        tuple: (row, col) of the move
+    """
+    return rng.choice(game.get_empty_cells())
+
+
+def basic_policy(game, rng):
+    """
+    Plays make_ai_move's strategy.
+    """
+    return make_ai_move(game)
+
+
+def perfect_policy(game, rng):
+    """
+    Plays perfectly using the negamax solver.
+    """
+    from solver import make_perfect_move
+    return make_perfect_move(game)
+
+
+def book_policy(game, rng):
+    """
+    Plays perfectly using the precomputed opening book.
+    """
+    from opening_book import make_book_move
+    return make_book_move(game)
+
+
+# Policies must be module-level functions so they can be sent to worker processes
+POLICIES = {
+    'random': random_policy,
+    'basic': basic_policy,
+    'perfect': perfect_policy,
+    'book': book_policy,
+}
+
+
+def play_game(x_policy, o_policy, rng):
+    """
+    Plays one game between two policies.
+
+    Args:
+        x_policy (callable): Policy for 'X'
+        o_policy (callable): Policy for 'O'
+        rng (random.Random): Random number generator passed to both policies
+
+    Returns:
+        str: The result of the game ('X', 'O', or 'Tie')
+    """
+    game = BitboardTicTacToe()
+    winner = None
+    while not winner:
+        policy = x_policy if game.current_player == 'X' else o_policy
+        row, col = policy(game, rng)
+        if not game.make_move(row, col):
+            raise ValueError(f"Policy {policy.__name__} made an illegal move: {(row, col)}")
+        winner = game.check_winner()
+    return winner
+
+
+def play_shard(shard):
+    """
+    Plays every game of one shard. Runs in a worker process.
+
+    Args:
+        shard (tuple): (x_name, x_policy, o_name, o_policy, seed, games)
+
+    Returns:
+        dict: The shard's pairing, outcome counts, worker pid and elapsed time
+    """
+    x_name, x_policy, o_name, o_policy, seed, games = shard
+    rng = random.Random(seed)
+    counts = {'X': 0, 'O': 0, 'Tie': 0}
+    start = time.perf_counter()
+    for _ in range(games):
+        counts[play_game(x_policy, o_policy, rng)] += 1
+    return {
+        'x': x_name,
+        'o': o_name,
+        'x_wins': counts['X'],
+        'o_wins': counts['O'],
+        'draws': counts['Tie'],
+        'pid': os.getpid(),
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def make_shards(policies, games_per_pairing, shard_size, seed):
+    """
+    Splits a round-robin tournament into independently seeded shards.
+
+    Args:
+        policies (dict): Maps policy names to policy functions
+        games_per_pairing (int): Games for each ordered (X, O) pair of policies
+        shard_size (int): Maximum number of games per shard
+        seed (int): Tournament seed
+
+    Returns:
+        list: Shards in a fixed order, as accepted by play_shard
+    """
+    shards = []
+    for x_name, x_policy in policies.items():
+        for o_name, o_policy in policies.items():
+            if x_name == o_name:
+                continue
+            for first_game in range(0, games_per_pairing, shard_size):
+                games = min(shard_size, games_per_pairing - first_game)
+                # String seeds are hashed deterministically, unlike hash()
+                shard_seed = random.Random(f"{seed}:{x_name}:{o_name}:{first_game}").getrandbits(64)
+                shards.append((x_name, x_policy, o_name, o_policy, shard_seed, games))
+    return shards
+
+
+class TournamentResult:
+    """
+    Merged statistics of a tournament.
+
+    Attributes:
+        standings (dict): Maps each policy name to a dict with games, wins,
+                          draws, losses, score (1 per win, 0.5 per draw) and elo.
+        pairings (dict): Maps each (x, o) pair of names to its merged
+                         [x_wins, o_wins, draws].
+        worker_stats (dict): Maps each worker pid to (games, busy seconds).
+        seconds (float): Wall-clock time for the whole tournament.
+    """
+    def __init__(self, names):
+        self.standings = {
+            name: {'games': 0, 'wins': 0, 'draws': 0, 'losses': 0, 'score': 0.0, 'elo': INITIAL_ELO}
+            for name in names
+        }
+        self.pairings = {}
+        self.worker_stats = {}
+        self.seconds = 0.0
+
+    def add_shard(self, stats):
+        """
+        Merges one shard's statistics into the table and recomputes Elo
+        from the merged pairing totals (see update_elo).
+
+        Args:
+            stats (dict): The result of play_shard
+        """
+        x_row = self.standings[stats['x']]
+        o_row = self.standings[stats['o']]
+        games = stats['x_wins'] + stats['o_wins'] + stats['draws']
+        for row, wins, losses in ((x_row, stats['x_wins'], stats['o_wins']),
+                                  (o_row, stats['o_wins'], stats['x_wins'])):
+            row['games'] += games
+            row['wins'] += wins
+            row['losses'] += losses
+            row['draws'] += stats['draws']
+            row['score'] += wins + 0.5 * stats['draws']
+
+        totals = self.pairings.setdefault((stats['x'], stats['o']), [0, 0, 0])
+        totals[0] += stats['x_wins']
+        totals[1] += stats['o_wins']
+        totals[2] += stats['draws']
+        self.update_elo()
+
+        worker_games, worker_seconds = self.worker_stats.get(stats['pid'], (0, 0.0))
+        self.worker_stats[stats['pid']] = (worker_games + games, worker_seconds + stats['seconds'])
+
+    def update_elo(self):
+        """
+        Recomputes every rating from INITIAL_ELO, with one update per pairing
+        from its average score over all of its games, taking the pairings in
+        policy order. The ratings therefore depend only on the merged
+        totals, not on the shard size or the order shards were merged in.
+        """
+        for row in self.standings.values():
+            row['elo'] = INITIAL_ELO
+        for x_name in self.standings:
+            for o_name in self.standings:
+                x_wins, o_wins, draws = self.pairings.get((x_name, o_name), (0, 0, 0))
+                games = x_wins + o_wins + draws
+                if not games:
+                    continue
+                x_row, o_row = self.standings[x_name], self.standings[o_name]
+                x_score = (x_wins + 0.5 * draws) / games
+                x_expected = 1.0 / (1.0 + 10 ** ((o_row['elo'] - x_row['elo']) / 400.0))
+                change = ELO_K * (x_score - x_expected)
+                x_row['elo'] += change
+                o_row['elo'] -= change
+
+    @property
+    def games(self):
+        """
+        Total number of games played.
+        """
+        return sum(games for games, _ in self.worker_stats.values())
+
+    def ranking(self):
+        """
+        Returns the policy names ordered from best to worst score.
+
+        Returns:
+            list: Policy names
+        """
+        return sorted(self.standings, key=lambda name: (-self.standings[name]['score'], name))
+
+    def print_report(self):
+        """
+        Prints the standings table and per-worker throughput.
+        """
+        print(f"\n{'policy':<10} {'games':>8} {'wins':>8} {'draws':>8} {'losses':>8} {'score':>10} {'elo':>7}")
+        for name in self.ranking():
+            row = self.standings[name]
+            print(f"{name:<10} {row['games']:>8} {row['wins']:>8} {row['draws']:>8} "
+                  f"{row['losses']:>8} {row['score']:>10.1f} {row['elo']:>7.0f}")
+
+        print(f"\n{'worker':<10} {'games':>8} {'games/s':>10}")
+        for pid, (games, seconds) in sorted(self.worker_stats.items()):
+            rate = games / seconds if seconds else float('inf')
+            print(f"{pid:<10} {games:>8} {rate:>10,.0f}")
+        rate = self.games / self.seconds if self.seconds else float('inf')
+        print(f"\n{self.games} games in {self.seconds:.2f}s ({rate:,.0f} games/s overall)")
+
+
+def run_tournament(policies=None, games_per_pairing=1000, workers=None, shard_size=250, seed=0):
+    """
+    Runs a round-robin tournament across a pool of worker processes.
+
+    Args:
+        policies (dict): Maps policy names to module-level policy functions.
+                         Defaults to POLICIES.
+        games_per_pairing (int): Games for each ordered (X, O) pair of policies
+        workers (int): Number of worker processes; defaults to the CPU count
+        shard_size (int): Maximum number of games per shard
+        seed (int): Tournament seed; the same seed gives the same results
+                    regardless of the number of workers
+
+    Returns:
+        TournamentResult: The merged standings and worker statistics
+
+    Raises:
+        ValueError: If games_per_pairing or shard_size is less than 1
+    """
+    if games_per_pairing < 1:
+        raise ValueError(f"games_per_pairing must be at least 1, not {games_per_pairing}")
+    if shard_size < 1:
+        raise ValueError(f"shard_size must be at least 1, not {shard_size}")
+    if policies is None:
+        policies = POLICIES
+    shards = make_shards(policies, games_per_pairing, shard_size, seed)
+    result = TournamentResult(policies)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for stats in executor.map(play_shard, shards):
+            result.add_shard(stats)
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {number}")
+    return number
+
+
+def main():
+    """
+    Runs a tournament between the built-in policies from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Round-robin tournament between Tic-Tac-Toe AIs")
+    parser.add_argument('--games', type=_positive_int, default=1000, help="games per ordered pair of policies")
+    parser.add_argument('--workers', type=_positive_int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--shard-size', type=_positive_int, default=250, help="games per shard")
+    parser.add_argument('--seed', type=int, default=0, help="tournament seed")
+    parser.add_argument('--policies', nargs='+', choices=sorted(POLICIES), default=list(POLICIES),
+                        help="policies to include")
+    args = parser.parse_args()
+
+    policies = {name: POLICIES[name] for name in args.policies}
+    result = run_tournament(policies, args.games, args.workers, args.shard_size, args.seed)
+    result.print_report()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+import random
+import unittest
+from tournament import (INITIAL_ELO, POLICIES, TournamentResult, make_shards, play_game,
+                        play_shard, run_tournament)
+
+class TestTournament(unittest.TestCase):
+    """
+    Test cases for the tournament runner.
+    """
+
+    def test_make_shards(self):
+        """
+        Test that every ordered pairing is split into seeded shards.
+        """
+        policies = {'random': POLICIES['random'], 'basic': POLICIES['basic']}
+        shards = make_shards(policies, 25, 10, seed=7)
+        self.assertEqual(len(shards), 6)
+        self.assertEqual(sum(shard[5] for shard in shards), 50)
+        self.assertEqual(len({shard[4] for shard in shards}), 6)
+        self.assertEqual(shards, make_shards(policies, 25, 10, seed=7))
+        self.assertNotEqual(shards, make_shards(policies, 25, 10, seed=8))
+
+    def test_play_game(self):
+        """
+        Test that a game between perfect players is a tie.
+        """
+        rng = random.Random(0)
+        self.assertEqual(play_game(POLICIES['perfect'], POLICIES['book'], rng), 'Tie')
+
+    def test_play_shard_is_reproducible(self):
+        """
+        Test that the same shard always gives the same counts.
+        """
+        shard = ('random', POLICIES['random'], 'basic', POLICIES['basic'], 3, 50)
+        first = play_shard(shard)
+        second = play_shard(shard)
+        for key in ('x_wins', 'o_wins', 'draws'):
+            self.assertEqual(first[key], second[key])
+        self.assertEqual(first['x_wins'] + first['o_wins'] + first['draws'], 50)
+
+    def test_add_shard(self):
+        """
+        Test that merging a shard updates scores and Elo symmetrically.
+        """
+        result = TournamentResult(['a', 'b'])
+        result.add_shard({'x': 'a', 'o': 'b', 'x_wins': 3, 'o_wins': 1, 'draws': 2,
+                          'pid': 1, 'seconds': 1.0})
+        self.assertEqual(result.standings['a']['score'], 4.0)
+        self.assertEqual(result.standings['b']['score'], 2.0)
+        self.assertGreater(result.standings['a']['elo'], INITIAL_ELO)
+        self.assertAlmostEqual(result.standings['a']['elo'] + result.standings['b']['elo'],
+                               2 * INITIAL_ELO)
+        self.assertEqual(result.games, 6)
+        self.assertEqual(result.ranking(), ['a', 'b'])
+
+    def test_elo_does_not_depend_on_shard_size(self):
+        """
+        Test that the same totals give the same Elo however they are sharded.
+        """
+        def merged(shards):
+            result = TournamentResult(['a', 'b', 'c'])
+            for x, o, x_wins, o_wins, draws in shards:
+                result.add_shard({'x': x, 'o': o, 'x_wins': x_wins, 'o_wins': o_wins,
+                                  'draws': draws, 'pid': 1, 'seconds': 1.0})
+            return {name: row['elo'] for name, row in result.standings.items()}
+
+        whole = merged([('a', 'b', 8, 1, 1), ('b', 'c', 2, 2, 6), ('c', 'a', 0, 9, 1)])
+        split = merged([('c', 'a', 0, 4, 1), ('a', 'b', 5, 0, 0), ('b', 'c', 2, 2, 6),
+                        ('a', 'b', 3, 1, 1), ('c', 'a', 0, 5, 0)])
+        self.assertEqual(whole, split)
+        self.assertGreater(whole['a'], whole['b'])
+
+    def test_invalid_sizes(self):
+        """
+        Test that empty pairings and empty shards are rejected.
+        """
+        with self.assertRaises(ValueError):
+            run_tournament(games_per_pairing=0)
+        with self.assertRaises(ValueError):
+            run_tournament(shard_size=0)
+
+    def test_results_do_not_depend_on_workers(self):
+        """
+        Test that the same seed gives the same standings with 1 or 2 workers.
+        """
+        policies = {name: POLICIES[name] for name in ('random', 'basic', 'book')}
+        single = run_tournament(policies, games_per_pairing=40, workers=1, shard_size=10, seed=5)
+        double = run_tournament(policies, games_per_pairing=40, workers=2, shard_size=10, seed=5)
+        self.assertEqual(single.standings, double.standings)
+        self.assertEqual(single.games, 240)
+        self.assertEqual(single.standings['book']['losses'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()